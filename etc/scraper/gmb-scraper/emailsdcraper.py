@@ -5,7 +5,9 @@
 #
 #  • Directly processes all records with websites in the collection
 #  • Multi-threaded with safe resume and CTRL-C handling
+#  • Pooled, recycled Chrome drivers shared across worker threads
 #  • Enhanced email extraction with multiple methods and heuristic scoring
+#  • Static-first tiered harvesting with an asyncio/aiohttp sweep engine
 #  • Social media profile extraction
 #  • Cookie/consent popup dismissal
 #  • Advanced browser fingerprinting evasion
@@ -14,36 +16,46 @@
 #  • Expanded contact page detection
 # ────────────────────────────────────────────────────────────────
 
+import abc
 import argparse
+import asyncio
+import contextlib
+import html
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import random
 import re
+import shutil
 import signal
+import socket
+import sqlite3
+import subprocess
 import sys
+import tempfile
+import threading
 import time
 import traceback
 import urllib.parse
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
-from datetime import datetime
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait, Future, FIRST_COMPLETED
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List, Optional, Set, Dict, Any, Tuple, Union
 
 import requests
-from bs4 import BeautifulSoup
-from pymongo import MongoClient, ASCENDING
-from pymongo.errors import PyMongoError, ServerSelectionTimeoutError, ConnectionFailure
+from bs4 import BeautifulSoup, NavigableString, CData
+from bson import ObjectId
+from pymongo import MongoClient, ASCENDING, UpdateMany, UpdateOne
+from pymongo.errors import PyMongoError, ServerSelectionTimeoutError, ConnectionFailure, BulkWriteError, WTimeoutError
 from selenium import webdriver
 from selenium.common.exceptions import (
     TimeoutException,
     WebDriverException,
     InvalidSessionIdException,
-    ElementNotInteractableException,
-    NoSuchElementException,
-    StaleElementReferenceException,
-    ElementClickInterceptedException
+    NoSuchElementException
 )
 from selenium.webdriver import ActionChains
 from selenium.webdriver.chrome.options import Options
@@ -52,15 +64,37 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+try:
+    import aiohttp # Optional: async static fetch engine
+except ImportError:
+    aiohttp = None
+
+try:
+    import psutil # Optional: memory/CPU pressure for the adaptive concurrency controller
+except ImportError:
+    psutil = None
+
+try:
+    import lxml # noqa: F401 - Optional: much faster parser for BeautifulSoup
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    import zstandard as zstd # Optional: page archive frames (zlib is used without it)
+except ImportError:
+    zstd = None
+
 # ───────────────── Logging ──────────────────────
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
 
-def setup_logging(debug: bool = False):
-    """Set up logging with both console and file handlers."""
+def setup_logging(debug: bool = False, log_file: str = "email_scraper.log", tag: str = ""):
+    """Set up logging with both console and file handlers.
+    Worker processes pass their own log_file and a tag prefixed to console lines."""
     root = logging.getLogger()
     root.setLevel(logging.DEBUG if debug else logging.INFO)
-    fmt = logging.Formatter("[%(asctime)s] %(levelname)-7s – %(message)s", "%H:%M:%S")
+    fmt = logging.Formatter(f"[%(asctime)s] {tag + ' ' if tag else ''}%(levelname)-7s – %(message)s", "%H:%M:%S")
 
     # Console handler
     sh = logging.StreamHandler(sys.stdout)
@@ -70,7 +104,7 @@ def setup_logging(debug: bool = False):
 
     # File handler with rotation
     fh = logging.handlers.TimedRotatingFileHandler(
-        LOG_DIR / "email_scraper.log", when="midnight", backupCount=7, encoding="utf-8"
+        LOG_DIR / log_file, when="midnight", backupCount=7, encoding="utf-8"
     )
     fh.setFormatter(fmt)
     fh.setLevel(logging.DEBUG)
@@ -88,10 +122,57 @@ def setup_logging(debug: bool = False):
 log = logging.getLogger(__name__)
 
 # ─────────────────── Tunables & Delays ──────────────
-WEBSITE_WAIT_MIN, WEBSITE_WAIT_MAX = 1.0, 2.0
 CONTACT_WAIT_MIN, CONTACT_WAIT_MAX = 0.5, 1.0
 MONGO_RETRY_ATTEMPTS = 3
 MONGO_RETRY_DELAY = 1.0
+MONGO_BATCH_SIZE = 100 # Buffered result updates per bulk_write
+MONGO_FLUSH_INTERVAL = 2.0 # Seconds between bulk_write flushes of a partial batch
+EMAIL_CANDIDATES_MAX = 100 # Raw email sightings persisted per record for --rescore; rejected ones are dropped first
+RESCORE_LOG_INTERVAL = 10000 # Records between --rescore progress lines
+CLAIM_BATCH_SIZE = 50 # Pending records leased per claim
+CLAIM_LEASE_SECONDS = 900 # A claimed record is reclaimable by other workers once its lease runs out
+PROGRESS_COLLECTION = "scraper_progress" # Per-worker progress documents (coordinator/worker mode)
+PROGRESS_INTERVAL = 10.0 # Seconds between progress reports
+SHARD_BUCKETS = 256 # Values of the stored shard_key field; --shard i/n takes the buckets congruent to i mod n
+DRIVER_MAX_USES = 50 # Recycle a pooled Chrome after this many sites
+TABS_PER_BROWSER = 1 # Concurrent sites (tabs) per Chrome instance; 1 = one Chrome per worker thread
+TAB_POLL_INTERVAL = 0.1 # Seconds between readyState polls of a loading tab
+BROWSER_BACKEND = "selenium" # Default --browser-backend: selenium (WebDriver) or cdp (DevTools over websocket)
+CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome") # Looked up on PATH by the cdp backend
+CDP_STARTUP_TIMEOUT = 30 # Seconds to wait for Chrome to start / a CDP page to open
+STATIC_CONFIDENCE_THRESHOLD = 70 # Best own-domain score_email() from static HTML that skips Selenium
+ALWAYS_RENDER = False # Force Selenium on every page (pre-tiering behaviour)
+PAGE_LOAD_STRATEGY = "normal" # Selenium pageLoadStrategy: normal (load event), eager (DOMContentLoaded) or none
+PAGE_LOAD_TIMEOUT = 30 # Seconds before a Selenium page load gives up (extraction still runs on what loaded)
+SITE_BUDGET_SECONDS = 120 # Wall-clock budget per business in harvest_emails; 0 = unlimited
+JS_MIN_TEXT_CHARS = 200 # Less visible text than this in static HTML means the page is JS-rendered
+STATIC_FETCH_TIMEOUT = 10 # Seconds per static (requests/aiohttp) fetch
+STATIC_MAX_CONNECTIONS = 100 # Total concurrent connections in a static sweep
+STATIC_PER_HOST_LIMIT = 4 # Concurrent static requests per host
+STATIC_SWEEP_BATCH = 200 # Records per static sweep batch
+CONTACT_PROBE_CONCURRENCY = 10 # Concurrent HEAD probes per site when pre-checking contact paths
+CONTACT_FALLBACK_PATHS = 4 # Paths to try blind when static probing is blocked
+CONTACT_LINK_TOP_K = 2 # Contact pages discovered from homepage links that get visited
+ADAPT_INTERVAL = 15.0 # Seconds between adaptive concurrency adjustments
+ADAPT_MIN_FREE_MEMORY = 0.15 # Back off below this fraction of free memory
+ADAPT_MAX_LOAD = 1.5 # Back off above this 1-minute load average per CPU
+ADAPT_MAX_ERROR_RATE = 0.3 # Back off above this share of failed sites in a window
+ADAPT_LATENCY_FACTOR = 2.0 # Back off when median page loads get this much slower than the best seen
+CONSENT_APPEAR_TIMEOUT = 2.0 # Max seconds to wait for a consent banner while the page is still loading
+CONSENT_SETTLE_TIMEOUT = 1.0 # Seconds a loaded page is still watched for a banner injected after the load event
+CONSENT_CLOSE_TIMEOUT = 2.0 # Max seconds to wait for a clicked consent button to disappear
+CONSENT_MEMO_FILE = "consent_memo.json" # Per-domain consent strategy memo, kept in the cache dir
+CONSENT_MEMO_TTL_DAYS = 14 # Re-learn a domain's consent banner after this long
+CONSENT_MEMO_NONE_TTL_HOURS = 24 # "No banner" is only trusted this long (it may just have been a cookie from an earlier page)
+CACHE_DIR = "http_cache" # On-disk response cache shared across runs
+CHECKPOINT_DIR = "checkpoints" # Per-worker journals of in-flight record progress
+CACHE_TTL_HOURS = 24.0 # Cached responses younger than this are reused without a request
+CACHE_MAX_MB = 500 # Least recently used responses are evicted past this size
+ARCHIVE_DIR = "page_archive" # Default --archive/--replay directory
+ARCHIVE_SEGMENT_MB = 256 # Start a new archive segment file past this size
+ARCHIVE_ZSTD_LEVEL = 6 # zstd level per archived page
+ARCHIVE_ZLIB_LEVEL = 6 # zlib level per archived page when zstandard is not installed
+REPLAY_LOG_INTERVAL = 1000 # Records between --replay progress lines
 
 # Default MongoDB connection URI
 MONGO_URI = "mongodb://localhost:27017"
@@ -119,6 +200,34 @@ UA_POOL = [
 
 # Enhanced email regex pattern with more TLDs and formats
 EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.(?:[a-zA-Z]{2,}|co\.uk|org\.uk|ac\.uk|gov\.uk|nhs\.uk)")
+# emails_from_text helpers: "[at]" / "(dot)" style obfuscation in one pass (group 1/2 set = an "at"),
+# a cheap test for text that can't contain an address at all, and the runs either side of an '@'
+DEOBFUSCATE_RE = re.compile(r'\s*(?:\[\s*(?:(at|@)|dot|\.)\s*\]|\(\s*(?:(at|@)|dot|\.)\s*\))\s*', re.IGNORECASE)
+AT_WORD_RE = re.compile(r'\bat\b', re.IGNORECASE)
+EMAIL_LOCAL_RUN_RE = re.compile(r'[a-zA-Z0-9._%+\-]*')
+EMAIL_DOMAIN_RUN_RE = re.compile(r'[a-zA-Z0-9.\-]*')
+
+# clean_emails() blocklists, built once: any of these substrings marks a fake/example address
+FAKE_EMAIL_PATTERNS = (
+    "example.com", "sentry.wixpress.com", "your@email",
+    "email@example", "info@your", "name@domain",
+    "user@", "username@", "email@domain", "@localhost",
+    "example.org", "example.net", "domain.com",
+    "contact@example.com", "privacy@example.com",
+    "email@here.com",
+)
+FAKE_EMAIL_RE = re.compile("|".join(re.escape(p) for p in FAKE_EMAIL_PATTERNS)) # One scan instead of 16 'in' checks
+DISPOSABLE_EMAIL_DOMAINS = frozenset({"mailinator.com", "temp-mail.org", "10minutemail.com"})
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp") # Tuple so str.endswith() takes them all at once
+
+# score_email() prefix table: local part -> bonus (anything not listed falls through to the penalty checks)
+EMAIL_PREFIX_SCORES: Dict[str, int] = {
+    **dict.fromkeys(("info", "contact", "hello", "enquiries", "support", "sales", "bookings", "reservations"), 25), # Common contact prefixes
+    **dict.fromkeys(("admin", "office", "mail", "help", "general"), 15), # Other common prefixes
+    **dict.fromkeys(("press", "media", "jobs", "careers", "hr"), 10), # Specific department prefixes
+}
+NUMERIC_PREFIX_RE = re.compile(r'^\d+$')
+HASH_PREFIX_RE = re.compile(r'[a-f0-9]{8,}')
 
 # Common contact page paths to check - EXPANDED
 CONTACT_PATHS = [
@@ -144,6 +253,49 @@ CONTACT_PATHS = [
     "/contatto",  # Italian
 ]
 
+# Keywords that mark a homepage link as a contact page, with their weight (href or link text)
+CONTACT_LINK_KEYWORDS = [
+    ("contact", 100),
+    ("enquir", 90), # enquiry, enquiries, enquire
+    ("inquir", 90),
+    ("get-in-touch", 90), ("get in touch", 90), ("getintouch", 90),
+    ("kontakt", 80), ("contacto", 80), ("contatto", 80),
+    ("reach-us", 60), ("reach us", 60), ("talk-to-us", 60), ("talk to us", 60),
+    ("find-us", 40), ("find us", 40), ("book", 20),
+    ("about", 50),
+]
+# Linked documents that are never contact pages
+NON_PAGE_EXTENSIONS = (".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp", ".zip", ".doc", ".docx", ".mp4", ".mp3")
+# Hosts where unrelated businesses share one domain (site builders, social/listing pages).
+# Records on these are grouped by full URL instead of by domain.
+SHARED_SITE_HOSTS = (
+    "sites.google.com", "google.com", "business.site", "wixsite.com", "wordpress.com",
+    "blogspot.com", "weebly.com", "square.site", "godaddysites.com", "webador.co.uk",
+    "facebook.com", "instagram.com", "linktr.ee", "tripadvisor.co.uk", "tripadvisor.com",
+    "just-eat.co.uk", "deliveroo.co.uk", "ubereats.com", "opentable.co.uk", "resdiary.com",
+)
+
+# Subresources Selenium sessions don't need: extraction only reads DOM text and attributes.
+# Blocked with CDP Network.setBlockedURLs (wildcard patterns), so they can be lifted per domain.
+BLOCK_PROFILE = "strict" # Default --block-profile
+BLOCK_RESOURCE_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp", # Images
+    "woff", "woff2", "ttf", "otf", "eot", # Fonts
+    "mp4", "webm", "mp3", "ogg", "wav", "m4a", "mov", "m3u8", # Media
+)
+BLOCK_TRACKER_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+    "googleadservices.com", "adservice.google.", "connect.facebook.net", "hotjar.com", "clarity.ms",
+    "scorecardresearch.com", "quantserve.com", "criteo.", "taboola.com", "outbrain.com",
+    "amazon-adsystem.com", "adnxs.com", "segment.io", "mixpanel.com", "hs-analytics.net", "tiktok.com/i18n/pixel",
+)
+_BLOCK_LIGHT = [pattern for ext in BLOCK_RESOURCE_EXTENSIONS for pattern in (f"*.{ext}", f"*.{ext}?*")]
+BLOCK_PROFILES: Dict[str, List[str]] = {
+    "none": [], # Load everything (previous behaviour)
+    "light": _BLOCK_LIGHT, # Images, fonts and media
+    "strict": _BLOCK_LIGHT + [f"*{host}*" for host in BLOCK_TRACKER_HOSTS], # ...plus analytics/ad trackers
+}
+
 # Social media patterns
 SOCIAL_MEDIA_PATTERNS = {
     'facebook': [
@@ -177,6 +329,29 @@ SOCIAL_MEDIA_PATTERNS = {
     ],
 }
 
+# Path segments that are never a profile handle (share/login/utility pages)
+SOCIAL_HANDLE_BLOCKLIST = frozenset({
+    "sharer", "share", "intent", "tweet", "post", "view",
+    "plugins", "login", "signup", "home", "search", "explore",
+    "pages", "groups", "events", "ads", "about", "privacy", "terms",
+})
+# Every SOCIAL_MEDIA_PATTERNS entry as a named alternative of one regex: group name -> ((platform rank, pattern rank), platform, pattern)
+SOCIAL_GROUPS: Dict[str, Tuple[Tuple[int, int], str, str]] = {
+    f"{platform}_{i}": ((rank, i), platform, pattern)
+    for rank, (platform, patterns) in enumerate(SOCIAL_MEDIA_PATTERNS.items())
+    for i, pattern in enumerate(patterns)
+}
+# Longer literal prefixes first, so facebook.com/pages/<name> is tried before facebook.com/<pages> at the same spot
+SOCIAL_LINK_RE = re.compile("|".join(
+    pattern.replace("(", f"(?P<{name}>", 1)
+    for name, (_, _, pattern) in sorted(SOCIAL_GROUPS.items(), key=lambda item: -len(item[1][2].split("(", 1)[0]))
+), re.IGNORECASE)
+# Hosts the patterns need; links containing none of them skip the regex entirely
+SOCIAL_HOSTS = tuple(sorted({pattern.split("/", 1)[0].replace("\\.", ".") for _, _, pattern in SOCIAL_GROUPS.values()}))
+
+# Class/id keywords marking a container of social links
+SOCIAL_CONTEXT_KEYWORDS = ['follow', 'social', 'connect', 'network', 'profile']
+
 # Cookie consent button patterns
 COOKIE_BUTTON_PATTERNS = [
     # Text patterns (lowercase)
@@ -194,6 +369,93 @@ COOKIE_BUTTON_PATTERNS = [
     "cookie_action_close_header", "wt-cli-accept-all-btn", "cmplz-accept",
 ]
 
+# Cheap probe: document readiness plus whether anything consent-banner-like is visible
+CONSENT_BANNER_JS = r"""
+const sel = "[id*='cookie' i], [class*='cookie' i], [id*='consent' i], [class*='consent' i], " +
+            "[id*='gdpr' i], [class*='gdpr' i], [id*='cmp' i], [id^='onetrust'], #CybotCookiebotDialog, " +
+            "iframe[src*='consent' i], iframe[src*='cookie' i], iframe[src*='cmp' i], iframe[title*='consent' i], iframe[title*='cookie' i]";
+let banner = false;
+try {
+    for (const el of document.querySelectorAll(sel)) {
+        if (el.tagName !== 'BODY' && el.tagName !== 'HTML' && el.getClientRects().length) { banner = true; break; }
+    }
+} catch (e) { banner = true; } // Unsure: let the full dismissal run
+return {ready: document.readyState, banner: banner};
+"""
+
+# Iframes whose id/src/title contain one of these are searched for a consent button
+CONSENT_FRAME_TERMS = ("cookie", "consent", "privacy", "gdpr", "cmp", "onetrust", "trustarc", "banner")
+
+# Consent button matcher, defined once per document on window and reused by later calls.
+# With a selector it clicks the first visible match (memo replay), otherwise it scans
+# button-like elements for COOKIE_BUTTON_PATTERNS text / ids / class names.
+CONSENT_MATCHER_JS = r"""
+if (!window.__gmbConsentMatcher) {
+    const patterns = %s;
+    const names = new Set(patterns);
+    const visible = el => {
+        const r = el.getBoundingClientRect(), st = getComputedStyle(el);
+        return r.width > 0 && r.height > 0 && st.visibility !== 'hidden' && st.display !== 'none' && !el.disabled;
+    };
+    const matches = el => {
+        const text = ((el.innerText || el.textContent || '') + ' ' + (el.value || '') + ' ' +
+                      (el.getAttribute('aria-label') || '')).toLowerCase();
+        if (patterns.some(p => text.includes(p))) return true;
+        if (el.id && names.has(el.id.toLowerCase())) return true;
+        return Array.from(el.classList).some(c => names.has(c.toLowerCase()));
+    };
+    const selectorFor = el => { // Stable enough to find the same button on the next page of the site
+        const tag = el.tagName.toLowerCase();
+        if (el.id) return tag + '#' + CSS.escape(el.id);
+        const classes = Array.from(el.classList).slice(0, 3).map(c => '.' + CSS.escape(c)).join('');
+        if (classes) return tag + classes;
+        const label = el.getAttribute('aria-label');
+        return label ? tag + '[aria-label="' + label.replace(/"/g, '\\"') + '"]' : null;
+    };
+    window.__gmbConsentMatcher = function (selector) {
+        let candidates;
+        try {
+            candidates = document.querySelectorAll(selector ||
+                "button, [role='button'], a, input[type='button'], input[type='submit']");
+        } catch (e) { return null; } // Bad memoised selector
+        for (const el of candidates) {
+            if (!visible(el) || (!selector && !matches(el))) continue;
+            el.click();
+            window.__gmbConsentClicked = el; // Lets callers without element handles wait for it to go
+            return {element: el, selector: selector || selectorFor(el)};
+        }
+        return null;
+    };
+}
+return window.__gmbConsentMatcher(arguments[0] || null);
+""" % json.dumps(COOKIE_BUTTON_PATTERNS)
+# Has the button CONSENT_MATCHER_JS clicked disappeared (removed or hidden)?
+CONSENT_GONE_JS = r"""
+const el = window.__gmbConsentClicked;
+if (!el || !el.isConnected) return true;
+const r = el.getBoundingClientRect();
+return !(r.width && r.height) || getComputedStyle(el).visibility === 'hidden';
+"""
+
+# Origins a tab's visit touched (page and subresources), whose storage is cleared when the tab closes
+TAB_ORIGINS_JS = r"""
+const origins = new Set([location.origin]);
+for (const e of performance.getEntriesByType('resource')) {
+    try { origins.add(new URL(e.name).origin); } catch (err) {}
+}
+return [...origins];
+"""
+
+# Signals in static HTML that the real content only appears after JavaScript runs
+JS_RENDER_MARKERS = [
+    (re.compile(r'<div[^>]+id=["\'](?:root|app|__next|__nuxt|svelte)["\'][^>]*>\s*</div>', re.IGNORECASE), "empty SPA root div"),
+    (re.compile(r'\bng-app\b|<app-root', re.IGNORECASE), "Angular app shell"),
+    (re.compile(r'__cf_email__|data-cfemail|/cdn-cgi/l/email-protection', re.IGNORECASE), "Cloudflare email obfuscation"),
+    (re.compile(r'data-(?:email|user|domain)\s*=', re.IGNORECASE), "data-* email obfuscation"),
+]
+SCRIPT_STYLE_RE = re.compile(r'<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+
 # ───────────────── Circuit Breaker ───────────────────
 class CircuitBreaker:
     """Circuit breaker pattern implementation for handling failing domains."""
@@ -247,13 +509,150 @@ class CircuitBreaker:
 # Initialize circuit breaker
 circuit_breaker = CircuitBreaker()
 
+# ───────────────── Politeness & Adaptive Concurrency ───────────────────
+class HostPoliteness:
+    """Per-host minimum spacing between page loads (static or Selenium) on the same host.
+
+    Replaces the unconditional random sleep between contact pages: a worker only waits
+    when its previous hit on that host was less than CONTACT_WAIT_MIN-MAX seconds ago,
+    and different hosts never wait for each other.
+    """
+
+    def __init__(self, min_interval: float = CONTACT_WAIT_MIN, max_interval: float = CONTACT_WAIT_MAX):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.next_allowed: Dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def wait(self, host: str):
+        """Block until host may be hit again, and reserve the next slot."""
+        if not host: return
+        with self.lock:
+            now = time.time()
+            start = max(now, self.next_allowed.get(host, 0.0))
+            self.next_allowed[host] = start + random.uniform(self.min_interval, self.max_interval)
+            if len(self.next_allowed) > 10000: # Forget hosts whose slot has long passed
+                self.next_allowed = {h: t for h, t in self.next_allowed.items() if t > now}
+        if start > now:
+            time.sleep(start - now)
+
+# Initialize per-host politeness
+host_politeness = HostPoliteness()
+
+
+def system_pressure() -> Tuple[float, float]:
+    """(fraction of memory available, 1-minute load average per CPU) for this box,
+    which includes every Chrome child. Falls back to (1.0, 0.0) where unavailable."""
+    if psutil is not None:
+        memory = psutil.virtual_memory()
+        mem_free = memory.available / memory.total
+    else:
+        mem_free = 1.0
+        try:
+            with open("/proc/meminfo") as f:
+                info = {line.split(":")[0]: int(line.split()[1]) for line in f if ":" in line}
+            mem_free = info["MemAvailable"] / info["MemTotal"]
+        except (OSError, KeyError, ValueError, ZeroDivisionError):
+            pass
+    try:
+        load = os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (OSError, AttributeError):
+        load = 0.0
+    return mem_free, load
+
+
+class AdaptiveConcurrency:
+    """AIMD controller for the number of sites processed at once.
+
+    Every ADAPT_INTERVAL seconds it looks at the page-load latencies and task errors
+    observed since the last check, plus memory/CPU pressure on the box. Any sign of
+    overload (latency well above the best seen, error spike, low memory, high load)
+    cuts the limit by a quarter; otherwise a window in which every slot was in use
+    raises it by one, up to maximum. A limit that isn't the bottleneck is left alone.
+    """
+
+    def __init__(self, start: int, minimum: int, maximum: int, interval: float = ADAPT_INTERVAL):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(start, self.minimum), self.maximum)
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.tasks = 0
+        self.errors = 0
+        self.saturated = False # Whether the running tasks reached the limit during this window
+        self.baseline: Optional[float] = None # Best (lowest) windowed median page-load latency, drifting up slowly
+        self.last_adjust = time.time()
+
+    def observe_page(self, seconds: float):
+        """Record one page load's latency (navigation until the body is there)."""
+        with self.lock:
+            self.latencies.append(seconds)
+
+    def observe_busy(self, running: int):
+        """Record how many tasks are running (or queued) right now."""
+        if running >= self.limit:
+            self.saturated = True
+
+    def observe_task(self, failed: bool):
+        """Record one finished site."""
+        with self.lock:
+            self.tasks += 1
+            self.errors += int(failed)
+
+    def maybe_adjust(self) -> int:
+        """Re-evaluate the limit if the interval has passed. Returns the current limit."""
+        if time.time() - self.last_adjust < self.interval:
+            return self.limit
+        self.last_adjust = time.time()
+        with self.lock:
+            latencies, tasks, errors, saturated = sorted(self.latencies), self.tasks, self.errors, self.saturated
+            self.latencies, self.tasks, self.errors, self.saturated = [], 0, 0, False
+
+        p50 = latencies[len(latencies) // 2] if latencies else None
+        if p50 is not None:
+            self.baseline = p50 if self.baseline is None else min(p50, self.baseline * 1.05)
+        error_rate = errors / tasks if tasks >= 5 else 0.0
+        mem_free, load = system_pressure()
+
+        reason = None
+        if mem_free < ADAPT_MIN_FREE_MEMORY:
+            reason = f"only {mem_free:.0%} memory free"
+        elif load > ADAPT_MAX_LOAD:
+            reason = f"load {load:.1f} per CPU"
+        elif error_rate > ADAPT_MAX_ERROR_RATE:
+            reason = f"error rate {error_rate:.0%}"
+        elif p50 is not None and self.baseline and p50 > self.baseline * ADAPT_LATENCY_FACTOR:
+            reason = f"page loads {p50:.1f}s vs {self.baseline:.1f}s best"
+
+        old = self.limit
+        if reason:
+            self.limit = max(self.minimum, int(self.limit * 0.75))
+        elif saturated:
+            self.limit = min(self.maximum, self.limit + 1)
+        if self.limit != old:
+            log.info(f"Concurrency {old} -> {self.limit}" + (f" ({reason})" if reason else ""))
+        return self.limit
+
+
+concurrency: Optional[AdaptiveConcurrency] = None # Created in main() unless --no-adapt
+
 # ───────────────── CLI Parsing ───────────────────────
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     p = argparse.ArgumentParser(description="Enhanced email and social media scraper for business websites",
                                 formatter_class=argparse.ArgumentDefaultsHelpFormatter)
-    p.add_argument("--threads", type=int, default=5, help="Number of concurrent website workers")
+    p.add_argument("--threads", type=int, default=5, help="Number of concurrent website workers (starting point when adapting)")
+    p.add_argument("--min-threads", type=int, default=1,
+                   help="Lowest concurrency the adaptive controller backs off to")
+    p.add_argument("--max-threads", type=int, default=0,
+                   help="Highest concurrency the adaptive controller grows to (0 = --threads; every slot is a Chrome instance)")
+    p.add_argument("--no-adapt", action="store_true",
+                   help="Keep exactly --threads workers instead of adapting to latency, errors and memory/CPU pressure")
     p.add_argument("--headless", action="store_true", help="Run Chrome headless")
+    p.add_argument("--block-profile", choices=list(BLOCK_PROFILES), default=BLOCK_PROFILE,
+                   help="Subresources Chrome skips: none, light (images/fonts/media) or strict (light + trackers); "
+                        "domains where a blocked render finds nothing are reloaded in full")
     p.add_argument("--debug", action="store_true", help="Enable debug logging")
     p.add_argument("--mongo-uri", type=str, default=MONGO_URI,
                    help="MongoDB connection URI")
@@ -265,12 +664,85 @@ def parse_args() -> argparse.Namespace:
                    help="Maximum number of sites to process (0 = all)")
     p.add_argument("--reset-status", action="store_true",
                    help="Reset email status for all businesses with websites and exit")
+    p.add_argument("--rescore", action="store_true",
+                   help="Re-rank stored emails from their saved email_candidates with the current cleaning/scoring rules "
+                        "(no re-scrape) and exit")
     p.add_argument("--list-records", action="store_true",
                    help="List all records with websites (limit 10) and exit")
     p.add_argument("--test-url", type=str, help="Test a single URL and print results")
     p.add_argument("--export-csv", type=str, help="Export results to CSV file after processing")
+    p.add_argument("--driver-max-uses", type=int, default=DRIVER_MAX_USES,
+                   help="Recycle a pooled Chrome driver after this many sites")
+    p.add_argument("--browser-backend", choices=["selenium", "cdp"], default=BROWSER_BACKEND,
+                   help="Render pages through Selenium WebDriver, or drive headless Chrome directly over "
+                        "the DevTools protocol from one asyncio event loop (needs aiohttp)")
+    p.add_argument("--chrome-binary", type=str, default=None,
+                   help="Chrome executable for the cdp backend (default: first of CHROME_BINARIES on PATH)")
+    p.add_argument("--tabs-per-browser", type=int, default=TABS_PER_BROWSER,
+                   help="Load this many sites at once as tabs of one Chrome instance (much less memory per page)")
+    p.add_argument("--static-threshold", type=int, default=STATIC_CONFIDENCE_THRESHOLD,
+                   help="Own-domain email score from static HTML at which Selenium is skipped")
+    p.add_argument("--always-render", action="store_true",
+                   help="Always render pages with Selenium, even when static HTML is enough")
+    p.add_argument("--page-load-strategy", choices=["normal", "eager", "none"], default=PAGE_LOAD_STRATEGY,
+                   help="When Selenium's get() returns: after the load event, after DOMContentLoaded, or immediately")
+    p.add_argument("--site-budget", type=float, default=SITE_BUDGET_SECONDS,
+                   help="Seconds one business may take; when exceeded the results so far are saved as 'partial' (0 = no limit)")
+    p.add_argument("--static-sweep", action="store_true",
+                   help="Prefetch homepages and contact paths for a batch of sites at once (asyncio/aiohttp)")
+    p.add_argument("--sweep-batch", type=int, default=STATIC_SWEEP_BATCH,
+                   help="Number of sites per static sweep batch")
+    p.add_argument("--contact-pages", type=int, default=CONTACT_LINK_TOP_K,
+                   help="Number of contact pages discovered from homepage links to visit")
+    p.add_argument("--claim-batch", type=int, default=CLAIM_BATCH_SIZE,
+                   help="Pending records claimed (leased) from MongoDB at a time")
+    p.add_argument("--lease-seconds", type=int, default=CLAIM_LEASE_SECONDS,
+                   help="Seconds a claimed record stays leased to this process without renewal")
+    p.add_argument("--role", choices=["standalone", "coordinator", "worker"], default="standalone",
+                   help="standalone: one process; coordinator: spawn --workers worker processes and report their progress; "
+                        "worker: one of several processes claiming from the same collection")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 2,
+                   help="Worker processes a coordinator spawns")
+    p.add_argument("--shard", type=parse_shard, default=None,
+                   help="Only process records in shard i/n of the collection (e.g. 0/4), for splitting a run across hosts")
+    p.add_argument("--shard-workers", action="store_true",
+                   help="Coordinator gives each worker its own shard instead of sharing one lease-based queue")
+    p.add_argument("--run-id", type=str, default=None,
+                   help="Run identifier grouping worker progress documents (set by the coordinator)")
+    p.add_argument("--worker-id", type=str, default=None,
+                   help="Stable id of this process (default host:pid); restarting with the same id reclaims its leases and resumes its checkpoints")
+    p.add_argument("--checkpoint-dir", type=str, default=CHECKPOINT_DIR,
+                   help="Directory of the per-worker checkpoint journals")
+    p.add_argument("--no-checkpoint", action="store_true",
+                   help="Disable the checkpoint journal (interrupted records start over)")
+    p.add_argument("--mongo-batch-size", type=int, default=MONGO_BATCH_SIZE,
+                   help="Result updates buffered per MongoDB bulk_write")
+    p.add_argument("--mongo-flush-interval", type=float, default=MONGO_FLUSH_INTERVAL,
+                   help="Seconds between MongoDB bulk_write flushes of a partial batch")
+    p.add_argument("--cache-dir", type=str, default=CACHE_DIR,
+                   help="Directory of the persistent HTTP response cache")
+    p.add_argument("--cache-ttl", type=float, default=CACHE_TTL_HOURS,
+                   help="Hours a cached response is reused before it is revalidated")
+    p.add_argument("--cache-max-mb", type=int, default=CACHE_MAX_MB,
+                   help="Maximum size of the response cache in MB (LRU eviction)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Disable the persistent HTTP response cache and the consent memo")
+    p.add_argument("--archive", nargs="?", const=ARCHIVE_DIR, default=None, metavar="DIR",
+                   help="Keep a compressed archive of every fetched page and rendered DOM snapshot in DIR, for --replay")
+    p.add_argument("--replay", nargs="?", const=ARCHIVE_DIR, default=None, metavar="DIR",
+                   help="Re-run extraction for finished records (or --test-url) against the page archive in DIR, "
+                        "with no network or browser, write the results and exit")
     return p.parse_args()
 
+def apply_tunables(args: argparse.Namespace):
+    """Override module-level tunables from the command line."""
+    global STATIC_CONFIDENCE_THRESHOLD, ALWAYS_RENDER, CONTACT_LINK_TOP_K, PAGE_LOAD_STRATEGY, SITE_BUDGET_SECONDS
+    STATIC_CONFIDENCE_THRESHOLD = args.static_threshold
+    ALWAYS_RENDER = args.always_render
+    PAGE_LOAD_STRATEGY = args.page_load_strategy
+    SITE_BUDGET_SECONDS = args.site_budget
+    CONTACT_LINK_TOP_K = args.contact_pages
+
 # ───────────────── MongoDB Setup ─────────────────────
 def setup_mongodb(mongo_uri: str, db_name: str, collection_name: str) -> Tuple[Optional[MongoClient], Optional[Any]]:
     """Set up MongoDB connection and collection with proper error handling."""
@@ -296,6 +768,8 @@ def setup_mongodb(mongo_uri: str, db_name: str, collection_name: str) -> Tuple[O
             try:
                 collection.create_index([("emailstatus", ASCENDING)], background=True, name="emailstatus_idx")
                 collection.create_index([("website", ASCENDING)], background=True, name="website_idx")
+                collection.create_index([("emailstatus", ASCENDING), ("processing", ASCENDING)], background=True, name="emailstatus_processing_idx")
+                collection.create_index([("emailstatus", ASCENDING), ("shard_key", ASCENDING)], background=True, name="emailstatus_shard_idx")
                 log.info("Verified/created necessary indexes")
             except PyMongoError as e:
                 log.warning(f"Index check/creation issue (continuing anyway): {e}")
@@ -334,8 +808,9 @@ def reset_email_status(collection, debug: bool = False) -> int:
         # Update all matching records
         result = collection.update_many(
             query,
-            {"$set": {"emailstatus": "pending", "email": [], "social_profiles": {}},
-             "$unset": {"emailscraped_at": ""}} # Remove timestamp
+            # emailreset_at tells CheckpointJournal.adopt that journal entries from before it are stale
+            {"$set": {"emailstatus": "pending", "email": [], "social_profiles": {}, "processing": False, "emailreset_at": datetime.utcnow()},
+             "$unset": {"emailscraped_at": "", "email_candidates": "", "emailrescored_at": "", **LEASE_UNSET}} # Remove timestamps, candidates and any stale lease
         )
 
         count = result.modified_count
@@ -348,6 +823,47 @@ def reset_email_status(collection, debug: bool = False) -> int:
         log.error(f"Unexpected error resetting email status: {e}", exc_info=debug)
         return 0
 
+def rescore_emails(collection, batch_size: int = MONGO_BATCH_SIZE, debug: bool = False) -> Tuple[int, int]:
+    """Re-rank finished records from their stored email_candidates with the current
+    clean_emails/score_email rules, without scraping anything. The collection is streamed
+    and only records whose email list or status changes are written (in batches).
+    Returns (records scanned, records updated)."""
+    if collection is None:
+        log.error("Cannot rescore: MongoDB collection not available.")
+        return 0, 0
+    # "failed" records keep their status: their candidates are whatever was seen before the failure
+    query = {"emailstatus": {"$in": ["found", "partial", "checked"]}, "email_candidates": {"$exists": True}}
+    projection = {"website": 1, "email": 1, "emailstatus": 1, "email_candidates": 1}
+    writer = MongoBatchWriter(collection, batch_size)
+    scanned = updated = 0
+    started = time.time()
+    try:
+        log.info("Rescoring stored email candidates...")
+        for doc in collection.find(query, projection, batch_size=max(batch_size, 1000)):
+            if shutdown_flag:
+                log.warning("Shutdown requested, stopping rescore.")
+                break
+            scanned += 1
+            domain = get_domain(normalize_url(doc.get("website") or "")) or ""
+            sightings = [(c.get("email"), c.get("context") or {}) for c in doc.get("email_candidates") or []]
+            emails = prioritize_emails(score_emails(sightings, domain))[:10]
+            status = doc["emailstatus"]
+            if status != "partial": # A partial site stays partial; only found/checked depend on the emails
+                status = "found" if emails else "checked"
+            if emails != doc.get("email") or status != doc["emailstatus"]:
+                updated += 1
+                writer.submit(UpdateOne({"_id": doc["_id"]},
+                                        {"$set": {"email": emails, "emailstatus": status, "emailrescored_at": datetime.utcnow()}}))
+                if debug: log.debug(f"Rescored {doc['_id']} ({domain}): {doc.get('email')} -> {emails} [{status}]")
+            if scanned % RESCORE_LOG_INTERVAL == 0:
+                log.info(f"Rescore progress: {scanned} scanned, {updated} changed ({scanned / max(time.time() - started, 1e-6):.0f} records/s)")
+    except PyMongoError as e:
+        log.error(f"MongoDB error while rescoring: {e}")
+    finally:
+        writer.close()
+    log.info(f"Rescored {scanned} records in {time.time() - started:.1f}s, {updated} changed")
+    return scanned, updated
+
 def list_business_records(collection, debug: bool = False) -> int:
     """List all business records with websites.
     Returns the number of records found."""
@@ -432,6 +948,10 @@ def check_database_status(collection) -> Dict[str, int]:
         failed_query = {"emailstatus": "failed"}
         stats["businesses_failed"] = collection.count_documents(failed_query)
 
+        # Count businesses whose search was cut short by the per-site time budget
+        partial_query = {"emailstatus": "partial"}
+        stats["businesses_partial"] = collection.count_documents(partial_query)
+
         # Count businesses with social profiles
         social_query = {"social_profiles": {"$exists": True, "$ne": {}}}
         stats["businesses_with_social"] = collection.count_documents(social_query)
@@ -457,10 +977,10 @@ def export_to_csv(collection, filename: str, debug: bool = False) -> bool:
         return False
 
     try:
-        # Query for businesses processed (found, checked, or failed) or with social profiles
+        # Query for businesses processed (found, partial, checked, or failed) or with social profiles
         query = {
             "$or": [
-                {"emailstatus": {"$in": ["found", "checked", "failed"]}},
+                {"emailstatus": {"$in": ["found", "partial", "checked", "failed"]}},
                 {"social_profiles": {"$exists": True, "$ne": {}}}
             ]
         }
@@ -540,11 +1060,479 @@ def export_to_csv(collection, filename: str, debug: bool = False) -> bool:
         log.error(f"Unexpected error exporting to CSV: {e}", exc_info=debug)
         return False
 
-# ───────────────── Helper Utilities ──────────────────
-def rdelay(a: float, b: float):
-    """Random delay between a and b seconds."""
-    time.sleep(random.uniform(a, b))
+# ───────────────── Batched MongoDB Writes ───────────────────
+def is_transient_mongo_error(e: PyMongoError) -> bool:
+    """Network/election hiccups worth retrying (as opposed to bad documents or queries)."""
+    return isinstance(e, (ConnectionFailure, ServerSelectionTimeoutError, WTimeoutError)) or e.has_error_label("RetryableWriteError")
+
+
+class MongoBatchWriter:
+    """Background thread that buffers update operations from worker threads and writes
+    them with one unordered bulk_write once batch_size are queued or every flush_interval seconds.
+    Transient PyMongoErrors are retried here with backoff, so workers never block on MongoDB."""
+
+    def __init__(self, collection, batch_size: int = MONGO_BATCH_SIZE, flush_interval: float = MONGO_FLUSH_INTERVAL):
+        self.collection = collection
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.pending: List[Any] = []
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock() # One bulk_write at a time (flush thread vs. late direct writes)
+        self.flush_event = threading.Event()
+        self.closed = False
+        self.written = 0
+        self.failed = 0
+        self.thread = threading.Thread(target=self._run, name="MongoWriter", daemon=True)
+        self.thread.start()
+
+    def submit(self, op: Any):
+        """Queue an UpdateOne/UpdateMany. Written directly if the writer was already closed."""
+        with self.lock:
+            if not self.closed:
+                self.pending.append(op)
+                if len(self.pending) >= self.batch_size:
+                    self.flush_event.set()
+                return
+        self._write([op]) # Late result from a worker still running after shutdown
+
+    def request_flush(self):
+        """Ask the writer thread to flush now (safe to call from a signal handler)."""
+        self.flush_event.set()
+
+    def _run(self):
+        while True:
+            self.flush_event.wait(self.flush_interval)
+            self.flush_event.clear()
+            with self.lock:
+                ops, self.pending = self.pending, []
+                closed = self.closed
+            if ops:
+                self._write(ops)
+            if closed:
+                break
+
+    def _write(self, ops: List[Any]):
+        """bulk_write ops unordered, retrying transient errors with exponential backoff."""
+        with self.write_lock:
+            for attempt in range(MONGO_RETRY_ATTEMPTS):
+                try:
+                    result = self.collection.bulk_write(ops, ordered=False)
+                    self.written += len(ops)
+                    log.debug(f"Flushed {len(ops)} updates to MongoDB (matched {result.matched_count}, modified {result.modified_count})")
+                    return
+                except BulkWriteError as e:
+                    # Unordered: everything except the reported ops was applied
+                    errors = e.details.get("writeErrors", [])
+                    failed_idx = {err["index"] for err in errors}
+                    self.written += len(ops) - len(failed_idx)
+                    for err in errors[:5]:
+                        log.error(f"MongoDB rejected update {ops[err['index']]}: {err.get('errmsg')}")
+                    self.failed += len(failed_idx)
+                    return
+                except PyMongoError as e:
+                    if not is_transient_mongo_error(e) or attempt == MONGO_RETRY_ATTEMPTS - 1:
+                        log.error(f"Failed to write {len(ops)} updates to MongoDB: {e}")
+                        self.failed += len(ops)
+                        return
+                    delay = MONGO_RETRY_DELAY * (2 ** attempt) # Exponential backoff
+                    log.warning(f"Transient MongoDB error writing {len(ops)} updates (attempt {attempt + 1}/{MONGO_RETRY_ATTEMPTS}), retrying in {delay:.1f}s: {e}")
+                    time.sleep(delay)
+
+    def close(self, timeout: float = 60.0):
+        """Flush everything still buffered and stop the writer thread."""
+        with self.lock:
+            self.closed = True
+        self.flush_event.set()
+        self.thread.join(timeout)
+        if self.thread.is_alive():
+            log.error("MongoDB writer did not finish flushing in time; some updates may be lost.")
+        log.info(f"MongoDB writer: {self.written} updates written, {self.failed} failed")
+
+
+mongo_writer: Optional[MongoBatchWriter] = None # Created in main() for the processing run
+
+
+# ───────────────── Work Claiming ───────────────────
+# Records still to scrape (a lease on top of this marks one as being worked on)
+PENDING_QUERY = {
+    "website": {"$exists": True, "$nin": ["", None, "N/A"]},
+    "emailstatus": "pending"
+}
+# Fields removed again when a claimed record gets its result
+LEASE_UNSET = {"processing_expires": "", "processing_by": ""}
+
+
+def default_worker_id() -> str:
+    """Identifies this process in processing_by lease fields."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def result_update(business_ids: List[Any], update_data: Dict[str, Any]) -> UpdateMany:
+    """Update writing a result to claimed records and releasing their lease."""
+    return UpdateMany({"_id": {"$in": business_ids}},
+                      {"$set": dict(update_data, processing=False), "$unset": LEASE_UNSET})
+
+
+class WorkClaimer:
+    """Streams pending records out of MongoDB in leased batches.
+
+    A feeder thread claims up to batch_size records at a time by setting
+    processing/processing_expires/processing_by on them (conditional on nobody else
+    holding a live lease), groups them by website and puts the batch on a bounded
+    queue, so only a couple of batches are ever in memory. Leases of claimed records
+    are renewed until done() is called for them; a crashed process's leases simply
+    expire and the records become claimable again by any worker process or host.
+    """
+
+    def __init__(self, collection, worker_id: str, batch_size: int = CLAIM_BATCH_SIZE,
+                 lease_seconds: int = CLAIM_LEASE_SECONDS, limit: int = 0, query: Optional[Dict[str, Any]] = None):
+        self.collection = collection
+        self.worker_id = worker_id
+        self.batch_size = max(1, batch_size)
+        self.lease_seconds = lease_seconds
+        self.limit = limit
+        self.query = query or PENDING_QUERY
+        self.queue: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(maxsize=1) # One batch waiting ahead
+        self.active: Set[Any] = set() # Claimed and not yet done
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.claimed = 0
+        self.last_renewal = time.time()
+        self.thread = threading.Thread(target=self._run, name="WorkClaimer", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def claim_batch(self, n: int) -> List[Dict[str, Any]]:
+        """Atomically lease up to n claimable records. Returns the records actually won."""
+        now = datetime.utcnow()
+        # $and, not a merged dict: a "$or" of the query itself must not be replaced by the lease condition
+        claimable = {"$and": [self.query, {"$or": [{"processing": {"$ne": True}}, {"processing_expires": {"$lt": now}}]}]}
+        expires = now + timedelta(seconds=self.lease_seconds)
+        expires = expires.replace(microsecond=expires.microsecond // 1000 * 1000) # MongoDB stores milliseconds
+        try:
+            # Sorted by website so records sharing a site land in the same batch and are harvested once
+            ids = [doc["_id"] for doc in self.collection.find(claimable, {"_id": 1}).sort("website", ASCENDING).limit(n)]
+            if not ids:
+                return []
+            # The claimable filter is re-checked per document, so a record another process won in between is skipped
+            self.collection.update_many({"$and": [{"_id": {"$in": ids}}, claimable]},
+                                        {"$set": {"processing": True, "processing_expires": expires, "processing_by": self.worker_id}})
+            records = list(self.collection.find({"_id": {"$in": ids}, "processing_by": self.worker_id, "processing_expires": expires},
+                                                {"_id": 1, "website": 1, "businessname": 1}))
+        except PyMongoError as e:
+            log.error(f"MongoDB error claiming records: {e}")
+            return []
+        with self.lock:
+            self.active.update(r["_id"] for r in records)
+        self.claimed += len(records)
+        log.debug(f"Claimed {len(records)}/{len(ids)} records (lease until {expires:%H:%M:%S})")
+        return records
+
+    def _renew_if_due(self):
+        """Extend the lease on everything claimed and not yet done."""
+        if time.time() - self.last_renewal < self.lease_seconds / 3:
+            return
+        self.last_renewal = time.time()
+        with self.lock:
+            ids = list(self.active)
+        if not ids:
+            return
+        expires = datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+        try:
+            self.collection.update_many({"_id": {"$in": ids}, "processing_by": self.worker_id},
+                                        {"$set": {"processing_expires": expires}})
+            log.debug(f"Renewed lease on {len(ids)} in-flight records")
+        except PyMongoError as e:
+            log.warning(f"Could not renew record leases: {e}")
+
+    def _put(self, item: Optional[List[Dict[str, Any]]]) -> bool:
+        """Blocking put that keeps renewing leases and gives up on stop()."""
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=1.0)
+                return True
+            except queue.Full:
+                self._renew_if_due()
+        return False
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            n = self.batch_size if not self.limit else min(self.batch_size, self.limit - self.claimed)
+            records = self.claim_batch(n) if n > 0 else []
+            if not records:
+                break # Nothing left to claim (or --max-sites reached)
+            if not self._put(group_records_by_site(records)):
+                return
+        self._put(None) # End of work
+        while not self.stop_event.wait(1.0): # Keep in-flight leases alive until the run ends
+            self._renew_if_due()
+
+    def batches(self):
+        """Yield batches of grouped task records until claiming is exhausted or stop() is called."""
+        while not self.stop_event.is_set():
+            try:
+                batch = self.queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            if batch is None:
+                return
+            yield batch
+
+    def release_owners(self, owners: List[str]):
+        """Release pending records still leased to (dead) earlier workers, e.g. our own previous run."""
+        if not owners:
+            return
+        try:
+            result = self.collection.update_many({"$and": [self.query, {"processing": True, "processing_by": {"$in": owners}}]},
+                                                 {"$set": {"processing": False}, "$unset": LEASE_UNSET})
+            if result.modified_count:
+                log.info(f"Reclaimed {result.modified_count} records leased to earlier workers {owners}")
+        except PyMongoError as e:
+            log.warning(f"Could not release earlier workers' leases (they will expire): {e}")
+
+    def done(self, business_ids: List[Any]):
+        """Stop renewing leases for records whose result has been queued."""
+        with self.lock:
+            self.active.difference_update(business_ids)
+
+    def close(self):
+        """Stop claiming and hand back every record we claimed but did not finish."""
+        self.stop_event.set()
+        if self.thread.is_alive():
+            self.thread.join(5.0)
+        with self.lock:
+            ids, self.active = list(self.active), set()
+        if not ids:
+            return
+        try:
+            result = self.collection.update_many({"_id": {"$in": ids}, "processing_by": self.worker_id, "emailstatus": "pending"},
+                                                 {"$set": {"processing": False}, "$unset": LEASE_UNSET})
+            log.info(f"Released {result.modified_count} claimed but unfinished records.")
+        except PyMongoError as e:
+            log.error(f"Could not release claimed records (their leases will expire): {e}")
+
+
+# ───────────────── Checkpoint Journal ───────────────────
+def process_start_time(pid: int) -> Optional[float]:
+    """When the process with this pid started (an opaque value, only compared with itself), or None if unknown."""
+    try:
+        with open(f"/proc/{pid}/stat", encoding="ascii") as f:
+            return float(f.read().rsplit(")", 1)[1].split()[19]) # starttime, in clock ticks since boot
+    except (OSError, IndexError, ValueError):
+        pass
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).create_time()
+        except Exception:
+            pass
+    return None
+
+
+def pid_alive(pid: int, started: Optional[float] = None) -> bool:
+    """Whether a process with this pid exists on this host. With started (a process_start_time()
+    recorded earlier), a different process that has since been given the same pid counts as dead."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass # Exists, owned by someone else
+    except OSError:
+        return False
+    if started is not None:
+        current = process_start_time(pid)
+        if current is not None and current != started:
+            return False # The pid was reused
+    return True
+
+
+class RecordCheckpoint:
+    """One record's view of the CheckpointJournal, handed to harvest_emails.
+    get() returns a stage saved by an interrupted earlier attempt; save() journals a completed stage."""
+
+    def __init__(self, journal: "CheckpointJournal", business_id: Any, state: Optional[Dict[str, Any]]):
+        self.journal = journal
+        self.business_id = business_id
+        self.stages: Dict[str, Dict[str, Any]] = (state or {}).get("stages", {})
+        self.result: Optional[Dict[str, Any]] = (state or {}).get("done")
+
+    def get(self, stage: str) -> Optional[Dict[str, Any]]:
+        return self.stages.get(stage)
+
+    def save(self, stage: str, **data: Any):
+        self.journal.append(self.business_id, stage, **data)
+
+
+class CheckpointJournal:
+    """Append-only JSONL journal of per-record harvest progress, one file per worker in checkpoint_dir.
+
+    Each completed stage (rendered main page, each contact page) is journaled with the
+    emails (and contexts) and social links it produced, and the final result once the record
+    is done. On start-up the journal of this worker id and those of dead processes on this
+    host are adopted: entries for records that are still pending are compacted into our
+    own file, so an interrupted record resumes from its last completed stage (and a finished
+    result that never reached MongoDB is written without scraping again). A dead process's
+    journal is claimed by renaming it to <name>.adopting.<pid> first, so two workers starting
+    at once never both adopt it. Entries older than a record's emailreset_at (--reset-status)
+    are ignored, and a run that ends without interruption deletes its journal on close().
+    """
+
+    def __init__(self, directory: str, worker_id: str):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.worker_id = worker_id
+        self.path = self.dir / (re.sub(r'[^A-Za-z0-9_.-]', '_', worker_id) + ".jsonl")
+        self.lock = threading.Lock()
+        self.states: Dict[str, Dict[str, Any]] = {} # Resumable state of adopted records, keyed by str(_id)
+        self.fh = None
+
+    @staticmethod
+    def _key(business_id: Any) -> str:
+        return str(business_id)
+
+    def _read(self, path: Path) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """(header, entries) of a journal file; a torn last line from a crash is skipped."""
+        header, entries = None, []
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if "journal" in entry:
+                        header = header or entry
+                    else:
+                        entries.append(entry)
+        except OSError as e:
+            log.warning(f"Could not read checkpoint journal {path}: {e}")
+        return header, entries
+
+    def adopt(self, collection) -> List[str]:
+        """Load resumable state from our own and dead processes' journals and compact it
+        into our journal. Returns the worker ids whose record leases can be released."""
+        host = socket.gethostname()
+        owners: List[str] = []
+        adopted_files: List[Path] = []
+        # Journals an adopter died in the middle of claiming are up for adoption again
+        abandoned = [path for path in self.dir.glob("*.jsonl.adopting.*")
+                     if not path.name.rsplit(".", 1)[1].isdigit() or not pid_alive(int(path.name.rsplit(".", 1)[1]))]
+        for path in sorted(self.dir.glob("*.jsonl")) + sorted(abandoned):
+            header, entries = self._read(path)
+            if path != self.path:
+                if not header or header.get("host") != host:
+                    continue # Another host's journal
+                if path.suffix == ".jsonl" and pid_alive(header.get("pid", 0), header.get("pid_started")):
+                    continue # Another live process owns this journal
+                claimed = path.with_name(f"{path.name.split('.adopting.', 1)[0]}.adopting.{os.getpid()}")
+                try:
+                    os.rename(path, claimed)
+                except OSError:
+                    continue # Another worker claimed it first
+                path = claimed
+            if header and header.get("worker_id"):
+                owners.append(header["worker_id"])
+            adopted_files.append(path)
+            for entry in entries:
+                state = self.states.setdefault(entry["id"], {"oid": entry.get("oid", False), "stages": {}})
+                if entry["stage"] == "done":
+                    state["done"] = entry
+                else:
+                    state["stages"][entry["stage"]] = entry
+
+        # Only records that are still pending are worth resuming, and only from entries written since their last reset
+        if self.states:
+            ids = [ObjectId(k) if s["oid"] else k for k, s in self.states.items()]
+            try:
+                pending = {str(doc["_id"]): doc.get("emailreset_at")
+                           for doc in collection.find({"_id": {"$in": ids}, "emailstatus": "pending"}, {"_id": 1, "emailreset_at": 1})}
+                states = {}
+                for key, state in self.states.items():
+                    if key not in pending:
+                        continue
+                    reset_at = pending[key].replace(tzinfo=timezone.utc).timestamp() if pending[key] else 0.0
+                    state["stages"] = {stage: entry for stage, entry in state["stages"].items() if entry.get("t", 0) >= reset_at}
+                    if "done" in state and state["done"].get("t", 0) < reset_at:
+                        del state["done"]
+                    if state["stages"] or "done" in state:
+                        states[key] = state
+                self.states = states
+            except PyMongoError as e:
+                log.warning(f"Could not check journaled records against MongoDB, keeping all: {e}")
+
+        # Compact into a fresh journal of our own, then drop the adopted files
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self._header()) + "\n")
+            for key, state in self.states.items():
+                for entry in list(state["stages"].values()) + ([state["done"]] if "done" in state else []):
+                    f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        for path in adopted_files:
+            if path != self.path:
+                try: path.unlink()
+                except OSError: pass
+        self.fh = open(self.path, "a", encoding="utf-8")
+
+        if self.states:
+            log.info(f"Checkpoint journal: {len(self.states)} interrupted records can resume "
+                     f"(adopted {len(adopted_files)} journal(s) from {owners})")
+        return owners
+
+    def _header(self) -> Dict[str, Any]:
+        return {"journal": 1, "worker_id": self.worker_id, "host": socket.gethostname(), "pid": os.getpid(),
+                "pid_started": process_start_time(os.getpid()), "started_at": datetime.utcnow().isoformat()}
+
+    def checkpoint(self, business_id: Any) -> RecordCheckpoint:
+        """Checkpoint handle for a record, carrying any state an interrupted attempt left behind."""
+        with self.lock:
+            state = self.states.get(self._key(business_id))
+        return RecordCheckpoint(self, business_id, state)
+
+    def append(self, business_id: Any, stage: str, **data: Any):
+        """Journal one completed stage (fsynced, so it survives a crash of the whole box)."""
+        entry = {"id": self._key(business_id), "oid": isinstance(business_id, ObjectId), "stage": stage, "t": time.time(), **data}
+        line = json.dumps(entry, default=str) + "\n"
+        with self.lock:
+            if self.fh is None:
+                return
+            try:
+                self.fh.write(line)
+                self.fh.flush()
+                os.fsync(self.fh.fileno())
+            except OSError as e:
+                log.warning(f"Could not write checkpoint for {business_id}: {e}")
+
+    def finish(self, business_id: Any, emails: List[str], social_profiles: Dict[str, str], status: str,
+               candidates: Optional[List[Dict[str, Any]]] = None):
+        """Journal a record's final result and forget its resumable state."""
+        self.append(business_id, "done", emails=emails, social=social_profiles, status=status, candidates=candidates or [])
+        with self.lock:
+            self.states.pop(self._key(business_id), None)
+
+    def close(self, discard: bool = False):
+        """Close the journal. With discard (the run ended without interruption and every result
+        reached MongoDB) the file is deleted, so nothing in it can be resumed later."""
+        with self.lock:
+            if self.fh:
+                self.fh.close()
+                self.fh = None
+            if discard:
+                try:
+                    self.path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    log.warning(f"Could not remove checkpoint journal {self.path}: {e}")
+
+
+checkpoint_journal: Optional[CheckpointJournal] = None # Opened in main() unless --no-checkpoint
+
 
+# ───────────────── Helper Utilities ──────────────────
 def is_driver_alive(driver: Optional[webdriver.Chrome]) -> bool:
     """Check if the driver is still alive and responsive."""
     if driver is None:
@@ -589,6 +1577,19 @@ def get_domain(url: str) -> str:
         log.warning(f"Could not parse domain from URL '{url}': {e}")
         return ""
 
+def site_key(website: str) -> str:
+    """Key identifying the website a record points to: its domain, or the full URL
+    (minus scheme/fragment) on SHARED_SITE_HOSTS. Empty for invalid URLs."""
+    url = normalize_url(website or "")
+    domain = get_domain(url)
+    if not domain:
+        return ""
+    if not any(domain == host or domain.endswith("." + host) for host in SHARED_SITE_HOSTS):
+        return domain
+    parsed = urllib.parse.urlparse(url)
+    key = domain + parsed.path.rstrip('/')
+    return key + "?" + parsed.query if parsed.query else key
+
 def backoff_retry(func, max_retries=3, initial_delay=1.0, allowed_exceptions=(requests.exceptions.RequestException, TimeoutException), *args, **kwargs):
     """Retry a function with exponential backoff for specific exceptions."""
     retries = 0
@@ -615,43 +1616,28 @@ def clean_emails(raw: List[str]) -> List[str]:
     seen: Set[str] = set()
     cleaned = []
 
-    # Common disposable/temporary email domains (add more as needed)
-    disposable_domains = {"mailinator.com", "temp-mail.org", "10minutemail.com"}
-    # Common image file extensions
-    image_extensions = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"}
-
-
     for e in raw:
         if not e or not isinstance(e, str):
             continue
         e = e.strip().lower()
+        if e in seen:
+            continue # Already accepted; rejected ones are cheap to reject again
 
         # Basic check
-        if "@" not in e or "." not in e.split('@')[-1]:
+        if "@" not in e or "." not in e.rpartition('@')[2]:
             continue
 
         # Skip common fake/example emails
-        if any(p in e for p in (
-            "example.com", "sentry.wixpress.com", "your@email",
-            "email@example", "info@your", "name@domain",
-            "user@", "username@", "email@domain", "@localhost",
-            "example.org", "example.net", "domain.com",
-            "contact@example.com", "privacy@example.com",
-            "email@here.com"
-        )):
+        if FAKE_EMAIL_RE.search(e):
             continue
 
         # Skip emails ending with common image extensions
-        if any(e.endswith(ext) for ext in image_extensions):
+        if e.endswith(IMAGE_EXTENSIONS):
              continue
 
         # Skip emails from known disposable domains
-        try:
-            domain = e.split('@')[1]
-            if domain in disposable_domains:
-                continue
-        except IndexError:
-             continue # Should not happen if '@' is present, but safety first
+        if e.split('@', 2)[1] in DISPOSABLE_EMAIL_DOMAINS:
+            continue
 
         # Use the detailed regex for better validation
         if not EMAIL_RE.fullmatch(e):
@@ -667,9 +1653,6 @@ def clean_emails(raw: List[str]) -> List[str]:
         #             e = parts[0] + tld
         #         break
 
-        if e in seen:
-            continue
-
         seen.add(e)
         cleaned.append(e)
 
@@ -677,24 +1660,41 @@ def clean_emails(raw: List[str]) -> List[str]:
 
 
 def emails_from_text(text: str) -> List[str]:
-    """Extract email addresses from text using regex."""
+    """Extract email addresses from text using regex.
+    Same results as EMAIL_RE.findall() over the de-obfuscated text, but the regex only runs
+    in the short window around each '@' (multi-MB page sources are mostly script/markup)."""
     if not text or not isinstance(text, str):
         return []
     # Decode potential HTML entities like '&#64;' for '@' and '&#46;' for '.'
-    try:
-        import html
+    if '&' in text:
         text = html.unescape(text)
-    except ImportError:
-        pass # Continue without html module if not available
+    # No '@' and no "at" word (for [at], (at) and " at ") means no address can come out of this
+    if '@' not in text and not AT_WORD_RE.search(text):
+        return []
 
     # Replace common obfuscations like [at] and [dot]
-    text = re.sub(r'\s*\[\s*(at|@)\s*\]\s*', '@', text, flags=re.IGNORECASE)
-    text = re.sub(r'\s*\[\s*(dot|\.)\s*\]\s*', '.', text, flags=re.IGNORECASE)
-    text = re.sub(r'\s*\(\s*(at|@)\s*\)\s*', '@', text, flags=re.IGNORECASE)
-    text = re.sub(r'\s*\(\s*(dot|\.)\s*\)\s*', '.', text, flags=re.IGNORECASE)
+    text = DEOBFUSCATE_RE.sub(lambda m: '@' if m.group(1) or m.group(2) else '.', text)
     text = text.replace(' at ', '@').replace(' dot ', '.') # Simple space replacement
 
-    return EMAIL_RE.findall(text or "")
+    emails = []
+    scanned_to = 0 # End of the previous match: findall never overlaps matches
+    at = text.find('@')
+    while at != -1:
+        # Local part run to the left of this '@' (extended in steps for pathological runs)
+        start = at
+        while start > scanned_to:
+            window = text[max(scanned_to, start - 256):start]
+            run = EMAIL_LOCAL_RUN_RE.match(window[::-1]).end()
+            start -= run
+            if run < len(window):
+                break
+        end = EMAIL_DOMAIN_RUN_RE.match(text, at + 1).end()
+        match = EMAIL_RE.search(text, start, end)
+        if match:
+            emails.append(match.group())
+            scanned_to = match.end()
+        at = text.find('@', max(at + 1, scanned_to))
+    return emails
 
 def guess_emails_from_domain(domain: str, business_name: str) -> List[str]:
     """Generate likely email addresses based on domain and business name."""
@@ -762,31 +1762,28 @@ def score_email(email: str, domain: str, context: Dict[str, Any]) -> int:
     score += 10
 
     # Domain match is a strong signal
-    try:
-        email_domain = email.split('@')[1]
-        if domain and email_domain == domain:
+    parts = email.split('@', 2)
+    if len(parts) < 2:
+        return 0 # Invalid email format
+    prefix, email_domain = parts[0], parts[1]
+    if domain:
+        if email_domain == domain:
             score += 50 # Exact match
-        elif domain and email_domain.endswith("." + domain):
+        elif email_domain.endswith("." + domain):
              score += 30 # Subdomain match
-        elif domain and domain in email_domain:
+        elif domain in email_domain:
             score += 15 # Partial domain match (less reliable)
-    except IndexError:
-        return 0 # Invalid email format
 
 
     # Email format scoring
-    prefix = email.split('@')[0]
-    if prefix in ["info", "contact", "hello", "enquiries", "support", "sales", "bookings", "reservations"]:
-        score += 25 # Common contact prefixes
-    elif prefix in ["admin", "office", "mail", "help", "general"]:
-        score += 15 # Other common prefixes
-    elif prefix in ["press", "media", "jobs", "careers", "hr"]:
-         score += 10 # Specific department prefixes
+    prefix_score = EMAIL_PREFIX_SCORES.get(prefix)
+    if prefix_score is not None:
+        score += prefix_score
     elif len(prefix) <= 3 and not prefix.isdigit(): # Very short prefixes (non-numeric) are often less desirable
         score -= 5
-    elif re.match(r'^\d+$', prefix): # Purely numeric prefix
+    elif NUMERIC_PREFIX_RE.match(prefix): # Purely numeric prefix
          score -= 10
-    elif re.search(r'[a-f0-9]{8,}', prefix): # Looks like a hash/random string
+    elif HASH_PREFIX_RE.search(prefix): # Looks like a hash/random string
           score -= 15
 
     # Context scoring (add points based on where it was found)
@@ -844,341 +1841,309 @@ def prioritize_emails(emails_with_scores: List[Tuple[str, int]]) -> List[str]:
     return [email for email, _ in sorted_emails_tuples]
 
 
-def extract_from_accessibility_elements(driver: webdriver.Chrome) -> List[str]:
-    """Extract emails from accessibility elements like alt text and aria labels."""
-    emails = set()
-    if not is_driver_alive(driver): return []
-
-    # Check alt text
-    try:
-        elements = driver.find_elements(By.XPATH, "//*[@alt and contains(@alt, '@')]")
-        for el in elements:
-            try:
-                alt_text = el.get_attribute("alt") or ""
-                emails.update(emails_from_text(alt_text))
-            except StaleElementReferenceException:
-                continue
-            except Exception as e_inner:
-                 log.debug(f"Inner error getting alt text: {e_inner}")
-    except (NoSuchElementException, WebDriverException) as e:
-        log.debug(f"Error finding alt elements: {e}")
-    except Exception as e:
-         log.debug(f"Unexpected error in alt text extraction: {e}")
+def merge_email_contexts(emails_with_context: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """Combine the contexts of every sighting of an email, favoring True values."""
+    email_contexts: Dict[str, Dict[str, Any]] = {}
+    for email, context in emails_with_context:
+        merged = email_contexts.setdefault(email.strip().lower(), {})
+        for key, value in context.items():
+            if value:
+                merged[key] = True
+    return email_contexts
+
+
+def score_emails(emails_with_context: List[Tuple[str, Dict[str, Any]]], domain: str) -> List[Tuple[str, int]]:
+    """Merge, clean, dedup and score a batch of (email, context) sightings in one pass.
+    Returns (email, score) for each surviving address in first-seen order. Needs nothing but the
+    sightings and the site's domain, so stored candidates can be re-scored without re-scraping."""
+    if not emails_with_context:
+        return []
+    email_contexts = merge_email_contexts(emails_with_context)
+    return [(email, score_email(email, domain, email_contexts[email])) for email in clean_emails(list(email_contexts))]
 
-    # Check aria labels
-    try:
-        elements = driver.find_elements(By.XPATH, "//*[@aria-label and contains(@aria-label, '@')]")
-        for el in elements:
-             try:
-                 aria_text = el.get_attribute("aria-label") or ""
-                 emails.update(emails_from_text(aria_text))
-             except StaleElementReferenceException:
-                 continue
-             except Exception as e_inner:
-                 log.debug(f"Inner error getting aria label: {e_inner}")
-    except (NoSuchElementException, WebDriverException) as e:
-        log.debug(f"Error finding aria-label elements: {e}")
-    except Exception as e:
-         log.debug(f"Unexpected error in aria-label extraction: {e}")
 
-    return list(emails)
+def email_candidates_doc(emails_with_context: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Raw sightings as stored in a record's email_candidates, for --rescore: one
+    {"email", "context"} per address, contexts merged, in first-seen order. Every address
+    clean_emails() accepts is kept; only the rejected ones are capped (at whatever room
+    EMAIL_CANDIDATES_MAX leaves), since a looser filter may still want a few of them back."""
+    email_contexts = merge_email_contexts(emails_with_context)
+    kept = set(clean_emails(list(email_contexts)))
+    room = max(0, EMAIL_CANDIDATES_MAX - len(kept))
+    kept.update([email for email in email_contexts if email not in kept][:room])
+    return [{"email": email, "context": context} for email, context in email_contexts.items() if email in kept]
 
-def extract_obfuscated_emails(driver: webdriver.Chrome) -> List[str]:
-    """Extract emails that are obfuscated with JavaScript or CSS."""
-    emails = set()
-    if not is_driver_alive(driver): return []
 
-    # Execute JavaScript to find elements with data attributes containing email parts
+def static_confidence(emails_with_context: List[Tuple[str, Dict[str, Any]]], domain: str) -> int:
+    """Best score among cleaned emails on the business's own domain (0 if none)."""
+    if not emails_with_context or not domain:
+        return 0
+    best = 0
+    for email, score in score_emails(emails_with_context, domain):
+        email_domain = email.split('@')[1]
+        if email_domain != domain and not email_domain.endswith("." + domain):
+            continue # Only the business's own domain counts as confident
+        best = max(best, score)
+    return best
+
+
+def js_rendering_signal(html_content: Optional[str]) -> Optional[str]:
+    """Return why static HTML looks like it needs JavaScript to render, or None if it looks complete."""
+    if not html_content:
+        return "empty document"
+    for pattern, reason in JS_RENDER_MARKERS:
+        if pattern.search(html_content):
+            return reason
+    # Rough visible-text size without building a DOM
+    visible_text = TAG_RE.sub(' ', SCRIPT_STYLE_RE.sub(' ', html_content))
+    if len(''.join(visible_text.split())) < JS_MIN_TEXT_CHARS:
+        return "near-empty body"
+    return None
+
+
+# One round trip per page: everything the Selenium extractors need, with ancestor context,
+# collected in the browser and returned as a single JSON payload
+PAGE_EXTRACT_JS = r"""
+const MAX_ELEMENTS = 50, MAX_SCRIPTS = 25, MAX_SCRIPT_LEN = 50000;
+const has = (s) => typeof s === 'string' && s.indexOf('@') !== -1;
+function region(el) {
+    // Same header/footer test the per-element WebDriver version did, up to 6 levels up
+    let cur = el;
+    for (let i = 0; i < 6 && cur && cur.tagName && cur.tagName !== 'BODY'; i++, cur = cur.parentElement) {
+        const tag = cur.tagName.toLowerCase();
+        const id = String(cur.id || '').toLowerCase();
+        const cls = String(cur.getAttribute('class') || '').toLowerCase();
+        if (tag === 'header' || id.includes('header') || cls.includes('header') || tag === 'nav' || id.includes('nav') || id.includes('menu')) return [true, false];
+        if (tag === 'footer' || id.includes('footer') || cls.includes('footer') || id.includes('copyright') || cls.includes('copyright')) return [false, true];
+    }
+    return [false, false];
+}
+const out = {source: '', bodyText: '', elements: [], mailtos: [], meta: [], scripts: [], forms: [],
+             alt: [], aria: [], obfuscated: [], links: [], iconLinks: []};
+try { out.source = document.documentElement ? document.documentElement.outerHTML : ''; } catch (e) {}
+try { out.bodyText = document.body ? document.body.innerText : ''; } catch (e) {}
+try {
+    const snap = document.evaluate("//p[contains(text(), '@')] | //span[contains(text(), '@')] | //div[contains(text(), '@')] | //a[contains(text(), '@')]",
+                                   document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < Math.min(snap.snapshotLength, MAX_ELEMENTS); i++) {
+        const el = snap.snapshotItem(i), r = region(el);
+        out.elements.push({text: el.textContent || '', header: r[0], footer: r[1]});
+    }
+} catch (e) {}
+try {
+    document.querySelectorAll("a[href^='mailto:'], a[href^='MAILTO:']").forEach(a => {
+        const r = region(a);
+        out.mailtos.push({href: a.href || a.getAttribute('href') || '', header: r[0], footer: r[1]});
+    });
+} catch (e) {}
+try { document.querySelectorAll('meta[content]').forEach(m => { if (has(m.content)) out.meta.push(m.content); }); } catch (e) {}
+try {
+    Array.from(document.scripts).slice(0, MAX_SCRIPTS).forEach(s => {
+        const t = s.textContent || '';
+        if (has(t) && t.length < MAX_SCRIPT_LEN) out.scripts.push(t);
+    });
+} catch (e) {}
+try {
+    Array.from(document.forms).forEach(f => {
+        const hidden = [];
+        f.querySelectorAll("input[type='hidden']").forEach(i => { if (has(i.value)) hidden.push(i.value); });
+        out.forms.push({action: f.getAttribute('action') || '', hidden: hidden});
+    });
+} catch (e) {}
+try { document.querySelectorAll('[alt]').forEach(el => { const v = el.getAttribute('alt'); if (has(v)) out.alt.push(v); }); } catch (e) {}
+try { document.querySelectorAll('[aria-label]').forEach(el => { const v = el.getAttribute('aria-label'); if (has(v)) out.aria.push(v); }); } catch (e) {}
+try {
+    const results = new Set();
+    document.querySelectorAll('[data-email], [data-user], [data-name], [data-domain], [data-host]').forEach(el => {
+        let email = el.dataset.email || null;
+        if (!email) {
+            const name = el.dataset.name || el.dataset.user || null;
+            const domain = el.dataset.domain || el.dataset.host || null;
+            if (name && domain) email = name + '@' + domain;
+        }
+        if (email && email.includes('@') && email.includes('.')) results.add(email.toLowerCase().trim());
+        const text = el.innerText || el.textContent || '';
+        if ((text.includes('@') || text.includes('(at)') || text.includes('[at]')) && text.length < 100) results.add(text);
+    });
+    // Emails split across spans (e.g. user [at] domain [dot] com)
+    document.querySelectorAll('span').forEach(span => {
+        if (span.innerText && span.innerText.includes('@')) results.add(span.innerText.toLowerCase().trim());
+    });
+    out.obfuscated = Array.from(results);
+} catch (e) {}
+try {
+    const seen = new Set();
+    document.querySelectorAll('a[href]').forEach(a => {
+        const href = a.href;
+        if (href && !seen.has(href)) { seen.add(href); out.links.push(href); }
+    });
+} catch (e) {}
+try {
+    const iconSelector = arguments[0];
+    document.querySelectorAll(iconSelector).forEach(icon => {
+        let cur = icon;
+        for (let i = 0; i < 4 && cur; i++, cur = cur.parentElement) {
+            if (cur.tagName === 'A') { if (cur.href) out.iconLinks.push(cur.href); break; }
+        }
+    });
+} catch (e) {}
+return out;
+"""
+
+# Social icons whose enclosing link is a social profile (FontAwesome, SVG labels, social-* classes)
+SOCIAL_ICON_SELECTOR = ", ".join([
+    "i[class*='fa-facebook']", "i[class*='fa-twitter']", "i[class*='fa-instagram']",
+    "i[class*='fa-linkedin']", "i[class*='fa-youtube']", "i[class*='fa-pinterest']",
+    "i[class*='fa-tiktok']", "i[class*='fa-x-twitter']", # FontAwesome 6 for X
+    "[class*='social-icon']", "[class*='social-media']", "[class*='social-link']",
+    "svg[aria-label*='facebook']", "svg[aria-label*='twitter']", "svg[aria-label*='instagram']", # SVGs with labels
+    "svg[class*='facebook']", "svg[class*='twitter']", "svg[class*='instagram']" # SVGs with classes
+])
+
+
+def page_payload(driver: webdriver.Chrome) -> Optional[Dict[str, Any]]:
+    """Run PAGE_EXTRACT_JS on the current page. Returns the payload dict or None."""
+    if not is_driver_alive(driver): return None
     try:
-        script = """
-        const results = new Set();
-        const elements = document.querySelectorAll('[data-email], [data-user], [data-name], [data-domain], [data-host]');
-
-        elements.forEach(el => {
-            try {
-                let email = el.dataset.email || null;
-                if (!email) {
-                    const name = el.dataset.name || el.dataset.user || null;
-                    const domain = el.dataset.domain || el.dataset.host || null;
-                    if (name && domain) {
-                        email = name + '@' + domain;
-                    }
-                }
-                // Basic validation in JS
-                if (email && email.includes('@') && email.includes('.')) {
-                    results.add(email.toLowerCase().trim());
-                }
+        payload = driver.execute_script(PAGE_EXTRACT_JS, SOCIAL_ICON_SELECTOR)
+        return payload if isinstance(payload, dict) else None
+    except WebDriverException as e:
+        log.debug(f"JavaScript execution error for page extraction: {e}")
+    except Exception as e:
+        log.debug(f"Unexpected error running page extraction script: {e}")
+    return None
 
-                // Check innerText for reversed emails or similar tricks
-                const text = el.innerText || el.textContent || '';
-                if (text.includes('@') || text.includes('(at)') || text.includes('[at]')) {
-                     // Further processing needed in Python for complex cases
-                     // For now, just add if it looks like a potential email part
-                     if (text.length < 100) { // Avoid huge blocks
-                         results.add(text); // Add potential fragments for Python regex
-                     }
-                }
 
-            } catch (e) {
-                 // Ignore errors for individual elements
-            }
-        });
+def extract_from_accessibility_elements(driver: Optional[webdriver.Chrome], payload: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Extract emails from accessibility elements like alt text and aria labels.
+    Uses an existing page_payload() result when given, otherwise collects one."""
+    emails = set()
+    if payload is None:
+        payload = page_payload(driver)
+    if not payload: return []
 
-        // Look for emails split across spans (e.g., user [at] domain [dot] com)
-        document.querySelectorAll('span').forEach(span => {
-             try {
-                if (span.innerText && span.innerText.includes('@')) {
-                    results.add(span.innerText.toLowerCase().trim());
-                }
-             } catch (e) {}
-        });
+    for text in (payload.get("alt") or []) + (payload.get("aria") or []):
+        emails.update(emails_from_text(text))
 
+    return list(emails)
 
-        return Array.from(results);
-        """
-        obfuscated_data = driver.execute_script(script)
-        # Process results with Python regex for better accuracy
-        for item in obfuscated_data:
-             emails.update(emails_from_text(item))
+def extract_obfuscated_emails(driver: Optional[webdriver.Chrome], payload: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Extract emails that are obfuscated with JavaScript or CSS (data-* attributes, split spans).
+    Uses an existing page_payload() result when given, otherwise collects one."""
+    emails = set()
+    if payload is None:
+        payload = page_payload(driver)
+    if not payload: return []
 
-    except WebDriverException as e:
-        log.debug(f"JavaScript execution error for obfuscated emails: {e}")
-    except Exception as e:
-         log.debug(f"Unexpected error extracting obfuscated emails: {e}")
+    # Process fragments with Python regex for better accuracy
+    for item in payload.get("obfuscated") or []:
+        emails.update(emails_from_text(item))
 
     # Add CSS ::before/:after content check? (More complex, might require specific JS)
 
     return list(emails)
 
 
-def extract_social_media(html_content: str, url: str) -> Dict[str, str]:
-    """Extract social media links from HTML content using Regex."""
-    social_profiles = {}
-    if not html_content or not isinstance(html_content, str):
-        return {}
-
-    base_domain = get_domain(url) # For context, if needed
-
-    # Use BeautifulSoup to find links reliably
-    soup = BeautifulSoup(html_content, "html.parser")
-    links = soup.find_all('a', href=True)
-
-    # Keywords often found near social links
-    social_keywords = ['follow', 'social', 'connect', 'network', 'profile']
 
-    found_platforms = set()
-
-    for link in links:
-        href = link.get('href', '').strip()
-        if not href or href.startswith('#') or href.startswith('mailto:') or href.startswith('tel:'):
+def social_link_matches(href: str) -> List[Tuple[str, str, str]]:
+    """(platform, handle, pattern) for every SOCIAL_MEDIA_PATTERNS entry found in href, in the
+    order the patterns are declared. One SOCIAL_LINK_RE scan; links without a social host skip it."""
+    lowered = href.lower()
+    if not any(host in lowered for host in SOCIAL_HOSTS):
+        return []
+    handles: Dict[str, str] = {}
+    for match in SOCIAL_LINK_RE.finditer(href):
+        handles.setdefault(match.lastgroup, match.group(match.lastgroup)) # First occurrence per pattern, like re.search
+    ordered = sorted(handles.items(), key=lambda item: SOCIAL_GROUPS[item[0]][0])
+    return [(SOCIAL_GROUPS[name][1], handle, SOCIAL_GROUPS[name][2]) for name, handle in ordered]
+
+
+def match_social_link(href: str, link_text: str, link_title: str, link_aria: str,
+                      is_likely_social: bool, found_platforms: Set[str]) -> Optional[Tuple[str, str]]:
+    """Match one anchor against SOCIAL_MEDIA_PATTERNS.
+    Returns (platform, canonical_url) or None. Platforms in found_platforms are skipped."""
+    for platform, handle, pattern in social_link_matches(href):
+        if platform in found_platforms: # Already found a link for this platform
             continue
 
-        # Check parent elements for keywords indicating social links
-        is_likely_social = False
-        parent = link.parent
-        for _ in range(3): # Check up to 3 levels up
-            if parent and parent.name != 'body':
-                parent_classes = ' '.join(parent.get('class', [])).lower()
-                parent_id = parent.get('id', '').lower()
-                if any(keyword in parent_classes or keyword in parent_id for keyword in social_keywords):
-                    is_likely_social = True
-                    break
-                parent = parent.parent
-            else:
-                break
-
-        # Also check link text/title/aria-label
-        link_text = link.get_text(strip=True).lower()
-        link_title = link.get('title', '').lower()
-        link_aria = link.get('aria-label', '').lower()
-
-        for platform, patterns in SOCIAL_MEDIA_PATTERNS.items():
-             if platform in found_platforms: # Already found a link for this platform
-                 continue
-
-             for pattern in patterns:
-                match = re.search(pattern, href, re.IGNORECASE)
-                if match:
-                    handle = match.group(1)
-
-                    # Basic validation for handle
-                    if not handle or len(handle) < 2 or handle.lower() in [
-                        "sharer", "share", "intent", "tweet", "post", "view",
-                        "plugins", "login", "signup", "home", "search", "explore",
-                        "pages", "groups", "events", "ads", "about", "privacy", "terms"
-                    ] or '/' in handle: # Handles shouldn't contain slashes typically
-                        continue
+        # Basic validation for handle
+        if not handle or len(handle) < 2 or handle.lower() in SOCIAL_HANDLE_BLOCKLIST or '/' in handle: # Handles shouldn't contain slashes typically
+            continue
 
-                    # Additional check: platform name often in link text/attributes
-                    platform_in_attrs = platform in link_text or platform in link_title or platform in link_aria
-
-                    # Require either context keywords or platform name in attributes for higher confidence
-                    if is_likely_social or platform_in_attrs:
-                         # Construct full URL - use the matched href directly for accuracy
-                         # social_profiles[platform] = href # Store the exact found URL
-                         # Alternative: Construct canonical URL
-                         constructed_url = ""
-                         if platform == 'facebook':
-                             constructed_url = f"https://facebook.com/{handle}"
-                         elif platform == 'twitter':
-                             constructed_url = f"https://twitter.com/{handle}"
-                         elif platform == 'instagram':
-                             constructed_url = f"https://instagram.com/{handle}"
-                         elif platform == 'linkedin':
-                             if 'company' in pattern: constructed_url = f"https://linkedin.com/company/{handle}"
-                             elif 'school' in pattern: constructed_url = f"https://linkedin.com/school/{handle}"
-                             else: constructed_url = f"https://linkedin.com/in/{handle}" # Assume 'in' if unsure
-                         elif platform == 'youtube':
-                             # Youtube handles can be complex (channel ID, custom URL, @handle)
-                             # Storing the original href might be safer here
-                             constructed_url = href # Use original link for YouTube
-                             # Simplification - try to extract @handle if present
-                             if '@' in handle:
-                                 constructed_url = f"https://youtube.com/@{handle.split('@')[-1]}"
-                         elif platform == 'pinterest':
-                             constructed_url = f"https://pinterest.com/{handle}"
-                         elif platform == 'tiktok':
-                             constructed_url = f"https://tiktok.com/@{handle}"
-
-                         if constructed_url:
-                            social_profiles[platform] = constructed_url
-                            found_platforms.add(platform)
-                            break # Go to next platform once found
-
-             if platform in found_platforms:
-                 break # Move to next link if platform found
+        # Additional check: platform name often in link text/attributes
+        platform_in_attrs = platform in link_text or platform in link_title or platform in link_aria
+
+        # Require either context keywords or platform name in attributes for higher confidence
+        if is_likely_social or platform_in_attrs:
+             # Construct canonical URL
+             constructed_url = ""
+             if platform == 'facebook':
+                 constructed_url = f"https://facebook.com/{handle}"
+             elif platform == 'twitter':
+                 constructed_url = f"https://twitter.com/{handle}"
+             elif platform == 'instagram':
+                 constructed_url = f"https://instagram.com/{handle}"
+             elif platform == 'linkedin':
+                 if 'company' in pattern: constructed_url = f"https://linkedin.com/company/{handle}"
+                 elif 'school' in pattern: constructed_url = f"https://linkedin.com/school/{handle}"
+                 else: constructed_url = f"https://linkedin.com/in/{handle}" # Assume 'in' if unsure
+             elif platform == 'youtube':
+                 # Youtube handles can be complex (channel ID, custom URL, @handle)
+                 # Storing the original href might be safer here
+                 constructed_url = href # Use original link for YouTube
+                 # Simplification - try to extract @handle if present
+                 if '@' in handle:
+                     constructed_url = f"https://youtube.com/@{handle.split('@')[-1]}"
+             elif platform == 'pinterest':
+                 constructed_url = f"https://pinterest.com/{handle}"
+             elif platform == 'tiktok':
+                 constructed_url = f"https://tiktok.com/@{handle}"
+
+             if constructed_url:
+                return platform, constructed_url
+    return None
 
 
-    return social_profiles
+def extract_social_media(html_content: str, url: str) -> Dict[str, str]:
+    """Extract social media links from HTML content (one parse_page() walk)."""
+    if not html_content or not isinstance(html_content, str):
+        return {}
+    return parse_page(html_content, url)["social"]
 
 
-def extract_social_media_selenium(driver: webdriver.Chrome) -> Dict[str, str]:
-    """Extract social media links using Selenium by checking links and icons."""
+def social_from_payload(payload: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Match the links (and social icons' parent links) from a page_payload() result
+    against SOCIAL_MEDIA_PATTERNS. Stores the actual href found per platform."""
     social_profiles = {}
-    if not is_driver_alive(driver): return {}
+    if not payload: return {}
 
     found_platforms = set()
     processed_hrefs = set() # Avoid processing the same link multiple times
 
-    try:
-        # Get all links
-        links = driver.find_elements(By.TAG_NAME, "a")
-
-        for link in links:
-            try:
-                href = link.get_attribute("href")
-                if not href or not isinstance(href, str) or href in processed_hrefs:
-                    continue
-
-                href = href.strip()
-                processed_hrefs.add(href) # Mark as processed
-
-                if not href or href.startswith('#') or href.startswith('mailto:') or href.startswith('tel:') or href.startswith('javascript:'):
-                     continue
-
-                # Check each platform
-                for platform, patterns in SOCIAL_MEDIA_PATTERNS.items():
-                    if platform in found_platforms: continue
-
-                    for pattern in patterns:
-                        match = re.search(pattern, href, re.IGNORECASE)
-                        if match:
-                            handle = match.group(1)
-
-                            # Basic validation
-                            if not handle or len(handle) < 2 or handle.lower() in [
-                                "sharer", "share", "intent", "tweet", "post", "view",
-                                "plugins", "login", "signup", "home", "search", "explore",
-                                "pages", "groups", "events", "ads", "about", "privacy", "terms"
-                            ] or '/' in handle:
-                                continue
-
-                            # Store the actual href found
-                            social_profiles[platform] = href
-                            found_platforms.add(platform)
-                            log.debug(f"Found social link via href: {platform} -> {href}")
-                            break # Next platform
-
-                    if platform in found_platforms:
-                        break # Move to next link element
-
-            except StaleElementReferenceException:
-                continue # Element disappeared
-            except Exception as e_inner:
-                log.debug(f"Inner error processing link: {href} - {e_inner}")
-
-
-        # Look for social media icons (often within links found above, but sometimes separate)
-        # Combine selectors for efficiency
-        icon_selectors = [
-            "i[class*='fa-facebook']", "i[class*='fa-twitter']", "i[class*='fa-instagram']",
-            "i[class*='fa-linkedin']", "i[class*='fa-youtube']", "i[class*='fa-pinterest']",
-            "i[class*='fa-tiktok']", "i[class*='fa-x-twitter']", # FontAwesome 6 for X
-            "[class*='social-icon']", "[class*='social-media']", "[class*='social-link']",
-             "svg[aria-label*='facebook']", "svg[aria-label*='twitter']", "svg[aria-label*='instagram']", # SVGs with labels
-             "svg[class*='facebook']", "svg[class*='twitter']", "svg[class*='instagram']" # SVGs with classes
-        ]
-        combined_selector = ", ".join(icon_selectors)
-
-        try:
-             icon_elements = driver.find_elements(By.CSS_SELECTOR, combined_selector)
-        except WebDriverException as e:
-             log.debug(f"Could not select icon elements: {e}")
-             icon_elements = []
-
-
-        for icon in icon_elements:
-             try:
-                # Try to find the parent link
-                parent_link = None
-                current_element = icon
-                for _ in range(4): # Look up to 4 levels up
-                    if current_element.tag_name == 'a':
-                         parent_link = current_element
-                         break
-                    # Need to use XPath to find parent in Selenium Python
-                    try:
-                         current_element = current_element.find_element(By.XPATH, "..")
-                    except NoSuchElementException:
-                         break # Reached top or detached element
-                if not parent_link:
-                     continue
-
-                href = parent_link.get_attribute("href")
-                if not href or not isinstance(href, str) or href in processed_hrefs:
-                     continue
+    # Plain links first, then links wrapping social icons (rejected handle words only apply to plain links)
+    candidates = [(href, True) for href in payload.get("links") or []] + [(href, False) for href in payload.get("iconLinks") or []]
+    for href, strict in candidates:
+        if not href or not isinstance(href, str) or href in processed_hrefs:
+            continue
 
-                href = href.strip()
-                processed_hrefs.add(href)
+        href = href.strip()
+        processed_hrefs.add(href) # Mark as processed
 
-                if not href or href.startswith('#') or href.startswith('mailto:') or href.startswith('tel:') or href.startswith('javascript:'):
-                     continue
+        if not href or href.startswith('#') or href.startswith('mailto:') or href.startswith('tel:') or href.startswith('javascript:'):
+             continue
 
-                # Check platforms again for this href
-                for platform, patterns in SOCIAL_MEDIA_PATTERNS.items():
-                     if platform in found_platforms: continue
-                     for pattern in patterns:
-                         match = re.search(pattern, href, re.IGNORECASE)
-                         if match:
-                             handle = match.group(1)
-                             if not handle or len(handle) < 2 or '/' in handle: continue
-
-                             social_profiles[platform] = href
-                             found_platforms.add(platform)
-                             log.debug(f"Found social link via icon parent: {platform} -> {href}")
-                             break
-                     if platform in found_platforms: break
-
-             except StaleElementReferenceException:
-                 continue
-             except Exception as e_inner:
-                 log.debug(f"Inner error processing icon element: {e_inner}")
+        # Check each platform (one combined scan per link)
+        for platform, handle, _ in social_link_matches(href):
+            if platform in found_platforms: continue
 
-    except WebDriverException as e:
-        log.debug(f"Selenium error extracting social media: {e}")
-    except Exception as e:
-        log.error(f"Unexpected error extracting social media with Selenium: {e}", exc_info=True)
+            # Basic validation
+            if not handle or len(handle) < 2 or '/' in handle or (strict and handle.lower() in SOCIAL_HANDLE_BLOCKLIST):
+                continue
 
+            social_profiles[platform] = href
+            found_platforms.add(platform)
+            log.debug(f"Found social link via {'href' if strict else 'icon parent'}: {platform} -> {href}")
+            break # Move to next link
 
     # Final check: Remove generic platform links if specific ones were found
     # e.g., if we have linkedin.com/company/xyz and linkedin.com, keep the specific one
@@ -1204,9 +2169,80 @@ def extract_social_media_selenium(driver: webdriver.Chrome) -> Dict[str, str]:
     return social_profiles
 
 
+def extract_social_media_selenium(driver: webdriver.Chrome, payload: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """Extract social media links using Selenium by checking links and icons.
+    Uses an existing page_payload() result when given, otherwise collects one."""
+    if payload is None:
+        payload = page_payload(driver)
+    return social_from_payload(payload)
+
+
 # ───────────────── Selenium Driver ───────────────────
-def make_driver(headless: bool, debug: bool = False) -> Optional[webdriver.Chrome]:
-    """Create a Selenium WebDriver instance with anti-detection measures."""
+class ResourceBlocker:
+    """Applies a BLOCK_PROFILES pattern list to Selenium sessions via CDP Network.setBlockedURLs.
+    Domains where a blocked render found nothing fall back to full loading for the rest of the run."""
+
+    def __init__(self, profile: str):
+        self.profile = profile
+        self.patterns = BLOCK_PROFILES[profile]
+        self.full_load: Set[str] = set()
+        self.lock = threading.Lock()
+
+    def blocking(self, domain: Optional[str]) -> bool:
+        return bool(self.patterns) and domain not in self.full_load
+
+    def fall_back(self, domain: str) -> bool:
+        """Load this domain in full from now on. True if it was being blocked, i.e. a retry may help."""
+        with self.lock:
+            if not self.patterns or domain in self.full_load: return False
+            self.full_load.add(domain)
+        log.info(f"Resource blocking disabled for {domain}, loading its pages in full.")
+        return True
+
+    def setup(self, driver: webdriver.Chrome):
+        """Enable the Network domain once per driver so blocked URL lists take effect."""
+        if not self.patterns: return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            self.apply(driver, None)
+        except WebDriverException as e:
+            log.warning(f"Could not enable resource blocking ({self.profile}): {e}")
+
+    def apply(self, driver: webdriver.Chrome, domain: Optional[str]):
+        """Set the blocked URL list for the next navigation; skipped when the driver already has it."""
+        if not self.patterns: return
+        wanted = self.patterns if self.blocking(domain) else []
+        if getattr(driver, "_blocked_urls", None) is wanted: return
+        try:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": wanted})
+            driver._blocked_urls = wanted
+        except WebDriverException as e:
+            log.debug(f"Could not update blocked URLs for {domain}: {e}")
+
+resource_blocker: Optional[ResourceBlocker] = None # Created in main() from --block-profile
+
+
+# Injected into every new document (and every pooled tab) to hide common automation tells
+STEALTH_SCRIPT = """
+    // General Webdriver Spoofing
+    Object.defineProperty(navigator, 'webdriver', { get: () => false });
+    Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+    Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3] }); // Minimal plugin spoof
+
+    // Chrome Specific Spoofing
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+        Promise.resolve({ state: Notification.permission }) :
+        originalQuery(parameters)
+    );
+    // Remove 'chrome' object if it causes issues (might break some sites)
+    // delete window.chrome;
+"""
+
+def make_driver(headless: bool, debug: bool = False, tabbed: bool = False) -> Optional[webdriver.Chrome]:
+    """Create a Selenium WebDriver instance with anti-detection measures.
+    tabbed: the driver hosts several concurrently loading tabs (TabPool), so get() must not block."""
     ua = random.choice(UA_POOL)
     log.debug(f"Using User-Agent: {ua}")
 
@@ -1242,7 +2278,24 @@ def make_driver(headless: bool, debug: bool = False) -> Optional[webdriver.Chrom
     opt.add_argument("--disable-webgl")
     opt.add_argument("--disable-3d-apis")
     opt.add_argument("--disable-software-rasterizer")
-    opt.page_load_strategy = 'normal' # 'eager' can sometimes miss dynamically loaded content
+    opt.page_load_strategy = PAGE_LOAD_STRATEGY # 'eager'/'none' return sooner but can miss late content
+    if tabbed:
+        # BrowserTab waits for readyState itself; chromedriver must not block the shared session on a load
+        opt.page_load_strategy = 'none'
+        # Tabs load in the background while another one is "active"; don't let Chrome throttle them
+        opt.add_argument("--disable-background-timer-throttling")
+        opt.add_argument("--disable-backgrounding-occluded-windows")
+        opt.add_argument("--disable-renderer-backgrounding")
+    if resource_blocker and resource_blocker.patterns:
+        # Deny permission prompts and autoplay outright; subresources are blocked per domain via CDP
+        opt.add_argument("--mute-audio")
+        opt.add_argument("--autoplay-policy=user-gesture-required")
+        opt.add_experimental_option("prefs", {
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.default_content_setting_values.geolocation": 2,
+            "profile.default_content_setting_values.media_stream": 2,
+            "profile.default_content_setting_values.automatic_downloads": 2,
+        })
 
     # Try creating the driver
     drv = None
@@ -1253,30 +2306,15 @@ def make_driver(headless: bool, debug: bool = False) -> Optional[webdriver.Chrom
         # Apply stealth settings via CDP (after driver creation)
         # Using try/except for each CDP command in case one fails
         try:
-            drv.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": """
-                    // General Webdriver Spoofing
-                    Object.defineProperty(navigator, 'webdriver', { get: () => false });
-                    Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-                    Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3] }); // Minimal plugin spoof
-
-                    // Chrome Specific Spoofing
-                    const originalQuery = window.navigator.permissions.query;
-                    window.navigator.permissions.query = (parameters) => (
-                        parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                    );
-                    // Remove 'chrome' object if it causes issues (might break some sites)
-                    // delete window.chrome;
-                 """
-             })
+            drv.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_SCRIPT})
             log.debug("CDP stealth script injected.")
         except Exception as e:
             log.warning(f"Failed to inject CDP stealth script: {e}")
 
+        if resource_blocker: resource_blocker.setup(drv)
+
         # Set timeouts
-        drv.set_page_load_timeout(30) # Increased page load timeout
+        drv.set_page_load_timeout(PAGE_LOAD_TIMEOUT) # Lowered per page by selenium_extract near a site's budget
         drv.set_script_timeout(15) # Timeout for execute_script
         drv.implicitly_wait(3) # Small implicit wait can help with timing issues
 
@@ -1301,168 +2339,751 @@ def make_driver(headless: bool, debug: bool = False) -> Optional[webdriver.Chrom
             except: pass
         return None
 
-# ───────────────── Cookie/Popup Handling ───────────────────
-def dismiss_cookie_consent(driver: webdriver.Chrome, debug: bool = False) -> bool:
-    """Attempt to dismiss cookie consent popups using multiple strategies."""
-    if not is_driver_alive(driver): return False
 
-    strategies_attempted = 0
-    strategies_succeeded = 0
+def reset_driver_state(driver: webdriver.Chrome) -> bool:
+    """Clear cookies, storage and extra tabs so the next site starts clean.
+    Returns False if the driver could not be reset and should be discarded."""
+    try:
+        # Close any tabs/popups the previous site opened, keep the first one
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Clear storage for the current origin before leaving it
+        try:
+            driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+        except WebDriverException:
+            pass
+        driver.delete_all_cookies()
+        # Wipe cache/storage for all origins (cookies above only cover the current one in some builds)
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"})
+        except Exception as e_cdp:
+            log.debug(f"CDP storage clear failed (continuing): {e_cdp}")
 
-    # Wait a short moment for popups to potentially appear
-    time.sleep(random.uniform(1.0, 2.0))
+        driver.get("about:blank")
+        return True
+    except (InvalidSessionIdException, WebDriverException) as e:
+        log.debug(f"Could not reset driver state: {e}")
+        return False
+    except Exception as e:
+        log.debug(f"Unexpected error resetting driver state: {e}")
+        return False
 
-    # --- Strategy 1: Find buttons by common text/ID/class ---
-    try:
-        strategies_attempted += 1
-        # Combine XPaths for efficiency
-        xpath_parts = []
-        for pattern in COOKIE_BUTTON_PATTERNS:
-             # Case-insensitive text match (covers text(), value, aria-label)
-             xpath_parts.append(f"contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{pattern}')")
-             xpath_parts.append(f"contains(translate(@value, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{pattern}')")
-             xpath_parts.append(f"contains(translate(@aria-label, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{pattern}')")
-             # Match IDs and classes (case-sensitive for IDs, usually lower for classes)
-             xpath_parts.append(f"@id='{pattern}'")
-             xpath_parts.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {pattern} ')")
 
+class BrowserBackend(abc.ABC):
+    """What harvest_emails renders pages through. Worker threads lease a page handle for one
+    site with acquire() (blocking while the backend is at capacity), load and extract pages
+    with extract(), and hand it back with release().
 
-        # Find potential buttons (limit search depth?)
-        # Prioritize buttons and elements with explicit roles
-        xpath_query = f"//button[{' or '.join(xpath_parts)}] | //*[@role='button' and ({' or '.join(xpath_parts)})] | //a[{' or '.join(xpath_parts)}]"
+    Implementations: DriverPool (a Selenium driver per site), TabPool (Selenium tabs sharing
+    browsers) and CdpBackend (DevTools protocol from one asyncio loop). extract() returns the
+    same (emails with context, PAGE_EXTRACT_JS payload) for all of them.
+    """
 
+    @abc.abstractmethod
+    def acquire(self) -> Any:
+        raise NotImplementedError
 
-        # log.debug(f"Cookie button XPath: {xpath_query}") # Very verbose
-        potential_buttons = driver.find_elements(By.XPATH, xpath_query)
-        log.debug(f"Found {len(potential_buttons)} potential cookie buttons via XPath.")
+    @abc.abstractmethod
+    def release(self, page: Any, recycle: bool = False):
+        raise NotImplementedError
 
+    @abc.abstractmethod
+    def extract(self, page: Any, url: str, debug: bool = False,
+                deadline: Optional[float] = None) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        raise NotImplementedError
 
-        clicked = False
-        for element in potential_buttons:
-            try:
-                 # Check visibility and interactability robustly
-                 if element.is_displayed() and element.is_enabled():
-                     # Get text/id/class for logging
-                     el_text = (element.text or "").strip().lower()
-                     el_id = element.get_attribute("id") or ""
-                     el_class = element.get_attribute("class") or ""
-                     log.debug(f"Attempting to click cookie button. Text:'{el_text}', ID:'{el_id}', Class:'{el_class}'")
-                     # Try JS click first - sometimes bypasses overlays
-                     try:
-                         driver.execute_script("arguments[0].click();", element)
-                         log.debug("Clicked cookie button using JavaScript.")
-                     except WebDriverException:
-                         # Fallback to Selenium click
-                         log.debug("JS click failed, trying Selenium click.")
-                         element.click()
-                         log.debug("Clicked cookie button using Selenium.")
-
-                     time.sleep(random.uniform(0.5, 1.0)) # Wait for banner to disappear
-                     strategies_succeeded += 1
-                     clicked = True
-                     break # Assume one click is enough
-            except (ElementNotInteractableException, StaleElementReferenceException, ElementClickInterceptedException) as e_click:
-                 log.debug(f"Button found but not interactable: {e_click}")
-                 continue
-            except WebDriverException as e_wd:
-                 log.debug(f"WebDriverException clicking button: {e_wd}")
-                 continue # Try next button
-            except Exception as e_unexp:
-                 log.error(f"Unexpected error clicking cookie button: {e_unexp}", exc_info=debug)
-                 continue # Try next button
-
-        if clicked: return True # Success from Strategy 1
+    @abc.abstractmethod
+    def alive(self, page: Any) -> bool:
+        raise NotImplementedError
 
-    except WebDriverException as e:
-        log.debug(f"WebDriverException during cookie button search: {e}")
-    except Exception as e:
-         log.error(f"Unexpected error in cookie strategy 1: {e}", exc_info=debug)
+    def trim(self, keep: int):
+        """Drop idle browser resources after concurrency was lowered (optional)."""
 
+    @abc.abstractmethod
+    def close_all(self):
+        raise NotImplementedError
 
-    # --- Strategy 2: Look for iframes ---
-    try:
-        strategies_attempted += 1
-        iframes = driver.find_elements(By.TAG_NAME, "iframe")
-        log.debug(f"Found {len(iframes)} iframes.")
-        for iframe in iframes:
-            try:
-                 iframe_id = iframe.get_attribute("id") or ""
-                 iframe_src = iframe.get_attribute("src") or ""
-                 iframe_title = iframe.get_attribute("title") or ""
-
-                 # Check if it looks like a cookie consent iframe
-                 if any(term in iframe_id.lower() or term in iframe_src.lower() or term in iframe_title.lower()
-                        for term in ["cookie", "consent", "privacy", "gdpr", "cmp", "onetrust", "trustarc", "banner"]):
-
-                     log.debug(f"Switching to potential consent iframe: ID='{iframe_id}', Title='{iframe_title}', Src='{iframe_src[:100]}...'")
-                     driver.switch_to.frame(iframe)
-
-                     # Recursively call dismiss function inside the iframe
-                     if dismiss_cookie_consent(driver, debug):
-                         log.debug("Cookie consent dismissed within iframe.")
-                         driver.switch_to.default_content()
-                         strategies_succeeded += 1
-                         return True # Success
-
-                     # Switch back if recursive call didn't succeed
-                     driver.switch_to.default_content()
-                     log.debug("Switched back from iframe.")
-
-            except NoSuchElementException:
-                log.debug("Iframe disappeared before switching.")
-                driver.switch_to.default_content() # Ensure we are back
-                continue
-            except WebDriverException as e_iframe:
-                log.warning(f"Error processing iframe: {e_iframe}")
-                try:
-                     driver.switch_to.default_content() # Attempt to switch back safely
-                except WebDriverException:
-                     log.error("Failed to switch back from iframe, driver state might be unstable.")
-                     # Consider restarting driver or marking site as failed
-                     return False
-                continue
-            except Exception as e_unexp_iframe:
-                 log.error(f"Unexpected error with iframe: {e_unexp_iframe}", exc_info=debug)
-                 try:
-                     driver.switch_to.default_content()
-                 except WebDriverException: pass
-                 continue
 
-    except WebDriverException as e:
-        log.debug(f"WebDriverException finding iframes: {e}")
-    except Exception as e:
-         log.error(f"Unexpected error in cookie strategy 2 (iframes): {e}", exc_info=debug)
+class DriverPool(BrowserBackend):
+    """Bounded, thread-safe pool of warm Chrome drivers shared by worker threads.
 
+    Workers lease a driver with acquire() and hand it back with release().
+    Drivers are health-checked on lease, reset between sites and recycled
+    after max_uses sites or as soon as they die.
+    """
 
-    # --- Strategy 3: Press Escape key --- (Less reliable)
-    # try:
-    #     strategies_attempted += 1
-    #     log.debug("Trying Escape key...")
-    #     ActionChains(driver).send_keys(Keys.ESCAPE).perform()
-    #     time.sleep(0.5)
-    #     # How to verify success? Difficult. Assume it might work sometimes.
-    #     # strategies_succeeded += 1 # Don't increment success unless verified
-    #     # return True
-    # except WebDriverException as e:
-    #      log.debug(f"Error sending Escape key: {e}")
-    # except Exception as e:
-    #      log.error(f"Unexpected error sending ESC: {e}", exc_info=debug)
+    def __init__(self, size: int, headless: bool, debug: bool = False, max_uses: int = DRIVER_MAX_USES):
+        self.size = max(1, size)
+        self.headless = headless
+        self.debug = debug
+        self.max_uses = max(1, max_uses)
+        self._idle: List[webdriver.Chrome] = []
+        self._uses: Dict[int, int] = {}
+        self._live: Set[webdriver.Chrome] = set()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._closed = False
+
+    def acquire(self) -> Optional[webdriver.Chrome]:
+        """Lease a healthy driver, creating one if none are idle. Blocks while the pool is exhausted."""
+        self._slots.acquire()
+        driver = None
+        try:
+            while True:
+                with self._lock:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is closed")
+                    driver = self._idle.pop() if self._idle else None
+                if driver is None:
+                    break
+                if is_driver_alive(driver):
+                    return driver
+                log.debug("Discarding dead pooled driver.")
+                self._discard(driver)
+                driver = None
+
+            driver = make_driver(self.headless, self.debug)
+            if driver is None:
+                self._slots.release()
+                return None
+            with self._lock:
+                self._live.add(driver)
+                self._uses[id(driver)] = 0
+            log.debug(f"Driver pool: created new driver ({len(self._live)}/{self.size} live)")
+            return driver
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, driver: Optional[webdriver.Chrome], recycle: bool = False):
+        """Return a leased driver. It is quit instead of pooled if it is dead,
+        worn out, failed to reset, or the caller asked for a recycle."""
+        if driver is None:
+            return
+        try:
+            with self._lock:
+                uses = self._uses.get(id(driver), 0) + 1
+                self._uses[id(driver)] = uses
+                closed = self._closed
+
+            if recycle or closed or uses >= self.max_uses:
+                log.debug(f"Recycling driver after {uses} sites (recycle={recycle}).")
+                self._discard(driver)
+            elif not is_driver_alive(driver) or not reset_driver_state(driver):
+                log.debug("Driver unhealthy after use, discarding.")
+                self._discard(driver)
+            else:
+                with self._lock:
+                    self._idle.append(driver)
+        finally:
+            self._slots.release()
 
+    def extract(self, driver: webdriver.Chrome, url: str, debug: bool = False,
+                deadline: Optional[float] = None) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        return selenium_extract(driver, url, debug, deadline)
 
-    # --- Strategy 4: Remove overlay elements via JavaScript --- (Aggressive)
-    # try:
-    #     strategies_attempted += 1
-    #     log.debug("Trying to remove potential overlays via JS...")
-    #     script = """
-    #         const overlaySelectors = [
-    #             '.modal', '.overlay', '.cookie-banner', '.cookie-consent',
-    #             '.gdpr-banner', '.consent-banner', '#cookie-notice', '#gdpr-consent',
-    #             '[id*="consent"]', '[class*="consent"]', '[id*="cookie"]', '[class*="cookie"]',
-    #             'div[style*="position: fixed"][style*="z-index"]' // Fixed divs with high z-index
-    #         ];
-    #         let removedCount = 0;
-    #         overlaySelectors.forEach(selector => {
-    #             try {
+    def alive(self, driver: Optional[webdriver.Chrome]) -> bool:
+        return is_driver_alive(driver)
+
+    def _discard(self, driver: webdriver.Chrome):
+        """Quit a driver and forget about it."""
+        with self._lock:
+            self._live.discard(driver)
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e_quit:
+            log.debug(f"Error quitting pooled driver: {e_quit}")
+
+    def trim(self, keep: int):
+        """Quit idle drivers until at most keep are alive (after concurrency was lowered)."""
+        while True:
+            with self._lock:
+                if len(self._live) <= keep or not self._idle:
+                    return
+                driver = self._idle.pop(0)
+            log.debug("Driver pool: quitting idle driver after concurrency decrease.")
+            self._discard(driver)
+
+    def close_all(self):
+        """Quit every driver the pool created. Leased drivers are quit on release."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+        with self._lock:
+            remaining = list(self._live)
+        if remaining:
+            log.info(f"Driver pool: quitting {len(remaining)} driver(s) still leased.")
+            for driver in remaining:
+                self._discard(driver)
+        log.info("Driver pool closed.")
+
+
+class BrowserHost:
+    """One Chrome instance shared by several BrowserTabs. The WebDriver session has a single
+    active window, so commands are serialised by the lock; page loads still run in parallel."""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.lock = threading.RLock()
+        self.anchor = driver.current_window_handle # Blank tab that keeps the browser open between sites
+        self.current: Optional[str] = self.anchor
+        self.tabs = 0 # Leased tabs (including ones being opened)
+        self.uses = 0
+        self.retiring = False # No new tabs; quit once the last one is released
+
+    def focus(self, handle: str):
+        """Make handle the session's active window. Caller holds the lock."""
+        if self.current != handle:
+            self.current = None # Unknown if the switch fails half way
+            self.driver.switch_to.window(handle)
+            self.current = handle
+
+    def open_tab(self) -> "BrowserTab":
+        with self.lock:
+            self.driver.switch_to.new_window('tab')
+            self.current = self.driver.current_window_handle
+            tab = BrowserTab(self, self.current)
+            # Init scripts and request blocking are per target, so every new tab needs its own
+            try:
+                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_SCRIPT})
+            except WebDriverException as e:
+                log.debug(f"Failed to inject stealth script into new tab: {e}")
+            if resource_blocker: resource_blocker.setup(tab)
+        return tab
+
+    def close_tab(self, tab: "BrowserTab") -> bool:
+        """Clear the storage of every origin the tab visited and close it. False if the browser misbehaved."""
+        with self.lock:
+            try:
+                self.focus(tab.handle)
+                tab.note_origins()
+                for origin in tab.origins:
+                    # Only what this site touched (redirect hops and third parties included):
+                    # other tabs of the browser are still working
+                    self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+                self.driver.close()
+                self.current = None
+                self.focus(self.anchor)
+                return True
+            except WebDriverException as e:
+                log.debug(f"Could not close tab cleanly: {e}")
+                return False
+
+
+class BrowserTab:
+    """A tab of a shared BrowserHost, usable wherever a webdriver.Chrome is expected.
+
+    Every command focuses the tab first under the host lock. get() only starts the
+    navigation and polls readyState between other tabs' commands, so the browser
+    loads several sites at once. Multi-command sequences that depend on the active
+    frame (clicking inside a consent iframe) run inside exclusive().
+    """
+
+    def __init__(self, host: BrowserHost, handle: str):
+        self.host = host
+        self.handle = handle
+        self.page_load_timeout = PAGE_LOAD_TIMEOUT
+        self.origins: Set[str] = set() # Everything this tab's visits touched, cleared by close_tab
+
+    def note_origins(self, url: Optional[str] = None):
+        """Remember the origins of a visit: the requested URL (first redirect hop), the final page and its subresources."""
+        parsed = urllib.parse.urlparse(url or "")
+        if parsed.scheme in ("http", "https") and parsed.netloc:
+            self.origins.add(f"{parsed.scheme}://{parsed.netloc}")
+        try:
+            with self.exclusive() as driver:
+                found = driver.execute_script(TAB_ORIGINS_JS) or []
+        except WebDriverException as e:
+            log.debug(f"Could not list the origins of a tab: {e}")
+            return
+        self.origins.update(o for o in found if o and o.startswith("http"))
+
+    @contextlib.contextmanager
+    def exclusive(self):
+        with self.host.lock:
+            self.host.focus(self.handle)
+            yield self.host.driver
+
+    def __getattr__(self, name: str):
+        # Proxy everything else to the shared driver, focused on this tab. Private per-driver
+        # bookkeeping (_blocked_urls, _page_load_timeout) belongs to the tab, not the browser.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if callable(getattr(type(self.host.driver), name, None)):
+            def call(*args, **kwargs):
+                with self.exclusive() as driver:
+                    return getattr(driver, name)(*args, **kwargs)
+            return call
+        with self.exclusive() as driver:
+            return getattr(driver, name)
+
+    def set_page_load_timeout(self, seconds: float):
+        self.page_load_timeout = seconds
+
+    def get(self, url: str):
+        """Navigate without holding the session, then wait for the configured load state."""
+        ready = ("complete",) if PAGE_LOAD_STRATEGY == "normal" else ("interactive", "complete")
+        with self.exclusive() as driver:
+            # Mark the old document so its readyState isn't mistaken for the new page's
+            driver.execute_script("window.__gmbStale = true;")
+            driver.get(url) # Returns as soon as navigation starts (pageLoadStrategy none)
+        deadline = time.time() + self.page_load_timeout
+        while time.time() < deadline:
+            with self.exclusive() as driver:
+                state = driver.execute_script("return window.__gmbStale ? 'stale' : document.readyState;")
+            if state in ready:
+                self.note_origins(url)
+                return
+            time.sleep(TAB_POLL_INTERVAL)
+        with self.exclusive() as driver:
+            driver.execute_script("window.stop();") # Keep what loaded, like a normal page load timeout
+        self.note_origins(url)
+        raise TimeoutException(f"Tab page load timed out after {self.page_load_timeout:.0f}s")
+
+
+def driver_exclusive(driver: Union[webdriver.Chrome, BrowserTab]):
+    """Hold a shared browser for a multi-command sequence; a no-op for a dedicated driver."""
+    return driver.exclusive() if isinstance(driver, BrowserTab) else contextlib.nullcontext(driver)
+
+
+class TabPool(DriverPool):
+    """DriverPool that leases tabs instead of whole browsers: up to tabs_per_browser sites
+    share one Chrome instance, cutting memory per concurrent page several times.
+    size is still the number of concurrent leases (tabs)."""
+
+    def __init__(self, size: int, tabs_per_browser: int, headless: bool, debug: bool = False,
+                 max_uses: int = DRIVER_MAX_USES):
+        super().__init__(size, headless, debug, max_uses)
+        self.tabs_per_browser = max(1, tabs_per_browser)
+        self._hosts: List[BrowserHost] = []
+        self._create_lock = threading.Lock() # Threads starting together fill one browser, not one each
+
+    def _reserve(self) -> Optional[BrowserHost]:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Driver pool is closed")
+            host = next((h for h in self._hosts if not h.retiring and h.tabs < self.tabs_per_browser), None)
+            if host:
+                host.tabs += 1
+            return host
+
+    def acquire(self) -> Optional[BrowserTab]:
+        """Lease a new tab in a browser with room, starting another browser if all are full."""
+        self._slots.acquire()
+        try:
+            for attempt in range(2):
+                with self._create_lock:
+                    host = self._reserve()
+                    if host is None:
+                        driver = make_driver(self.headless, self.debug, tabbed=True)
+                        if driver is None:
+                            self._slots.release()
+                            return None
+                        host = BrowserHost(driver)
+                        host.tabs = 1
+                        with self._lock:
+                            self._hosts.append(host)
+                            browsers = len(self._hosts)
+                        log.debug(f"Tab pool: started browser {browsers} ({self.tabs_per_browser} tabs each)")
+                try:
+                    return host.open_tab()
+                except WebDriverException as e:
+                    log.debug(f"Could not open a tab, retiring its browser: {e}")
+                    self._finish(host, retire=True)
+            self._slots.release()
+            return None
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, tab: Optional[BrowserTab], recycle: bool = False):
+        """Close a leased tab. Its browser is retired if the tab misbehaved, recycle was asked
+        for or it has served max_uses sites per tab slot, and quit when its last tab is gone."""
+        if tab is None:
+            return
+        try:
+            closed_ok = tab.host.close_tab(tab)
+            self._finish(tab.host, retire=recycle or not closed_ok, used=True)
+        finally:
+            self._slots.release()
+
+    def _finish(self, host: BrowserHost, retire: bool, used: bool = False):
+        with self._lock:
+            host.tabs -= 1
+            host.uses += used
+            if retire or self._closed or host.uses >= self.max_uses * self.tabs_per_browser:
+                host.retiring = True
+            quit_now = host.retiring and host.tabs == 0 and host in self._hosts
+            if quit_now:
+                self._hosts.remove(host)
+        if quit_now:
+            log.debug(f"Tab pool: quitting browser after {host.uses} sites.")
+            self._quit(host)
+
+    def _quit(self, host: BrowserHost):
+        try:
+            host.driver.quit()
+        except Exception as e_quit:
+            log.debug(f"Error quitting pooled browser: {e_quit}")
+
+    def trim(self, keep: int):
+        """Quit idle browsers beyond what keep concurrent tabs need."""
+        needed = -(-max(0, keep) // self.tabs_per_browser)
+        while True:
+            with self._lock:
+                idle = [h for h in self._hosts if h.tabs == 0]
+                if len(self._hosts) <= needed or not idle:
+                    return
+                host = idle[0]
+                self._hosts.remove(host)
+            log.debug("Tab pool: quitting idle browser after concurrency decrease.")
+            self._quit(host)
+
+    def close_all(self):
+        """Quit every browser, including ones with tabs still leased."""
+        with self._lock:
+            self._closed = True
+            hosts, self._hosts = self._hosts, []
+        if hosts:
+            log.info(f"Tab pool: quitting {len(hosts)} browser(s).")
+        for host in hosts:
+            self._quit(host)
+        log.info("Driver pool closed.")
+
+
+class DriverLease:
+    """Leases a pooled driver (or another backend's page) lazily, the first time a site actually needs a browser."""
+
+    def __init__(self, pool: BrowserBackend):
+        self.pool = pool
+        self.driver: Optional[webdriver.Chrome] = None
+        self.recycle = False
+        self.failed = False # Don't keep retrying Chrome startup for the same site
+
+    def get(self) -> webdriver.Chrome:
+        if self.driver is None:
+            if not self.failed:
+                self.driver = self.pool.acquire()
+            if self.driver is None:
+                self.failed = True
+                raise WebDriverException("Driver creation failed")
+        return self.driver
+
+    def release(self):
+        if self.driver is not None:
+            self.pool.release(self.driver, recycle=self.recycle)
+            self.driver = None
+
+# ───────────────── Cookie/Popup Handling ───────────────────
+class ConsentMemo:
+    """Per-domain memo of what dismissed the consent banner last time, persisted as JSON.
+    Entries: {"strategy": "none"} (no banner), {"strategy": "button", "selector": css}
+    or {"strategy": "iframe", "frame": css, "selector": css}; each stamped with "ts".
+    "none" entries expire after none_ttl_seconds, the others after ttl_seconds."""
+
+    def __init__(self, path: str, ttl_seconds: float, none_ttl_seconds: float):
+        self.path = path
+        self.ttl = ttl_seconds
+        self.none_ttl = none_ttl_seconds
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = self._read()
+        self.dirty = False
+        log.info(f"Consent memo: {len(self.entries)} known domains from {path}")
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable consent memo {self.path}: {e}")
+            return {}
+
+    def _fresh(self, entry: Dict[str, Any], now: float) -> bool:
+        ttl = self.none_ttl if entry.get("strategy") == "none" else self.ttl
+        return now - entry.get("ts", 0) <= ttl
+
+    def get(self, domain: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            entry = self.entries.get(domain)
+        if entry and self._fresh(entry, time.time()):
+            return entry
+        return None
+
+    def record(self, domain: str, outcome: Dict[str, Any]):
+        with self.lock:
+            self.entries[domain] = dict(outcome, ts=time.time())
+            self.dirty = True
+
+    def forget(self, domain: str):
+        with self.lock:
+            if self.entries.pop(domain, None) is not None:
+                self.dirty = True
+
+    def save(self):
+        """Merge with whatever other workers wrote (newest entry wins) and replace the file atomically."""
+        with self.lock:
+            if not self.dirty: return
+            merged = self._read()
+            for domain, entry in self.entries.items():
+                if entry.get("ts", 0) >= merged.get(domain, {}).get("ts", 0):
+                    merged[domain] = entry
+            now = time.time()
+            merged = {d: e for d, e in merged.items() if self._fresh(e, now)}
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(merged, f)
+                os.replace(tmp, self.path)
+                self.entries, self.dirty = merged, False
+            except OSError as e:
+                log.warning(f"Could not save consent memo {self.path}: {e}")
+
+consent_memo: Optional[ConsentMemo] = None # Opened in main() unless --no-cache
+
+
+def click_consent_button(driver: webdriver.Chrome, selector: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Run CONSENT_MATCHER_JS (optionally restricted to a memoised selector) and wait for the
+    clicked button to go away. Returns {"selector": ...} on a click, None if nothing matched."""
+    try:
+        hit = driver.execute_script(CONSENT_MATCHER_JS, selector)
+    except WebDriverException as e:
+        log.debug(f"Consent matcher failed: {e}")
+        return None
+    if not hit: return None
+    log.debug(f"Clicked cookie button '{hit.get('selector')}' via consent matcher.")
+    # Wait for the button (and with it the banner) to go away, not a fixed pause. One short
+    # script per poll, so a shared browser serves its other tabs in between
+    try:
+        WebDriverWait(driver, CONSENT_CLOSE_TIMEOUT, poll_frequency=0.1).until(lambda d: d.execute_script(CONSENT_GONE_JS))
+    except TimeoutException:
+        log.debug("Cookie button still visible after click, continuing anyway.")
+    except WebDriverException:
+        pass # Navigated away or element gone: either way the banner is handled
+    return {"selector": hit.get("selector")}
+
+
+def replay_consent(driver: webdriver.Chrome, known: Dict[str, Any]) -> bool:
+    """Repeat a memoised consent action; False if it no longer applies on this page."""
+    if known.get("strategy") == "button":
+        return click_consent_button(driver, known.get("selector")) is not None
+    if known.get("strategy") == "iframe" and known.get("frame"):
+        # Frame switching is per session: a shared browser stays on this tab until we are back out
+        with driver_exclusive(driver) as d:
+            try:
+                frames = d.find_elements(By.CSS_SELECTOR, known["frame"])
+                if not frames: return False
+                d.switch_to.frame(frames[0])
+                try:
+                    return click_consent_button(d, known.get("selector")) is not None
+                finally:
+                    d.switch_to.default_content()
+            except WebDriverException as e:
+                log.debug(f"Replaying iframe consent action failed: {e}")
+                try: d.switch_to.default_content()
+                except WebDriverException: pass
+    return False
+
+
+def css_attr_selector(tag: str, attr: str, value: str) -> str:
+    """tag[attr="value"] with value escaped as a CSS string (quotes, backslashes, newlines)."""
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\a ').replace('\r', '\\d ')
+    return f'{tag}[{attr}="{escaped}"]'
+
+
+def wait_for_consent_banner(driver: webdriver.Chrome) -> Tuple[bool, bool]:
+    """(banner visible, settled): wait until a banner shows up, or the document has been loaded
+    for CONSENT_SETTLE_TIMEOUT without one. CMP scripts often inject it after the load event,
+    and with the "normal" strategy get() only returns once the page is complete. settled is
+    False when the page was still loading at the timeout or the probe failed."""
+    state = {"ready": "complete", "banner": True}
+    loaded_at: Optional[float] = None
+    def banner_or_settled(d):
+        nonlocal state, loaded_at
+        state = d.execute_script(CONSENT_BANNER_JS) or state
+        if state["banner"]: return True
+        if state["ready"] != "complete": return False
+        loaded_at = loaded_at or time.time()
+        return time.time() - loaded_at >= CONSENT_SETTLE_TIMEOUT
+    try:
+        WebDriverWait(driver, CONSENT_APPEAR_TIMEOUT + CONSENT_SETTLE_TIMEOUT, poll_frequency=0.1).until(banner_or_settled)
+    except TimeoutException:
+        return state["banner"], False # Still loading: go by whatever is there now
+    except WebDriverException as e:
+        log.debug(f"Consent banner probe failed, trying full dismissal: {e}")
+        return True, False
+    return state["banner"], True
+
+
+def dismiss_cookie_consent(driver: webdriver.Chrome, debug: bool = False, domain: Optional[str] = None) -> bool:
+    """Dismiss a cookie consent popup, reusing what worked earlier on the same domain.
+    Domains memoised as banner-free skip the consent work entirely."""
+    if not is_driver_alive(driver): return False
+
+    known = consent_memo.get(domain) if consent_memo and domain else None
+    if known:
+        if known.get("strategy") == "none":
+            log.debug(f"No consent banner known for {domain}, skipping cookie dismissal.")
+            return False
+        # Banners are often injected after the load event: let it appear before replaying, or the replay misses it
+        banner = wait_for_consent_banner(driver)[0]
+        if replay_consent(driver, known):
+            log.debug(f"Consent banner on {domain} dismissed with memoised {known.get('strategy')} action.")
+            return True
+        if not banner:
+            # Usually the consent cookie from an earlier page of this site: the memo still holds
+            log.debug(f"No consent banner on this page of {domain}, keeping the memoised action.")
+            return False
+        log.debug(f"Memoised consent action for {domain} no longer applies, searching again.")
+        consent_memo.forget(domain)
+
+    outcome = find_consent_action(driver, debug)
+    memoise_consent(domain, outcome)
+    return bool(outcome) and outcome["strategy"] != "none"
+
+
+def memoise_consent(domain: Optional[str], outcome: Optional[Dict[str, Any]]):
+    """Record a find_consent_action() outcome in the consent memo. "none" only after a probe that
+    really watched the loaded page; iframe actions only when the frame can be found again."""
+    if not outcome or not consent_memo or not domain:
+        return
+    if outcome["strategy"] == "none":
+        if outcome.get("settled"):
+            consent_memo.record(domain, {"strategy": "none"})
+    elif outcome["strategy"] != "iframe" or outcome.get("frame"):
+        consent_memo.record(domain, outcome)
+
+
+def find_consent_action(driver: webdriver.Chrome, debug: bool = False, in_frame: bool = False) -> Optional[Dict[str, Any]]:
+    """Attempt to dismiss cookie consent popups using multiple strategies.
+    Returns a ConsentMemo entry describing what worked ({"strategy": "none", "settled": bool} if
+    there was no banner), or None if a banner may be present but nothing could dismiss it."""
+    if not is_driver_alive(driver): return None
+
+    strategies_attempted = 0
+    strategies_succeeded = 0
+
+    # Inside a consent iframe the banner *is* the document, so the probe below would not see it
+    if not in_frame:
+        # Wait for a banner instead of a fixed sleep; none on a settled page means nothing to dismiss
+        banner, settled = wait_for_consent_banner(driver)
+        if not banner:
+            log.debug("No consent banner present, skipping cookie dismissal.")
+            return {"strategy": "none", "settled": settled}
+
+    # --- Strategy 1: Find buttons by common text/ID/class ---
+    try:
+        strategies_attempted += 1
+        # One in-page pass with the compiled matcher instead of a huge XPath and per-element round trips
+        clicked = click_consent_button(driver)
+        if clicked:
+            strategies_succeeded += 1
+            return {"strategy": "button", "selector": clicked["selector"]} # Success from Strategy 1
+    except Exception as e:
+         log.error(f"Unexpected error in cookie strategy 1: {e}", exc_info=debug)
+
+
+    # --- Strategy 2: Look for iframes ---
+    # Switching frames is per session: a shared browser stays on this tab for the whole sequence
+    with driver_exclusive(driver) as session:
+        try:
+            strategies_attempted += 1
+            iframes = session.find_elements(By.TAG_NAME, "iframe")
+            log.debug(f"Found {len(iframes)} iframes.")
+            for iframe in iframes:
+                try:
+                     iframe_id = iframe.get_attribute("id") or ""
+                     iframe_src = iframe.get_attribute("src") or ""
+                     iframe_title = iframe.get_attribute("title") or ""
+
+                     # Check if it looks like a cookie consent iframe
+                     if any(term in iframe_id.lower() or term in iframe_src.lower() or term in iframe_title.lower()
+                            for term in CONSENT_FRAME_TERMS):
+
+                         log.debug(f"Switching to potential consent iframe: ID='{iframe_id}', Title='{iframe_title}', Src='{iframe_src[:100]}...'")
+                         session.switch_to.frame(iframe)
+
+                         # Recursively call dismiss function inside the iframe
+                         inner = find_consent_action(session, debug, in_frame=True)
+                         if inner and inner["strategy"] == "button":
+                             log.debug("Cookie consent dismissed within iframe.")
+                             session.switch_to.default_content()
+                             strategies_succeeded += 1
+                             # Only memoise frames we can find again by a stable attribute
+                             frame = (css_attr_selector("iframe", "id", iframe_id) if iframe_id else
+                                      css_attr_selector("iframe", "title", iframe_title) if iframe_title else
+                                      css_attr_selector("iframe", "src", iframe_src) if iframe_src else None)
+                             return {"strategy": "iframe", "frame": frame, "selector": inner["selector"]} # Success
+
+                         # Switch back if recursive call didn't succeed
+                         session.switch_to.default_content()
+                         log.debug("Switched back from iframe.")
+
+                except NoSuchElementException:
+                    log.debug("Iframe disappeared before switching.")
+                    session.switch_to.default_content() # Ensure we are back
+                    continue
+                except WebDriverException as e_iframe:
+                    log.warning(f"Error processing iframe: {e_iframe}")
+                    try:
+                         session.switch_to.default_content() # Attempt to switch back safely
+                    except WebDriverException:
+                         log.error("Failed to switch back from iframe, driver state might be unstable.")
+                         # Consider restarting driver or marking site as failed
+                         return None
+                    continue
+                except Exception as e_unexp_iframe:
+                     log.error(f"Unexpected error with iframe: {e_unexp_iframe}", exc_info=debug)
+                     try:
+                         session.switch_to.default_content()
+                     except WebDriverException: pass
+                     continue
+
+        except WebDriverException as e:
+            log.debug(f"WebDriverException finding iframes: {e}")
+        except Exception as e:
+             log.error(f"Unexpected error in cookie strategy 2 (iframes): {e}", exc_info=debug)
+
+
+    # --- Strategy 3: Press Escape key --- (Less reliable)
+    # try:
+    #     strategies_attempted += 1
+    #     log.debug("Trying Escape key...")
+    #     ActionChains(driver).send_keys(Keys.ESCAPE).perform()
+    #     time.sleep(0.5)
+    #     # How to verify success? Difficult. Assume it might work sometimes.
+    #     # strategies_succeeded += 1 # Don't increment success unless verified
+    #     # return True
+    # except WebDriverException as e:
+    #      log.debug(f"Error sending Escape key: {e}")
+    # except Exception as e:
+    #      log.error(f"Unexpected error sending ESC: {e}", exc_info=debug)
+
+
+    # --- Strategy 4: Remove overlay elements via JavaScript --- (Aggressive)
+    # try:
+    #     strategies_attempted += 1
+    #     log.debug("Trying to remove potential overlays via JS...")
+    #     script = """
+    #         const overlaySelectors = [
+    #             '.modal', '.overlay', '.cookie-banner', '.cookie-consent',
+    #             '.gdpr-banner', '.consent-banner', '#cookie-notice', '#gdpr-consent',
+    #             '[id*="consent"]', '[class*="consent"]', '[id*="cookie"]', '[class*="cookie"]',
+    #             'div[style*="position: fixed"][style*="z-index"]' // Fixed divs with high z-index
+    #         ];
+    #         let removedCount = 0;
+    #         overlaySelectors.forEach(selector => {
+    #             try {
     #                 document.querySelectorAll(selector).forEach(el => {
     #                     // Basic check to avoid removing the whole body if styles match
     #                     if (el.tagName !== 'BODY' && el.offsetHeight > 10 && el.offsetWidth > 10) {
@@ -1495,34 +3116,865 @@ def dismiss_cookie_consent(driver: webdriver.Chrome, debug: bool = False) -> boo
 
 
     log.debug(f"Cookie dismissal attempts finished. Succeeded: {strategies_succeeded}/{strategies_attempted}")
-    return strategies_succeeded > 0
+    return None
+
+
+# ───────────────── Static Page Parsing ───────────────────
+def looks_like_contact_url(url: str) -> bool:
+    """Heuristic: does this URL look like a contact/about page?"""
+    url = url.lower()
+    return any(p.strip('/') in url for p in CONTACT_PATHS if p != '/') or "contact" in url or "about" in url
+
+
+def parse_page(html_content: str, url: str, debug: bool = False) -> Dict[str, Any]:
+    """Parse a document once and extract everything the pipeline needs in one tree walk.
+
+    Returns a dict with:
+        emails:  [(email, context)] from text, mailto links, meta tags and source
+                 (attributes, comments, scripts), with header/footer context.
+        social:  {platform: url} social profile links.
+        anchors: [(href, text)] of every link, for contact page discovery.
+    """
+    page: Dict[str, Any] = {"url": url, "emails": [], "social": {}, "anchors": []}
+    if not html_content or not isinstance(html_content, str):
+        return page
+
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    is_contact_page = looks_like_contact_url(url)
+
+    text_parts: List[str] = [] # Visible text, as soup.get_text() would return it
+    source_parts: List[str] = [] # Non-visible bits that may hide emails (attributes, comments, scripts)
+    mailto_hits: List[Tuple[str, bool, bool]] = [] # (mailto address part, in_header, in_footer)
+    meta_contents: List[str] = []
+    found_platforms: Set[str] = set()
+
+    # Iterative walk: (node, in_header, in_footer, social_ttl). social_ttl > 0 means an
+    # ancestor within 3 levels has a social-looking class/id, as extract_social_media checks
+    stack: List[Tuple[Any, bool, bool, int]] = [(soup, False, False, 0)]
+    while stack:
+        node, in_header, in_footer, social_ttl = stack.pop()
+
+        if isinstance(node, NavigableString):
+            if type(node) in (NavigableString, CData):
+                text_parts.append(str(node))
+            elif '@' in node or 'at]' in node or 'at)' in node:
+                source_parts.append(str(node)) # Comment, script, style...
+            continue
+
+        name = node.name
+        attrs = node.attrs if name != '[document]' else {}
+        node_id = (attrs.get('id') or '')
+        node_id = node_id.lower() if isinstance(node_id, str) else ''
+        node_class = attrs.get('class') or []
+        node_class = (' '.join(node_class) if isinstance(node_class, list) else str(node_class)).lower()
+
+        for key, value in attrs.items():
+            value = ' '.join(value) if isinstance(value, list) else value
+            if isinstance(value, str) and '@' in value:
+                if name != 'a' or key != 'href' or not value.startswith('mailto:'):
+                    source_parts.append(value)
+                elif '?' in value:
+                    source_parts.append(value.split('?', 1)[1]) # cc=/bcc= addresses; the address part is a mailto hit
+
+        if name == 'a':
+            href = (attrs.get('href') or '').strip() if isinstance(attrs.get('href'), str) else ''
+            if href:
+                link_text = node.get_text(strip=True)
+                page["anchors"].append((href, " ".join(filter(None, [link_text, attrs.get('title'), attrs.get('aria-label')]))))
+                if href.startswith('mailto:'):
+                    mailto_hits.append((href.split('?')[0].replace('mailto:', '', 1), in_header, in_footer))
+                elif not href.startswith(('#', 'tel:')):
+                    match = match_social_link(href, link_text.lower(), (attrs.get('title') or '').lower(),
+                                              (attrs.get('aria-label') or '').lower(), social_ttl > 0, found_platforms)
+                    if match:
+                        page["social"][match[0]] = match[1]
+                        found_platforms.add(match[0])
+        elif name == 'meta':
+            content = attrs.get('content') or ''
+            if '@' in content:
+                meta_contents.append(content)
+
+        # Region flags inherited by descendants
+        child_header = in_header or name == 'header' or 'header' in node_id
+        child_footer = in_footer or name == 'footer' or 'footer' in node_id
+        if name not in ('body', '[document]') and any(k in node_class or k in node_id for k in SOCIAL_CONTEXT_KEYWORDS):
+            child_ttl = 3
+        else:
+            child_ttl = max(0, social_ttl - 1)
+        stack.extend((child, child_header, child_footer, child_ttl) for child in reversed(node.contents))
+
+    found_emails_with_context = page["emails"]
+    processed_emails: Set[str] = set()
+
+    def add(emails: List[str], context: Dict[str, Any]):
+        for email in emails:
+            if email not in processed_emails:
+                found_emails_with_context.append((email, dict(context, found_on_contact_page=is_contact_page)))
+                processed_emails.add(email)
+
+    # 1. Visible text
+    text_emails = emails_from_text(' '.join(text_parts))
+    add(text_emails, {"found_in_text": True})
+    if debug and text_emails: log.debug(f"Parse: Found {len(text_emails)} emails in visible text")
+
+    # 2. Mailto links, with header/footer context from the walk
+    for email_part, in_header, in_footer in mailto_hits:
+        add(emails_from_text(email_part), {"found_in_mailto": True, "found_in_header": in_header, "found_in_footer": in_footer})
+
+    # 3. Meta tags
+    for content in meta_contents:
+        add(emails_from_text(content), {"found_in_meta": True})
+
+    # 4. Source-only locations (attributes, comments, scripts) instead of rescanning the raw HTML
+    if source_parts:
+        add(emails_from_text(' '.join(source_parts)), {"found_in_source": True})
+
+    if debug and found_emails_with_context:
+        log.debug(f"Parse: Found {len(processed_emails)} unique emails total for {url}")
+    return page
+
+
+# ───────────────── Response Cache ───────────────────
+class ResponseCache:
+    """On-disk (SQLite) cache of static GET responses, shared across runs.
+
+    Entries younger than ttl are served without touching the network; older ones
+    are revalidated with If-None-Match/If-Modified-Since and a 304 just refreshes
+    them. Least recently used entries are evicted once the stored bodies pass max_bytes.
+    """
+    CACHEABLE_STATUSES = (200, 404, 410) # Missing pages are cached too, so contact path misses stay cheap
+
+    def __init__(self, cache_dir: str, ttl: float, max_bytes: int):
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        self.path = str(Path(cache_dir) / "responses.sqlite")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._writes_since_evict = 0
+        # One connection shared by all threads (guarded by self.lock); WAL lets other processes read
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("""CREATE TABLE IF NOT EXISTS responses (
+                                     url TEXT PRIMARY KEY, final_url TEXT, status INTEGER, content_type TEXT,
+                                     headers TEXT, body TEXT, etag TEXT, last_modified TEXT,
+                                     fetched_at REAL, last_access REAL, size INTEGER)""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+            self.conn.commit()
+        log.info(f"Response cache at {self.path} (TTL {ttl/3600:.1f}h, max {max_bytes // (1024*1024)} MB)")
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for url (with a "fresh" flag), or None."""
+        return self.lookup_many([url]).get(url)
+
+    def lookup_many(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Cached entries (with a "fresh" flag) for whichever of urls are cached, read in one transaction."""
+        now = time.time()
+        rows = []
+        try:
+            with self.lock:
+                for start in range(0, len(urls), 500): # Stay under SQLite's bound parameter limit
+                    chunk = urls[start:start + 500]
+                    rows += self.conn.execute("SELECT url, final_url, status, content_type, headers, body, etag, last_modified, "
+                                              f"fetched_at FROM responses WHERE url IN ({','.join('?' * len(chunk))})",
+                                              chunk).fetchall()
+                self.misses += len(urls) - len(rows)
+                if rows:
+                    self.conn.executemany("UPDATE responses SET last_access = ? WHERE url = ?", [(now, row[0]) for row in rows])
+                    self.conn.commit()
+        except sqlite3.Error as e:
+            log.debug(f"Response cache lookup failed for {len(urls)} URLs: {e}")
+            return {}
+        entries = {}
+        for url, final_url, status, content_type, headers, body, etag, last_modified, fetched_at in rows:
+            entries[url] = {"url": url, "final_url": final_url, "status": status, "content_type": content_type,
+                            "headers": json.loads(headers or "{}"), "text": body, "etag": etag,
+                            "last_modified": last_modified, "fetched_at": fetched_at,
+                            "fresh": now - fetched_at < self.ttl}
+            if entries[url]["fresh"]:
+                self.hits += 1
+        return entries
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """Revalidation headers for a stale entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def as_result(entry: Dict[str, Any], method: str = "GET") -> Dict[str, Any]:
+        """Turn a cache entry back into a fetch_page() result dict."""
+        status = entry["status"]
+        return {"url": entry["url"], "final_url": entry["final_url"], "status": status,
+                "content_type": entry["content_type"], "text": entry["text"] if method == "GET" else None,
+                "error": f"HTTP {status}" if status >= 400 else None, "cached": True}
+
+    def store(self, url: str, result: Dict[str, Any], headers: Any):
+        """Cache a GET fetch result (only statuses in CACHEABLE_STATUSES)."""
+        self.write_back([(url, result, headers)], [])
+
+    def refresh(self, url: str):
+        """Mark a revalidated (304) entry as fresh again."""
+        self.write_back([], [url])
+
+    def write_back(self, stored: List[Tuple[str, Dict[str, Any], Any]], refreshed: List[str]):
+        """Store fetch results and refresh revalidated entries in one transaction.
+        fetch_pages() calls this once after a whole sweep, off the event loop."""
+        now = time.time()
+        rows = []
+        for url, result, headers in stored:
+            if result["error"] == "timeout" or result["status"] not in self.CACHEABLE_STATUSES:
+                continue
+            headers = {str(k): str(v) for k, v in dict(headers or {}).items()}
+            lowered = {k.lower(): v for k, v in headers.items()} # Header names are case-insensitive
+            body = result["text"]
+            size = len(body.encode("utf-8", "replace")) if body else 0
+            rows.append((url, result["final_url"], result["status"], result["content_type"], json.dumps(headers), body,
+                         lowered.get("etag"), lowered.get("last-modified"), now, now, size))
+        self.revalidated += len(refreshed)
+        if not rows and not refreshed:
+            return
+        try:
+            with self.lock:
+                self.conn.executemany("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                self.conn.executemany("UPDATE responses SET fetched_at = ?, last_access = ? WHERE url = ?",
+                                      [(now, now, url) for url in refreshed])
+                self.conn.commit()
+                self._writes_since_evict += len(rows)
+                if self._writes_since_evict >= 100:
+                    self._writes_since_evict = 0
+                    self._evict()
+        except sqlite3.Error as e:
+            log.debug(f"Response cache write failed for {len(rows)} stored, {len(refreshed)} refreshed URLs: {e}")
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is back under 90% of max_bytes. Caller holds the lock."""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = total - int(self.max_bytes * 0.9)
+        freed, doomed = 0, []
+        for url, size in self.conn.execute("SELECT url, size FROM responses ORDER BY last_access"):
+            doomed.append((url,))
+            freed += size or 0
+            if freed >= target:
+                break
+        self.conn.executemany("DELETE FROM responses WHERE url = ?", doomed)
+        self.conn.commit()
+        log.debug(f"Response cache evicted {len(doomed)} entries ({freed // 1024} KB)")
+
+    def close(self):
+        """Evict down to size, log hit stats and close the database."""
+        try:
+            with self.lock:
+                self._evict()
+                self.conn.close()
+        except sqlite3.Error as e:
+            log.debug(f"Error closing response cache: {e}")
+        log.info(f"Response cache: {self.hits} hits, {self.revalidated} revalidated, {self.misses} misses")
+
+
+response_cache: Optional[ResponseCache] = None # Opened in main() unless --no-cache
+
+
+# ───────────────── Page Archive ───────────────────
+class PageArchive:
+    """Append-only archive of the pages a crawl saw, read back by PageReplay for --replay.
+
+    Every static fetch result (GET or HEAD, cache hits included) and every rendered
+    PAGE_EXTRACT_JS payload is stored as one independently compressed frame (zstd, or
+    zlib without the zstandard package) in a segment file owned by this process. Each
+    frame gets a line in the segment's JSONL index (kind, method, url, fetch time, offset,
+    length), written after the frame itself, so an index entry never points past the data.
+    """
+
+    def __init__(self, directory: str, segment_max_bytes: int = ARCHIVE_SEGMENT_MB * 1024 * 1024):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.codec = "zst" if zstd else "zz"
+        self.local = threading.local() # zstd compressors must not be shared between threads
+        self.lock = threading.Lock()
+        self.fh = None
+        self.index_fh = None
+        self.offset = 0
+        self.segments = 0
+        self.records = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+        self.closed = False
+        log.info(f"Archiving pages to {self.dir} ({'zstd' if zstd else 'zlib'} frames)")
+
+    def _compress(self, raw: bytes) -> bytes:
+        if zstd is None:
+            return zlib.compress(raw, ARCHIVE_ZLIB_LEVEL)
+        compressor = getattr(self.local, "compressor", None)
+        if compressor is None:
+            compressor = self.local.compressor = zstd.ZstdCompressor(level=ARCHIVE_ZSTD_LEVEL)
+        return compressor.compress(raw)
+
+    def _open_segment(self):
+        """Start a new segment file and its index. Caller holds the lock."""
+        self._close_segment()
+        self.segments += 1
+        owner = re.sub(r'[^A-Za-z0-9_.-]', '_', f"{socket.gethostname()}-{os.getpid()}")
+        name = f"pages-{owner}-{int(time.time())}-{self.segments}.{self.codec}"
+        self.fh = open(self.dir / name, "ab")
+        self.index_fh = open(self.dir / (name + ".idx"), "a", encoding="utf-8")
+        self.offset = self.fh.tell()
+
+    def _close_segment(self):
+        for f in (self.fh, self.index_fh):
+            if f: f.close()
+        self.fh = self.index_fh = None
+
+    def record(self, kind: str, url: str, data: Dict[str, Any], method: str = "GET"):
+        """Archive one page: kind "static" (a fetch_page() result) or "rendered" (a PAGE_EXTRACT_JS payload)."""
+        fetched_at = time.time()
+        # A fetch that got no (or only a 5xx) response is kept, but replay prefers any good copy over it
+        ok = kind != "static" or 0 < (data.get("status") or 0) < 500
+        raw = json.dumps({"kind": kind, "method": method, "url": url, "t": fetched_at, "data": data},
+                         default=str).encode("utf-8")
+        frame = self._compress(raw) # Outside the lock: workers compress in parallel
+        with self.lock:
+            if self.closed:
+                return
+            try:
+                if self.fh is None or self.offset >= self.segment_max_bytes:
+                    self._open_segment()
+                self.fh.write(frame)
+                self.fh.flush()
+                self.index_fh.write(json.dumps({"kind": kind, "method": method, "url": url, "t": fetched_at, "ok": ok,
+                                                "offset": self.offset, "length": len(frame)}) + "\n")
+                self.index_fh.flush()
+            except OSError as e:
+                log.warning(f"Could not archive {url}: {e}")
+                return
+            self.offset += len(frame)
+            self.records += 1
+            self.raw_bytes += len(raw)
+            self.stored_bytes += len(frame)
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self._close_segment()
+        log.info(f"Page archive: {self.records} pages, {self.raw_bytes // 1024} KB stored as {self.stored_bytes // 1024} KB")
+
+
+class PageReplay:
+    """Read side of a PageArchive directory: the latest archived copy of a page by kind, method and URL.
+    A failed fetch (no response, or a 5xx) only wins when no good copy of the page was archived.
+    All segment indexes are loaded up front; frames are read and decompressed on demand."""
+
+    def __init__(self, directory: str):
+        self.dir = Path(directory)
+        self.lock = threading.Lock()
+        self.files: Dict[str, Any] = {} # Open segment files by name
+        self.index: Dict[Tuple[str, str, str], Tuple[bool, float, str, int, int]] = {} # (kind, method, url) -> (ok, t, segment, offset, length)
+        self.hits = 0
+        self.misses = 0
+        indexes = sorted(self.dir.glob("pages-*.idx"))
+        for path in indexes:
+            segment = path.name[:-len(".idx")]
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue # Torn last line of a crashed writer
+                        key = (entry["kind"], entry["method"], entry["url"])
+                        candidate = (entry.get("ok", True), entry["t"], segment, entry["offset"], entry["length"])
+                        if key not in self.index or candidate[:2] >= self.index[key][:2]: # Good copies first, then latest
+                            self.index[key] = candidate
+            except OSError as e:
+                log.warning(f"Could not read archive index {path}: {e}")
+        if any(p.name.endswith(".zst.idx") for p in indexes) and zstd is None:
+            log.error("Page archive has zstd segments but the zstandard package is not installed; those pages will be missing.")
+        log.info(f"Replaying from page archive {self.dir}: {len(self.index)} pages in {len(indexes)} segments")
+
+    def get(self, kind: str, url: str, method: str = "GET") -> Optional[Dict[str, Any]]:
+        """Archived data of the latest matching page, or None."""
+        entry = self.index.get((kind, method, url))
+        if entry is None:
+            return None
+        _, _, segment, offset, length = entry
+        try:
+            with self.lock:
+                fh = self.files.get(segment)
+                if fh is None:
+                    fh = self.files[segment] = open(self.dir / segment, "rb")
+                fh.seek(offset)
+                frame = fh.read(length)
+            if segment.endswith(".zst"):
+                raw = zstd.ZstdDecompressor().decompress(frame)
+            else:
+                raw = zlib.decompress(frame)
+            return json.loads(raw)["data"]
+        except Exception as e:
+            log.warning(f"Could not read archived {kind} page {url} from {segment}: {e}")
+            return None
+
+    def has_page(self, url: str) -> bool:
+        """Whether a static fetch or a rendered snapshot of url was archived."""
+        return ("static", "GET", url) in self.index or ("rendered", "GET", url) in self.index
+
+    def fetch_result(self, url: str, method: str = "GET") -> Dict[str, Any]:
+        """fetch_page() result from the archive. A HEAD is answered from an archived GET of the
+        same URL; a page that was never archived comes back as a failed fetch."""
+        result = self.get("static", url, method)
+        if result is None and method == "HEAD":
+            result = self.get("static", url, "GET")
+            if result is not None:
+                result = dict(result, text=None)
+        if result is None:
+            self.misses += 1
+            return {"url": url, "final_url": url, "status": 0, "content_type": "", "text": None, "error": "not archived"}
+        self.hits += 1
+        return dict(result, url=url)
+
+    def close(self):
+        with self.lock:
+            for fh in self.files.values():
+                fh.close()
+            self.files.clear()
+        log.info(f"Page replay: {self.hits} static pages served from the archive, {self.misses} not archived")
+
+
+class ReplayBackend(BrowserBackend):
+    """Renders from a PageReplay instead of a browser: extract() returns the archived
+    PAGE_EXTRACT_JS payload of the URL, run through the same emails_from_payload()."""
+
+    def __init__(self, replay: PageReplay):
+        self.replay = replay
+
+    def acquire(self) -> PageReplay:
+        return self.replay
+
+    def release(self, page: Any, recycle: bool = False):
+        pass
+
+    def extract(self, page: Any, url: str, debug: bool = False,
+                deadline: Optional[float] = None) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        payload = self.replay.get("rendered", url)
+        if not payload or not payload.get("source"):
+            log.debug(f"No rendered snapshot of {url} in the page archive")
+            return [], None
+        return emails_from_payload(payload, url, debug), payload
+
+    def alive(self, page: Any) -> bool:
+        return True
+
+    def close_all(self):
+        pass
+
+
+page_archive: Optional[PageArchive] = None # Opened in main() with --archive
+page_replay: Optional[PageReplay] = None # Opened in main() with --replay
+
+
+# ───────────────── Static Fetching ───────────────────
+_http_local = threading.local()
+
+def http_session() -> requests.Session:
+    """Per-thread pooled requests session (keep-alive instead of a new connection per call)."""
+    session = getattr(_http_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=STATIC_PER_HOST_LIMIT * 4,
+                                                pool_maxsize=STATIC_PER_HOST_LIMIT * 4)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _http_local.session = session
+    return session
+
+
+def static_headers(url: str) -> Dict[str, str]:
+    """Browser-like request headers for static fetches."""
+    parsed = urllib.parse.urlparse(url)
+    return {
+        "User-Agent": random.choice(UA_POOL),
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Referer": f"{parsed.scheme}://{parsed.netloc}/", # Basic referer
+        "DNT": "1", # Do Not Track
+        "Upgrade-Insecure-Requests": "1"
+    }
+
+
+def fetch_page(url: str, method: str = "GET") -> Dict[str, Any]:
+    """Fetch a page with the pooled requests session.
+    Returns a fetch result dict: url, final_url, status, content_type, text, error.
+    HEAD requests only fill in the status/redirect fields.
+    Goes through response_cache when enabled (fresh hits skip the network, stale ones are revalidated).
+    With --replay the result comes from the page archive instead; with --archive it is archived."""
+    if page_replay:
+        return page_replay.fetch_result(url, method)
+    cached = response_cache.lookup(url) if response_cache else None
+    if cached and cached["fresh"]:
+        return archive_fetch(ResponseCache.as_result(cached, method), method)
+    result: Dict[str, Any] = {"url": url, "final_url": url, "status": 0, "content_type": "", "text": None, "error": None}
+    headers = static_headers(url)
+    if cached and method == "GET":
+        headers.update(ResponseCache.conditional_headers(cached))
+    try:
+        r = http_session().request(method, url, timeout=STATIC_FETCH_TIMEOUT, headers=headers, allow_redirects=True)
+        if r.status_code == 304 and cached:
+            response_cache.refresh(url)
+            return archive_fetch(ResponseCache.as_result(cached, method), method)
+        result["final_url"] = r.url
+        result["status"] = r.status_code
+        result["content_type"] = r.headers.get('Content-Type', '').lower()
+        if method == "GET" and r.status_code < 400 and 'text/html' in result["content_type"]:
+            result["text"] = r.text
+        if response_cache and method == "GET":
+            response_cache.store(url, result, r.headers)
+        r.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+    except requests.exceptions.Timeout:
+        result["error"] = "timeout"
+    except requests.exceptions.RequestException as e:
+        result["error"] = str(e)
+    return archive_fetch(result, method)
+
+
+def archive_fetch(result: Dict[str, Any], method: str) -> Dict[str, Any]:
+    """Archive a fetch result when --archive is on, and return it unchanged."""
+    if page_archive:
+        page_archive.record("static", result["url"], result, method)
+    return result
+
+
+async def _fetch_page_async(session, url: str, host_limits: Dict[str, Any], method: str, per_host: int,
+                            cached: Optional[Dict[str, Any]], cache_writes: Dict[str, list]) -> Dict[str, Any]:
+    """Fetch one page over the shared aiohttp session, respecting the per-host limit.
+    cached is the (stale) cache entry looked up beforehand; cache updates are queued in
+    cache_writes ("stored"/"refreshed") so no SQLite I/O happens on the event loop."""
+    result: Dict[str, Any] = {"url": url, "final_url": url, "status": 0, "content_type": "", "text": None, "error": None}
+    host = urllib.parse.urlparse(url).netloc
+    if host not in host_limits:
+        host_limits[host] = asyncio.Semaphore(per_host)
+    headers = static_headers(url)
+    if cached and method == "GET":
+        headers.update(ResponseCache.conditional_headers(cached))
+    async with host_limits[host]:
+        try:
+            async with session.request(method, url, headers=headers, allow_redirects=True) as resp:
+                if resp.status == 304 and cached:
+                    cache_writes["refreshed"].append(url)
+                    return ResponseCache.as_result(cached, method)
+                result["final_url"] = str(resp.url)
+                result["status"] = resp.status
+                result["content_type"] = resp.headers.get('Content-Type', '').lower()
+                if resp.status >= 400:
+                    result["error"] = f"HTTP {resp.status}"
+                elif method == "GET" and 'text/html' in result["content_type"]:
+                    result["text"] = await resp.text(errors="replace")
+                if method == "GET":
+                    cache_writes["stored"].append((url, result, dict(resp.headers)))
+        except asyncio.TimeoutError:
+            result["error"] = "timeout"
+        except (aiohttp.ClientError, ValueError) as e:
+            result["error"] = str(e) or type(e).__name__
+    return result
+
+
+async def _fetch_pages_async(urls: List[str], method: str, per_host: int, cached: Dict[str, Dict[str, Any]],
+                             cache_writes: Dict[str, list]) -> Dict[str, Dict[str, Any]]:
+    """Fetch all URLs concurrently over one pooled connector."""
+    timeout = aiohttp.ClientTimeout(total=STATIC_FETCH_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit=STATIC_MAX_CONNECTIONS, limit_per_host=per_host,
+                                     ttl_dns_cache=300)
+    host_limits: Dict[str, Any] = {}
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        results = await asyncio.gather(*(_fetch_page_async(session, url, host_limits, method, per_host,
+                                                           cached.get(url), cache_writes) for url in urls))
+    return {result["url"]: result for result in results}
+
+
+def fetch_pages(urls: List[str], method: str = "GET", per_host: int = STATIC_PER_HOST_LIMIT) -> Dict[str, Dict[str, Any]]:
+    """Fetch many pages at once. Uses asyncio/aiohttp when installed,
+    otherwise falls back to a thread pool over the pooled requests session."""
+    urls = list(dict.fromkeys(urls)) # Dedup, keep order
+    if not urls:
+        return {}
+    if page_replay:
+        return {url: page_replay.fetch_result(url, method) for url in urls}
+    if aiohttp is None:
+        log.debug("aiohttp not installed, fetching static pages with a thread pool.")
+        workers = min(len(urls), STATIC_MAX_CONNECTIONS, per_host * len({get_domain(u) for u in urls}))
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='StaticFetch') as pool:
+            return {result["url"]: result for result in pool.map(lambda u: fetch_page(u, method), urls)}
+    # The response cache is read before and written after the sweep, each in one transaction, and pages are
+    # archived once the sweep is done, so the loop never blocks on SQLite or on compressing/writing frames
+    cached = response_cache.lookup_many(urls) if response_cache else {}
+    fresh = {url: ResponseCache.as_result(entry, method) for url, entry in cached.items() if entry["fresh"]}
+    cache_writes: Dict[str, list] = {"stored": [], "refreshed": []}
+    pending = [url for url in urls if url not in fresh]
+    results = asyncio.run(_fetch_pages_async(pending, method, per_host, cached, cache_writes)) if pending else {}
+    if response_cache:
+        response_cache.write_back(cache_writes["stored"], cache_writes["refreshed"])
+    return {url: archive_fetch(fresh.get(url) or results[url], method) for url in urls}
+
+
+def contact_urls(site: str) -> List[str]:
+    """Candidate contact page URLs for a site."""
+    return [site.rstrip('/') + path for path in CONTACT_PATHS if path and path != '/']
+
+
+def discover_contact_links(html_content: Optional[str], base_url: str, top_k: Optional[int] = None,
+                           anchors: Optional[List[Tuple[str, str]]] = None) -> List[str]:
+    """Mine homepage anchors for contact/about/enquiry pages and return the best top_k URLs.
+
+    Links are ranked by keyword weight in the href path plus the link text, so
+    non-standard paths like /pages/contact-us.html are found without guessing.
+    Only pages on the site's own domain are returned. Pass the anchors from an
+    existing parse_page() result to avoid parsing the HTML again.
+    """
+    if anchors is None:
+        if not html_content:
+            return []
+        anchors = parse_page(html_content, base_url)["anchors"]
+    top_k = CONTACT_LINK_TOP_K if top_k is None else top_k
+    site_domain = get_domain(base_url)
+    scored: Dict[str, int] = {}
+
+    for href, link_text in anchors:
+        if not href or href.startswith(('#', 'mailto:', 'tel:', 'javascript:')):
+            continue
+        url = urllib.parse.urljoin(base_url, href).split('#')[0]
+        parsed = urllib.parse.urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            continue
+        link_domain = get_domain(url)
+        if link_domain != site_domain and not link_domain.endswith("." + site_domain):
+            continue # Off-site link
+        if parsed.path.lower().endswith(NON_PAGE_EXTENSIONS) or same_page(url, base_url):
+            continue
+
+        path = urllib.parse.unquote(parsed.path).lower()
+        text = " ".join(link_text.lower().split())
+        score = max((w for kw, w in CONTACT_LINK_KEYWORDS if kw in path), default=0)
+        score += max((w for kw, w in CONTACT_LINK_KEYWORDS if kw in text), default=0)
+        if score == 0:
+            continue
+        score -= 5 * max(0, path.strip('/').count('/') - 1) # Prefer shallow pages
+        if score > scored.get(url, 0):
+            scored[url] = score
+
+    ranked: List[str] = []
+    for url, _ in sorted(scored.items(), key=lambda item: item[1], reverse=True):
+        if not any(same_page(url, kept) for kept in ranked):
+            ranked.append(url)
+        if len(ranked) >= top_k:
+            break
+    return ranked
+
+
+def same_page(url_a: str, url_b: str) -> bool:
+    """True if two URLs point at the same page (ignores scheme, www., case, trailing slash, fragment)."""
+    def key(url: str) -> str:
+        parsed = urllib.parse.urlparse(url.strip().lower())
+        host = parsed.netloc[4:] if parsed.netloc.startswith("www.") else parsed.netloc
+        return f"{host}{parsed.path.rstrip('/')}?{parsed.query}"
+    return key(url_a) == key(url_b)
+
+
+def probe_contact_paths(site: str, homepage_url: Optional[str],
+                        prefetched: Optional[Dict[str, Dict[str, Any]]] = None) -> List[str]:
+    """Check every candidate contact path at once and return only the URLs worth loading.
+
+    Uses HEAD requests (GET where HEAD is refused) with redirect tracking. A path is
+    kept if it answers 2xx, doesn't land back on the homepage and isn't a duplicate
+    of another path. Results already fetched by a static sweep are reused.
+    """
+    candidates = contact_urls(site)
+    pages = prefetched or {}
+    results = {url: pages[url] for url in candidates if url in pages}
+
+    to_probe = [url for url in candidates if url not in results]
+    if to_probe:
+        probed = fetch_pages(to_probe, method="HEAD", per_host=CONTACT_PROBE_CONCURRENCY)
+        # Some servers refuse or mishandle HEAD: retry those with GET
+        retry = [url for url, r in probed.items() if r["status"] in (403, 405, 501) or (r["error"] and r["error"] != "timeout" and not r["status"])]
+        if retry:
+            probed.update(fetch_pages(retry, method="GET", per_host=CONTACT_PROBE_CONCURRENCY))
+        results.update(probed)
+
+    existing: List[str] = []
+    seen_final: List[str] = [homepage_url] if homepage_url else []
+    for url in candidates:
+        r = results.get(url)
+        if not r or r["error"] or not (200 <= r["status"] < 300):
+            continue
+        if r["content_type"] and 'html' not in r["content_type"]:
+            continue
+        if any(same_page(r["final_url"], seen) for seen in seen_final):
+            continue # Redirected to the homepage or another path we already have
+        seen_final.append(r["final_url"])
+        existing.append(url)
+
+    if not existing and homepage_url is None and all(r["error"] and r["status"] in (0, 403) for r in results.values()):
+        # Static requests look blocked entirely, so probing tells us nothing: try the usual suspects
+        log.debug(f"Contact probing blocked for {site}, falling back to common paths")
+        return candidates[:CONTACT_FALLBACK_PATHS]
+
+    log.debug(f"Contact probing for {site}: {len(existing)}/{len(candidates)} paths exist")
+    return existing
+
+
+def static_sweep(sites: List[str], debug: bool = False) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Fetch the homepage and contact pages for many sites at once.
+
+    Homepages are fetched first; each site's contact links are then discovered
+    from its homepage, falling back to the blind CONTACT_PATHS list for sites
+    that don't link to one. Returns {site: {url: fetch_result}} for use as
+    harvest_emails(prefetched=...).
+    """
+    homepages: Dict[str, str] = {}
+    for site in sites:
+        normalized = normalize_url(site or "")
+        if normalized:
+            homepages[site] = normalized
+
+    start = time.time()
+    home_results = fetch_pages(list(homepages.values()))
+
+    site_urls: Dict[str, List[str]] = {}
+    for site, homepage in homepages.items():
+        home = home_results.get(homepage)
+        linked: List[str] = []
+        if home and home["text"]:
+            home["page"] = parse_page(home["text"], homepage, debug) # Parsed once, reused by harvest_emails
+            linked = discover_contact_links(None, home["final_url"], anchors=home["page"]["anchors"])
+        site_urls[site] = [homepage] + (linked or contact_urls(homepage))
+
+    results = dict(home_results)
+    results.update(fetch_pages([url for urls in site_urls.values() for url in urls[1:] if url not in results]))
+    ok = sum(1 for r in results.values() if r["text"])
+    log.info(f"Static sweep: fetched {len(results)} pages for {len(site_urls)} sites "
+             f"({ok} HTML) in {time.time() - start:.1f}s")
+    return {site: {url: results[url] for url in urls if url in results} for site, urls in site_urls.items()}
 
 
 # ───────────────── Email Extraction ───────────────────
-def selenium_emails(driver: webdriver.Chrome, url: str, debug: bool = False) -> List[Tuple[str, Dict[str, Any]]]:
-    """Extract emails from a single page using Selenium with context information."""
+def emails_from_payload(payload: Dict[str, Any], url: str, debug: bool = False) -> List[Tuple[str, Dict[str, Any]]]:
+    """Turn a PAGE_EXTRACT_JS payload into (email, context) tuples.
+    Sources are checked in the same order (and with the same contexts) as the old per-element extraction."""
     found_emails_with_context: List[Tuple[str, Dict[str, Any]]] = []
     processed_emails: Set[str] = set() # Track emails found on this specific page
+    is_contact_page = any(p.strip('/') in url.lower() for p in CONTACT_PATHS if p != '/') or "contact" in url.lower() or "about" in url.lower()
+
+    def add(emails: List[str], context: Dict[str, Any]) -> int:
+        newly_found_count = 0
+        for email in emails:
+            if email not in processed_emails:
+                found_emails_with_context.append((email, dict(context, found_on_contact_page=is_contact_page)))
+                processed_emails.add(email)
+                newly_found_count += 1
+        return newly_found_count
+
+    # 1. Visible text (body.innerText)
+    body_emails = emails_from_text(payload.get("bodyText") or "")
+    add(body_emails, {"found_in_body": True})
+    if body_emails and debug: log.debug(f"Found {len(body_emails)} emails in body text")
+
+    # 2. Elements containing @ (textContent, with header/footer context from the browser)
+    for el in payload.get("elements") or []:
+        new_emails = emails_from_text(el.get("text") or "")
+        add(new_emails, {"found_in_element": True, "found_in_header": bool(el.get("header")), "found_in_footer": bool(el.get("footer"))})
+        if new_emails and debug: log.debug(f"Found emails in element textContent: {new_emails}")
+
+    # 3. mailto: links (strip subject etc. before matching)
+    for link in payload.get("mailtos") or []:
+        email_part = (link.get("href") or "").split('?')[0].replace('mailto:', '', 1)
+        new_emails = emails_from_text(email_part)
+        add(new_emails, {"found_in_mailto": True, "found_in_header": bool(link.get("header")), "found_in_footer": bool(link.get("footer"))})
+        if new_emails and debug: log.debug(f"Found emails in mailto: {new_emails}")
+
+    # 4. Full page source (catches comments/hidden)
+    newly_found_count = add(emails_from_text(payload.get("source") or ""), {"found_in_source": True})
+    if newly_found_count > 0 and debug:
+        log.debug(f"Found {newly_found_count} additional emails in page source")
+
+    # 5. Meta tags
+    for content in payload.get("meta") or []:
+        new_emails = emails_from_text(content)
+        add(new_emails, {"found_in_meta": True})
+        if new_emails and debug: log.debug(f"Found emails in meta tag: {new_emails}")
+
+    # 6. Inline scripts (already limited to the first 25 small ones in the browser)
+    combined_script_text = " ".join(payload.get("scripts") or [])
+    if combined_script_text:
+        newly_found_count = add(emails_from_text(combined_script_text), {"found_in_script": True})
+        if newly_found_count > 0 and debug:
+            log.debug(f"Found {newly_found_count} emails in inline scripts")
+
+    # 7. Forms (mailto: action, hidden fields)
+    for form in payload.get("forms") or []:
+        action = form.get("action") or ""
+        if "mailto:" in action:
+            new_emails = emails_from_text(action.split('?')[0].replace('mailto:', '', 1))
+            add(new_emails, {"found_in_form": True})
+            if new_emails and debug: log.debug(f"Found emails in form mailto action: {new_emails}")
+        for field_value in form.get("hidden") or []:
+            new_emails = emails_from_text(field_value)
+            add(new_emails, {"found_in_form": True, "found_in_hidden_field": True})
+            if new_emails and debug: log.debug(f"Found emails in hidden form field: {new_emails}")
+
+    # 8. Accessibility attributes (alt, aria-label)
+    newly_found_count = add(extract_from_accessibility_elements(None, payload), {"found_in_accessibility": True})
+    if newly_found_count > 0 and debug:
+        log.debug(f"Found {newly_found_count} emails in accessibility attributes")
+
+    # 9. Obfuscated emails (data-* attributes, split spans)
+    newly_found_count = add(extract_obfuscated_emails(None, payload), {"found_obfuscated": True})
+    if newly_found_count > 0 and debug:
+        log.debug(f"Found {newly_found_count} potential obfuscated emails")
+
+    return found_emails_with_context
+
 
+def selenium_extract(driver: webdriver.Chrome, url: str, debug: bool = False,
+                     deadline: Optional[float] = None) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[Dict[str, Any]]]:
+    """Load a page with Selenium and extract everything in one PAGE_EXTRACT_JS round trip.
+    Returns (emails with context, payload); the payload also feeds social and contact-link discovery.
+    With a deadline (time.time() value) the page load timeout is cut to the time left."""
     if not is_driver_alive(driver):
          log.warning(f"Driver not alive when trying to process {url}")
          raise WebDriverException("Driver is not alive") # Raise exception to signal failure
 
+    load_timeout = PAGE_LOAD_TIMEOUT if deadline is None else max(1.0, min(PAGE_LOAD_TIMEOUT, deadline - time.time()))
+    load_started = time.time()
     try:
+        if getattr(driver, "_page_load_timeout", PAGE_LOAD_TIMEOUT) != load_timeout:
+            driver.set_page_load_timeout(load_timeout)
+            driver._page_load_timeout = load_timeout
         log.debug(f"Navigating to {url} with Selenium")
+        if resource_blocker: resource_blocker.apply(driver, get_domain(url))
         driver.get(url)
-
-        # Try to dismiss cookie consent popups after navigation
-        dismissed = dismiss_cookie_consent(driver, debug)
+        if PAGE_LOAD_STRATEGY == "none":
+            # get() returned immediately; give the parser a chance to build the DOM first
+            WebDriverWait(driver, min(5, load_timeout), poll_frequency=0.1).until(
+                lambda d: d.execute_script("return document.readyState") != "loading")
+
+        # Try to dismiss cookie consent popups after navigation (a shared browser is only held
+        # for single polls and the iframe click sequence, so its other tabs keep loading)
+        dismissed = dismiss_cookie_consent(driver, debug, domain=get_domain(url))
         if dismissed:
-             log.debug(f"Cookie consent likely dismissed for {url}")
-             time.sleep(0.5) # Short pause after dismissal
+             log.debug(f"Cookie consent likely dismissed for {url}") # dismissal already waited for the banner to close
 
 
     except TimeoutException:
         log.warning(f"Timeout loading {url}")
-        # Don't return empty immediately, maybe some content loaded partially
-        # Or raise an exception to be caught by the caller?
         # Let's try to proceed and see if we can extract anything from partial load
         pass # Continue and try extraction
     except WebDriverException as e:
@@ -1533,398 +3985,110 @@ def selenium_emails(driver: webdriver.Chrome, url: str, debug: bool = False) ->
 
     # Wait for body element (use smaller timeout as page load might have timed out)
     try:
-        WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        WebDriverWait(driver, min(5, load_timeout)).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
     except TimeoutException:
         log.warning(f"Timeout waiting for body element on {url} after navigation attempt.")
         # Proceed, but expect potential issues finding elements
     except WebDriverException as e:
          log.error(f"WebDriverException waiting for body: {e}")
          raise # Re-raise critical errors
+    if concurrency:
+        concurrency.observe_page(time.time() - load_started)
 
-    page_source = ""
-    try:
-        page_source = driver.page_source
-        if not page_source:
-             log.warning(f"Page source is empty for {url}")
-             # No point continuing if source is empty
-             return []
-    except WebDriverException as e:
-         log.warning(f"Could not get page source for {url}: {e}")
-         # Cannot proceed without source or body
-         return []
-
+    # One script collects text, mailtos, meta, scripts, forms, alt/aria, data-* and links
+    payload = page_payload(driver)
+    if not payload or not payload.get("source"):
+         log.warning(f"Page source is empty for {url}")
+         # No point continuing if source is empty
+         return [], None
 
-    is_contact_page = any(p.strip('/') in url.lower() for p in CONTACT_PATHS if p != '/') or "contact" in url.lower() or "about" in url.lower()
-
-
-    # --- Extraction Methods ---
-
-    # 1. Extract from visible text (body.text)
-    try:
-        body_element = driver.find_element(By.TAG_NAME, "body")
-        # Get text content robustly, handling potential StaleElementReferenceException
-        for _ in range(2): # Retry once if stale
-            try:
-                body_text = body_element.text
-                if body_text:
-                    emails = emails_from_text(body_text)
-                    for email in emails:
-                        if email not in processed_emails:
-                            context = {"found_in_body": True, "found_on_contact_page": is_contact_page}
-                            found_emails_with_context.append((email, context))
-                            processed_emails.add(email)
-                    if emails and debug: log.debug(f"Found {len(emails)} emails in body text")
-                break # Success
-            except StaleElementReferenceException:
-                 log.debug("Body element became stale, retrying find...")
-                 time.sleep(0.2)
-                 body_element = driver.find_element(By.TAG_NAME, "body") # Re-find element
-            except WebDriverException as e_body:
-                 log.debug(f"Could not get body text: {e_body}")
-                 break # Stop trying if WebDriverException occurs
-    except NoSuchElementException:
-         log.warning(f"Could not find body element on {url}")
-    except Exception as e:
-        log.debug(f"Error extracting body text: {e}")
-
-
-    # 2. Extract from elements containing @ (more targeted than full body text)
-    try:
-        # Limit search to common containers + links to avoid excessive elements
-        elements = driver.find_elements(By.XPATH, "//p[contains(text(), '@')] | //span[contains(text(), '@')] | //div[contains(text(), '@')] | //a[contains(text(), '@')]")[:50] # Limit elements
-        for el in elements:
-            try:
-                # Get textContent which includes hidden text unlike .text
-                txt = el.get_attribute("textContent") or ""
-                new_emails = emails_from_text(txt)
-                for email in new_emails:
-                    if email not in processed_emails:
-                        context = {"found_in_element": True, "found_on_contact_page": is_contact_page}
-                        # Check if near contact words (expensive, do selectively?)
-                        # Check if in header/footer (more reliable)
-                        in_header, in_footer = False, False
-                        try:
-                             current = el
-                             for _ in range(6): # Check up to 6 levels up
-                                 if not current or current.tag_name == 'body': break
-                                 tag = current.tag_name.lower()
-                                 eid = (current.get_attribute("id") or "").lower()
-                                 ecls = (current.get_attribute("class") or "").lower()
-                                 if tag == "header" or "header" in eid or "header" in ecls or tag == "nav" or "nav" in eid or "menu" in eid:
-                                     in_header = True; break
-                                 if tag == "footer" or "footer" in eid or "footer" in ecls or "copyright" in eid or "copyright" in ecls:
-                                     in_footer = True; break
-                                 # Use XPath for parent in loop
-                                 current = current.find_element(By.XPATH, '..')
-                        except (NoSuchElementException, StaleElementReferenceException): pass # Stop checking ancestors
-                        except WebDriverException as e_ancestor: log.debug(f"Error checking ancestors: {e_ancestor}")
-
-                        context["found_in_header"] = in_header
-                        context["found_in_footer"] = in_footer
-                        found_emails_with_context.append((email, context))
-                        processed_emails.add(email)
-                if new_emails and debug: log.debug(f"Found emails in element textContent: {new_emails}")
-            except StaleElementReferenceException: continue
-            except WebDriverException as e_el: log.debug(f"Error processing element with @: {e_el}")
-    except WebDriverException as e: log.debug(f"Error finding elements with @: {e}")
-
-
-    # 3. Extract from mailto: links
-    try:
-        links = driver.find_elements(By.XPATH, "//a[starts-with(@href, 'mailto:')]")
-        for a in links:
-            try:
-                href = a.get_attribute("href") or ""
-                # Mailto link might have subject etc., extract email part
-                email_part = href.split('?')[0].replace('mailto:', '', 1)
-                new_emails = emails_from_text(email_part) # Use regex on extracted part
-                for email in new_emails:
-                     if email not in processed_emails:
-                        context = {"found_in_mailto": True, "found_on_contact_page": is_contact_page}
-                        # Check header/footer context
-                        in_header, in_footer = False, False
-                        try:
-                             current = a
-                             for _ in range(6):
-                                 if not current or current.tag_name == 'body': break
-                                 tag = current.tag_name.lower()
-                                 eid = (current.get_attribute("id") or "").lower()
-                                 ecls = (current.get_attribute("class") or "").lower()
-                                 if tag == "header" or "header" in eid or "header" in ecls or tag == "nav" or "nav" in eid or "menu" in eid:
-                                     in_header = True; break
-                                 if tag == "footer" or "footer" in eid or "footer" in ecls or "copyright" in eid or "copyright" in ecls:
-                                     in_footer = True; break
-                                 current = current.find_element(By.XPATH, '..')
-                        except (NoSuchElementException, StaleElementReferenceException): pass
-                        except WebDriverException as e_ancestor: log.debug(f"Error checking mailto ancestors: {e_ancestor}")
-
-                        context["found_in_header"] = in_header
-                        context["found_in_footer"] = in_footer
-                        found_emails_with_context.append((email, context))
-                        processed_emails.add(email)
-                if new_emails and debug: log.debug(f"Found emails in mailto: {new_emails}")
-            except StaleElementReferenceException: continue
-            except WebDriverException as e_mailto: log.debug(f"Error processing mailto link: {e_mailto}")
-    except WebDriverException as e: log.debug(f"Error finding mailto links: {e}")
-
-
-    # 4. Extract from full page source (redundant if body text worked, but catches comments/hidden)
-    # Only run if body text extraction wasn't very successful? No, run anyway for hidden ones.
-    try:
-        # page_source already fetched earlier
-        if page_source:
-             source_emails = emails_from_text(page_source)
-             newly_found_count = 0
-             for email in source_emails:
-                 if email not in processed_emails:
-                     context = {"found_in_source": True, "found_on_contact_page": is_contact_page}
-                     # Less valuable context, add only if truly new
-                     found_emails_with_context.append((email, context))
-                     processed_emails.add(email)
-                     newly_found_count += 1
-             if newly_found_count > 0 and debug:
-                 log.debug(f"Found {newly_found_count} additional emails in page source")
-    except Exception as e: log.debug(f"Error extracting from page source: {e}")
-
-
-    # 5. Extract from meta tags
-    try:
-        meta_tags = driver.find_elements(By.TAG_NAME, "meta")
-        for tag in meta_tags:
-            try:
-                 content = tag.get_attribute("content") or ""
-                 if "@" in content:
-                     new_emails = emails_from_text(content)
-                     for email in new_emails:
-                         if email not in processed_emails:
-                             context = {"found_in_meta": True, "found_on_contact_page": is_contact_page}
-                             found_emails_with_context.append((email, context))
-                             processed_emails.add(email)
-                     if new_emails and debug: log.debug(f"Found emails in meta tag: {new_emails}")
-            except StaleElementReferenceException: continue
-            except WebDriverException as e_meta: log.debug(f"Error processing meta tag: {e_meta}")
-    except WebDriverException as e: log.debug(f"Error finding meta tags: {e}")
-
-
-    # 6. Extract from inline scripts (limit search)
-    try:
-        scripts = driver.find_elements(By.TAG_NAME, "script")
-        script_texts = []
-        for script in scripts[:25]: # Limit number of scripts checked
-            try:
-                script_text = script.get_attribute("textContent") or ""
-                if script_text and "@" in script_text and len(script_text) < 50000: # Avoid huge scripts
-                     script_texts.append(script_text)
-            except StaleElementReferenceException: continue
-            except WebDriverException as e_script_get: log.debug(f"Error getting script content: {e_script_get}")
-
-        combined_script_text = " ".join(script_texts)
-        if combined_script_text:
-             script_emails = emails_from_text(combined_script_text)
-             newly_found_count = 0
-             for email in script_emails:
-                 if email not in processed_emails:
-                     context = {"found_in_script": True, "found_on_contact_page": is_contact_page}
-                     found_emails_with_context.append((email, context))
-                     processed_emails.add(email)
-                     newly_found_count += 1
-             if newly_found_count > 0 and debug:
-                 log.debug(f"Found {newly_found_count} emails in inline scripts")
-    except WebDriverException as e: log.debug(f"Error finding script tags: {e}")
-    except Exception as e: log.debug(f"Error extracting from scripts: {e}")
-
-
-    # 7. Extract from forms (action, hidden fields)
-    try:
-        forms = driver.find_elements(By.TAG_NAME, "form")
-        for form in forms:
-            try:
-                # Check form action for mailto:
-                action = form.get_attribute("action") or ""
-                if "mailto:" in action:
-                     email_part = action.split('?')[0].replace('mailto:', '', 1)
-                     new_emails = emails_from_text(email_part)
-                     for email in new_emails:
-                         if email not in processed_emails:
-                             context = {"found_in_form": True, "found_on_contact_page": is_contact_page}
-                             found_emails_with_context.append((email, context))
-                             processed_emails.add(email)
-                     if new_emails and debug: log.debug(f"Found emails in form mailto action: {new_emails}")
-
-                # Check hidden fields for values containing @
-                hidden_fields = form.find_elements(By.XPATH, ".//input[@type='hidden']")
-                for field in hidden_fields:
-                     field_value = field.get_attribute("value") or ""
-                     if "@" in field_value:
-                         new_emails = emails_from_text(field_value)
-                         for email in new_emails:
-                             if email not in processed_emails:
-                                 context = {"found_in_form": True, "found_in_hidden_field": True, "found_on_contact_page": is_contact_page}
-                                 found_emails_with_context.append((email, context))
-                                 processed_emails.add(email)
-                         if new_emails and debug: log.debug(f"Found emails in hidden form field: {new_emails}")
-            except StaleElementReferenceException: continue
-            except WebDriverException as e_form_inner: log.debug(f"Error processing form internals: {e_form_inner}")
-    except WebDriverException as e: log.debug(f"Error finding form tags: {e}")
-
-
-    # 8. Extract from accessibility elements
-    try:
-        accessibility_emails = extract_from_accessibility_elements(driver)
-        newly_found_count = 0
-        for email in accessibility_emails:
-            if email not in processed_emails:
-                context = {"found_in_accessibility": True, "found_on_contact_page": is_contact_page}
-                found_emails_with_context.append((email, context))
-                processed_emails.add(email)
-                newly_found_count += 1
-        if newly_found_count > 0 and debug:
-            log.debug(f"Found {newly_found_count} emails in accessibility attributes")
-    except WebDriverException as e: log.debug(f"Error extracting from accessibility elements: {e}")
-
-
-    # 9. Extract obfuscated emails (JS data attributes, etc.)
-    try:
-        obfuscated_emails = extract_obfuscated_emails(driver)
-        newly_found_count = 0
-        for email in obfuscated_emails:
-            if email not in processed_emails:
-                context = {"found_obfuscated": True, "found_on_contact_page": is_contact_page}
-                found_emails_with_context.append((email, context))
-                processed_emails.add(email)
-                newly_found_count += 1
-        if newly_found_count > 0 and debug:
-            log.debug(f"Found {newly_found_count} potential obfuscated emails")
-    except WebDriverException as e: log.debug(f"Error extracting obfuscated emails: {e}")
+    found_emails_with_context = emails_from_payload(payload, url, debug)
+    log.debug(f"Finished Selenium extraction for {url}. Found {len(found_emails_with_context)} raw email instances.")
+    return found_emails_with_context, payload
 
 
-    log.debug(f"Finished Selenium extraction for {url}. Found {len(found_emails_with_context)} raw email instances.")
-    return found_emails_with_context
+def selenium_emails(driver: webdriver.Chrome, url: str, debug: bool = False) -> List[Tuple[str, Dict[str, Any]]]:
+    """Extract emails from a single page using Selenium with context information."""
+    return selenium_extract(driver, url, debug)[0]
 
 
-def requests_emails(url: str, debug: bool = False) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[str]]:
-    """Extract emails from a website using requests and BeautifulSoup with context.
-       Returns tuple: (list_of_emails_with_context, html_content_or_none)
+def requests_page(url: str, debug: bool = False, prefetched: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Fetch (or take a prefetched fetch result for) a page and parse it once.
+       Returns the parse_page() dict plus "html" and "final_url", or None if no HTML was retrieved.
     """
-    found_emails_with_context = []
-    processed_emails = set()
-    html_content = None
-
     try:
-        headers = {
-            "User-Agent": random.choice(UA_POOL),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Referer": url.split('/')[0] + "//" + url.split('/')[2] + "/", # Basic referer
-            "DNT": "1", # Do Not Track
-            "Upgrade-Insecure-Requests": "1"
-        }
-        r = requests.get(url, timeout=10, headers=headers, allow_redirects=True)
-        r.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+        result = prefetched if prefetched is not None else fetch_page(url)
+
+        if result["error"] == "timeout":
+            log.warning(f"Requests timeout for {url}")
+            return None
+        if result["status"] in (404, 410):
+            log.debug(f"Page not found ({result['status']}) for {url}")
+            return None
+        if result["error"]:
+            log.warning(f"Requests error for {url}: {result['error']}")
+            return None # Treat request errors as no emails found by this method
 
         # Check content type
-        content_type = r.headers.get('Content-Type', '').lower()
+        content_type = result["content_type"]
         if 'text/html' not in content_type:
             log.debug(f"Skipping non-HTML content type '{content_type}' for {url}")
-            return [], None
+            return None
 
-        html_content = r.text
+        html_content = result["text"]
         if not html_content:
              log.warning(f"Empty content received from {url}")
-             return [], None
-
-        soup = BeautifulSoup(html_content, "html.parser")
-        is_contact_page = any(p.strip('/') in url.lower() for p in CONTACT_PATHS if p != '/') or "contact" in url.lower() or "about" in url.lower()
-
-
-        # 1. Extract from visible text
-        visible_text = soup.get_text(separator=' ')
-        if visible_text:
-            text_emails = emails_from_text(visible_text)
-            for email in text_emails:
-                if email not in processed_emails:
-                     context = {"found_in_text": True, "found_on_contact_page": is_contact_page}
-                     found_emails_with_context.append((email, context))
-                     processed_emails.add(email)
-            if debug and text_emails: log.debug(f"Requests: Found {len(text_emails)} emails in visible text")
-
-
-        # 2. Extract from mailto links
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            if href.startswith('mailto:'):
-                email_part = href.split('?')[0].replace('mailto:', '', 1)
-                new_emails = emails_from_text(email_part)
-                for email in new_emails:
-                     if email not in processed_emails:
-                        context = {"found_in_mailto": True, "found_on_contact_page": is_contact_page}
-                        # Check header/footer context (simplified for requests)
-                        in_header = any(p.name == 'header' or (p.get('id') and 'header' in p.get('id', '').lower()) for p in a.parents)
-                        in_footer = any(p.name == 'footer' or (p.get('id') and 'footer' in p.get('id', '').lower()) for p in a.parents)
-                        context["found_in_header"] = in_header
-                        context["found_in_footer"] = in_footer
-                        found_emails_with_context.append((email, context))
-                        processed_emails.add(email)
-                if debug and new_emails: log.debug(f"Requests: Found emails in mailto: {new_emails}")
-
-        # 3. Extract from meta tags
-        for meta in soup.find_all('meta', content=True):
-             content = meta.get('content', '')
-             if '@' in content:
-                 new_emails = emails_from_text(content)
-                 for email in new_emails:
-                     if email not in processed_emails:
-                         context = {"found_in_meta": True, "found_on_contact_page": is_contact_page}
-                         found_emails_with_context.append((email, context))
-                         processed_emails.add(email)
-                 if debug and new_emails: log.debug(f"Requests: Found emails in meta: {new_emails}")
-
-
-        # 4. Check full HTML source (includes comments etc.)
-        source_emails = emails_from_text(html_content)
-        newly_found_count = 0
-        for email in source_emails:
-            if email not in processed_emails:
-                context = {"found_in_source": True, "found_on_contact_page": is_contact_page}
-                found_emails_with_context.append((email, context))
-                processed_emails.add(email)
-                newly_found_count += 1
-        if debug and newly_found_count > 0: log.debug(f"Requests: Found {newly_found_count} additional emails in source")
+             return None
 
+        # A static sweep may already have parsed this page
+        page = result.get("page") or parse_page(html_content, url, debug)
+        return dict(page, html=html_content, final_url=result["final_url"])
 
-        if debug and found_emails_with_context:
-            log.debug(f"Requests: Found {len(processed_emails)} unique emails total for {url}")
+    except Exception as e:
+        log.error(f"Unexpected error in requests_page for {url}: {e}", exc_info=debug)
+        return None
 
-        return found_emails_with_context, html_content
 
-    except requests.exceptions.Timeout:
-        log.warning(f"Requests timeout for {url}")
-        return [], None
-    except requests.exceptions.RequestException as e:
-        log.warning(f"Requests error for {url}: {e}")
-        # Could check status code here, e.g., if e.response is not None
-        # if e.response is not None and e.response.status_code == 403:
-        #     log.warning(f"Access denied (403) for {url}")
-        return [], None # Treat request errors as no emails found by this method
-    except Exception as e:
-        log.error(f"Unexpected error in requests_emails for {url}: {e}", exc_info=debug)
+def requests_emails(url: str, debug: bool = False, prefetched: Optional[Dict[str, Any]] = None) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[str]]:
+    """Extract emails from a website using requests and BeautifulSoup with context.
+       If a fetch result from static_sweep()/fetch_pages() is given, no request is made.
+       Returns tuple: (list_of_emails_with_context, html_content_or_none)
+    """
+    page = requests_page(url, debug, prefetched)
+    if page is None:
         return [], None
+    return page["emails"], page["html"]
 
 
-def harvest_emails(site: str, business_name: str, driver: webdriver.Chrome, debug: bool = False) -> Tuple[List[str], Dict[str, str], str]:
+def harvest_emails(site: str, business_name: str, driver: Union[webdriver.Chrome, "DriverLease"], debug: bool = False,
+                   prefetched: Optional[Dict[str, Dict[str, Any]]] = None,
+                   checkpoint: Optional[RecordCheckpoint] = None,
+                   budget: Optional[float] = None,
+                   candidates: Optional[List[Tuple[str, Dict[str, Any]]]] = None) -> Tuple[List[str], Dict[str, str], str]:
     """Harvest emails and social media profiles from a website.
 
+    Static HTML (requests) is tried first. Selenium is only used when the
+    static pass is not confident enough and the page shows signs of needing
+    JavaScript to render (see js_rendering_signal).
+
     Args:
         site: The website URL.
         business_name: Name of the business for context.
-        driver: Selenium WebDriver instance.
+        driver: Selenium WebDriver instance, or a DriverLease that only leases one if needed.
         debug: Debug logging flag.
+        prefetched: Optional {url: fetch_result} from static_sweep(); used instead of live requests.
+        checkpoint: Optional journal handle; completed Selenium/contact page stages are saved
+            to it, and stages saved by an interrupted earlier attempt are reused instead of redone.
+        budget: Seconds this site may take (default SITE_BUDGET_SECONDS, 0 = unlimited). Once used up
+            no further pages are loaded and whatever was found so far is returned as "partial".
+        candidates: Optional list that receives every raw (email, context) sighting, before
+            cleaning and scoring, so the caller can store them for later re-scoring.
 
     Returns:
         A tuple containing:
         - List of prioritized, unique email addresses found.
         - Dictionary of social media profiles {platform: url}.
-        - Status string ("found", "checked", "failed").
+        - Status string ("found", "partial", "checked", "failed").
     """
     if not site or site == "N/A":
         return [], {}, "skipped" # Or "checked" if N/A implies processed?
@@ -1943,7 +4107,41 @@ def harvest_emails(site: str, business_name: str, driver: webdriver.Chrome, debu
     unique_emails_found = set()
     social_profiles: Dict[str, str] = {}
     status = "checked" # Default status if process completes but finds nothing
+    pages = prefetched or {}
+    budget = SITE_BUDGET_SECONDS if budget is None else budget
+    deadline = time.time() + budget if budget > 0 else None
+    budget_hit = False
+
+    def out_of_budget(stage: str) -> bool:
+        # Slow sites get cut off instead of holding a worker for minutes
+        nonlocal budget_hit
+        if not budget_hit and deadline is not None and time.time() >= deadline:
+            log.warning(f"[{domain}] Site budget of {budget:.0f}s used up before {stage}, keeping partial results")
+            budget_hit = True
+        return budget_hit
+
+    def browser() -> webdriver.Chrome:
+        # Only lease a Chrome instance once a page actually needs rendering
+        return driver.get() if isinstance(driver, DriverLease) else driver
+
+    def browser_alive(drv) -> bool:
+        return driver.pool.alive(drv) if isinstance(driver, DriverLease) else is_driver_alive(drv)
+
+    def render(drv, url: str) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        # Through the lease's backend (Selenium driver, pooled tab, CDP page or archive); a bare driver is Selenium
+        if isinstance(driver, DriverLease):
+            rendered = driver.pool.extract(drv, url, debug, deadline)
+        else:
+            rendered = selenium_extract(drv, url, debug, deadline)
+        if page_archive and rendered[1]:
+            page_archive.record("rendered", url, rendered[1]) # DOM snapshot for --replay
+        return rendered
 
+    def browser_dead() -> bool:
+        # A lease that was never taken is not dead; one that failed to start is
+        if isinstance(driver, DriverLease):
+            return driver.failed or (driver.driver is not None and not browser_alive(driver.driver))
+        return not is_driver_alive(driver)
 
     # Check circuit breaker before any network access
     if circuit_breaker.is_open(domain):
@@ -1951,80 +4149,166 @@ def harvest_emails(site: str, business_name: str, driver: webdriver.Chrome, debu
         return [], {}, "failed" # Mark as failed due to circuit breaker
 
 
-    # --- Attempt 1: Requests ---
-    req_emails_ctx, html_content = [], None
+    # --- Tier 1: Requests (static HTML) ---
+    # The page is parsed once; emails, social links and anchors all come from that pass
+    html_content: Optional[str] = None
+    home_page: Optional[Dict[str, Any]] = None
+    homepage_url: Optional[str] = None # Final URL after redirects, if the static fetch worked
     try:
         log.debug(f"[{domain}] Trying requests method...")
-        req_emails_ctx, html_content = requests_emails(site, debug)
-        all_emails_with_context.extend(req_emails_ctx)
-        for email, _ in req_emails_ctx: unique_emails_found.add(email)
-
-        # Extract social media from requests HTML if content was retrieved
-        if html_content:
-            social_profiles.update(extract_social_media(html_content, site))
+        home_page = requests_page(site, debug, pages.get(site))
+        if home_page is not None:
+            html_content = home_page["html"]
+            homepage_url = home_page["final_url"]
+            all_emails_with_context.extend(home_page["emails"])
+            for email, _ in home_page["emails"]: unique_emails_found.add(email)
+
+            social_profiles.update(home_page["social"])
             if social_profiles: log.debug(f"[{domain}] Found social via requests: {list(social_profiles.keys())}")
 
         if unique_emails_found:
              log.info(f"[{domain}] Found {len(unique_emails_found)} emails via requests.")
-             # Consider stopping here if requests found emails? Or always try Selenium for more?
-             # Decision: Always try Selenium for potentially more emails/social links unless requests failed badly
 
     except Exception as e_req:
-        # This catch block is mostly for unexpected errors within requests_emails itself
+        # This catch block is mostly for unexpected errors within requests_page itself
         log.error(f"[{domain}] Unexpected error during requests phase: {e_req}", exc_info=debug)
         # Don't mark as failed yet, Selenium might work
 
-    # --- Attempt 2: Selenium (Main Page) ---
-    # Run Selenium if requests found nothing, or always run it for better coverage?
-    # Decision: Always run Selenium unless requests failed catastrophically (which it shouldn't here)
-    selenium_worked = False
-    try:
-        log.debug(f"[{domain}] Trying Selenium method (main page)...")
-        if not is_driver_alive(driver):
-             log.error(f"[{domain}] Driver died before Selenium main page attempt for {site}")
-             raise WebDriverException("Driver died") # Trigger circuit breaker
+    # --- Tier decision: is the static result good enough? ---
+    confidence = static_confidence(all_emails_with_context, domain)
+    static_confident = not ALWAYS_RENDER and confidence >= STATIC_CONFIDENCE_THRESHOLD
+    if ALWAYS_RENDER:
+        render_reason = "always-render"
+    elif html_content is None:
+        render_reason = "static fetch failed"
+    else:
+        render_reason = js_rendering_signal(html_content)
 
-        selenium_main_emails_ctx = selenium_emails(driver, site, debug)
-        for email, ctx in selenium_main_emails_ctx:
+    if static_confident:
+        log.info(f"[{domain}] Static pass confident (score {confidence} >= {STATIC_CONFIDENCE_THRESHOLD}), skipping Selenium.")
+    elif render_reason:
+        log.debug(f"[{domain}] Escalating to Selenium: {render_reason}")
+    else:
+        log.debug(f"[{domain}] Static page has no JS-rendering signals (score {confidence}), staying static.")
+
+    # --- Tier 2: Selenium (Main Page) ---
+    # Only rendered when the static HTML is missing or looks JS-dependent
+    selenium_worked = False
+    rendered_links: Optional[List[str]] = None # Contact links discovered in the rendered DOM
+    saved = checkpoint.get("selenium_main") if checkpoint else None
+    if not static_confident and render_reason and saved is not None:
+        log.debug(f"[{domain}] Resuming: Selenium main page already done in an earlier attempt")
+        for email, ctx in saved["emails"]:
             if email not in unique_emails_found:
                  all_emails_with_context.append((email, ctx))
                  unique_emails_found.add(email)
-
-        # Extract social media using Selenium (might find more than requests)
-        selenium_social = extract_social_media_selenium(driver)
-        if selenium_social:
-            log.debug(f"[{domain}] Found/updated social via Selenium: {list(selenium_social.keys())}")
-            social_profiles.update(selenium_social) # Update/add Selenium findings
-
-        selenium_worked = True # Mark Selenium main page attempt as successful (even if no emails found)
-
-
-    except (WebDriverException, TimeoutException) as e_main_selenium:
-        log.warning(f"[{domain}] Selenium failed on main page {site}: {type(e_main_selenium).__name__} - {e_main_selenium}")
-        circuit_breaker.record_failure(domain) # Record failure for this domain
-        # Don't necessarily stop, contact pages might still work if it was just the homepage
-    except Exception as e_main_unexp:
-         log.error(f"[{domain}] Unexpected error during Selenium main page processing for {site}: {e_main_unexp}", exc_info=debug)
-         circuit_breaker.record_failure(domain)
-
-
-    # --- Attempt 3: Selenium (Contact Pages) ---
-    # Only check contact pages if no emails were found so far OR if Selenium worked on main page
-    if (not unique_emails_found or selenium_worked) and len(unique_emails_found) < 3 : # Heuristic: check contact if few emails found
-        log.debug(f"[{domain}] Checking contact pages...")
-        for path in CONTACT_PATHS:
-            # Avoid checking home page again if path is '/' or empty
-            if not path or path == '/': continue
-
-            contact_url = site.rstrip('/') + path
+        social_profiles.update(saved["social"])
+        rendered_links = saved["links"]
+        selenium_worked = True
+    elif not static_confident and render_reason and not out_of_budget("Selenium main page"):
+        try:
+            log.debug(f"[{domain}] Trying Selenium method (main page)...")
+            drv = browser()
+            if not browser_alive(drv):
+                 log.error(f"[{domain}] Driver died before Selenium main page attempt for {site}")
+                 raise WebDriverException("Driver died") # Trigger circuit breaker
+
+            host_politeness.wait(domain) # The static pass just hit this host
+
+            selenium_main_emails_ctx, payload = render(drv, site)
+            if (not selenium_main_emails_ctx and not unique_emails_found and not out_of_budget("full-load retry")
+                    and resource_blocker and resource_blocker.fall_back(domain)):
+                # Blocked scripts/resources may be what renders the contact details; retry with everything
+                host_politeness.wait(domain)
+                selenium_main_emails_ctx, payload = render(drv, site)
+            for email, ctx in selenium_main_emails_ctx:
+                if email not in unique_emails_found:
+                     all_emails_with_context.append((email, ctx))
+                     unique_emails_found.add(email)
+
+            # Extract social media from the same payload (might find more than requests)
+            selenium_social = social_from_payload(payload)
+            if selenium_social:
+                log.debug(f"[{domain}] Found/updated social via Selenium: {list(selenium_social.keys())}")
+                social_profiles.update(selenium_social) # Update/add Selenium findings
+
+            selenium_worked = True # Mark Selenium main page attempt as successful (even if no emails found)
+            if payload and payload["source"]: # Rendered DOM has JS-built navigation links
+                rendered_links = discover_contact_links(payload["source"], homepage_url or site)
+            if checkpoint:
+                checkpoint.save("selenium_main", url=site, emails=selenium_main_emails_ctx,
+                                social=selenium_social, links=rendered_links)
+
+
+        except (WebDriverException, TimeoutException) as e_main_selenium:
+            log.warning(f"[{domain}] Selenium failed on main page {site}: {type(e_main_selenium).__name__} - {e_main_selenium}")
+            circuit_breaker.record_failure(domain) # Record failure for this domain
+            # Don't necessarily stop, contact pages might still work if it was just the homepage
+        except Exception as e_main_unexp:
+             log.error(f"[{domain}] Unexpected error during Selenium main page processing for {site}: {e_main_unexp}", exc_info=debug)
+             circuit_breaker.record_failure(domain)
+
+    main_page_ok = selenium_worked or (html_content is not None and not render_reason)
+
+
+    # --- Tier 3: Contact Pages (static first, Selenium only when needed) ---
+    # Only check contact pages if no emails were found so far OR if the main page was processed
+    if not static_confident and (not unique_emails_found or main_page_ok) and len(unique_emails_found) < 3 : # Heuristic: check contact if few emails found
+        # Follow the homepage's own contact/about links first; only fall back to
+        # pre-checking the blind CONTACT_PATHS list when there are none
+        if rendered_links is not None:
+            contact_pages = rendered_links
+        else:
+            contact_pages = discover_contact_links(None, homepage_url or site, anchors=home_page["anchors"] if home_page else [])
+        if contact_pages:
+            log.debug(f"[{domain}] Discovered contact links: {contact_pages}")
+        else:
+            contact_pages = probe_contact_paths(site, homepage_url, pages)
+        log.debug(f"[{domain}] Checking {len(contact_pages)} contact pages...")
+        for contact_url in contact_pages:
+            path = urllib.parse.urlparse(contact_url).path or '/'
+            if out_of_budget(f"contact page {path}"):
+                break
             log.debug(f"[{domain}] Checking contact page: {contact_url}")
 
             try:
-                 if not is_driver_alive(driver):
-                     log.error(f"[{domain}] Driver died before Selenium contact page attempt for {contact_url}")
-                     raise WebDriverException("Driver died")
+                 contact_emails_ctx: List[Tuple[str, Dict[str, Any]]] = []
+                 contact_social: Dict[str, str] = {}
+                 render_contact = bool(render_reason)
+                 saved = checkpoint.get(f"contact:{contact_url}") if checkpoint else None
+
+                 if saved is not None:
+                     log.debug(f"[{domain}] Resuming: contact page {path} already done in an earlier attempt")
+                     contact_emails_ctx = saved["emails"]
+                     contact_social = saved["social"]
+                     render_contact = False
+                 elif not render_contact:
+                     # Site is static: fetch the contact page with requests and only
+                     # render it if this particular page needs JavaScript
+                     host_politeness.wait(domain) # Space out hits on this host (other hosts never wait)
+                     contact_page = requests_page(contact_url, debug, pages.get(contact_url))
+                     if contact_page is None:
+                         continue # Missing page (404 etc.), nothing to render either
+                     contact_emails_ctx = contact_page["emails"]
+                     contact_social = dict(contact_page["social"])
+                     if js_rendering_signal(contact_page["html"]):
+                         log.debug(f"[{domain}] Contact page {path} needs rendering, escalating to Selenium")
+                         render_contact = True
+
+                 if render_contact:
+                     drv = browser()
+                     if not browser_alive(drv):
+                         log.error(f"[{domain}] Driver died before Selenium contact page attempt for {contact_url}")
+                         raise WebDriverException("Driver died")
+
+                     host_politeness.wait(domain)
+                     rendered_ctx, payload = render(drv, contact_url)
+                     contact_emails_ctx = contact_emails_ctx + rendered_ctx
+                     contact_social.update(social_from_payload(payload))
+
+                 if checkpoint and saved is None:
+                     checkpoint.save(f"contact:{contact_url}", url=contact_url, emails=contact_emails_ctx, social=contact_social)
 
-                 contact_emails_ctx = selenium_emails(driver, contact_url, debug)
                  newly_found_count = 0
                  for email, ctx in contact_emails_ctx:
                      if email not in unique_emails_found:
@@ -2036,17 +4320,18 @@ def harvest_emails(site: str, business_name: str, driver: webdriver.Chrome, debu
                      log.info(f"[{domain}] Found {newly_found_count} new emails on contact page {path}")
 
                  # Extract/update social media from contact page
-                 contact_social = extract_social_media_selenium(driver)
                  if contact_social:
                      log.debug(f"[{domain}] Found/updated social via contact page {path}: {list(contact_social.keys())}")
                      social_profiles.update(contact_social)
 
-                 # Optional: Stop checking contact pages if enough emails found?
+                 # Stop checking contact pages once we are confident or have a few emails
+                 if static_confidence(all_emails_with_context, domain) >= STATIC_CONFIDENCE_THRESHOLD and not ALWAYS_RENDER:
+                      log.debug(f"[{domain}] Confident result found on {path}, stopping contact page search.")
+                      break
                  if len(unique_emails_found) >= 3: # Heuristic: Stop if we have a few emails
                       log.debug(f"[{domain}] Found sufficient emails ({len(unique_emails_found)}), stopping contact page search.")
                       break
 
-                 rdelay(CONTACT_WAIT_MIN, CONTACT_WAIT_MAX) # Delay between contact page checks
 
             except (WebDriverException, TimeoutException) as e_contact_selenium:
                  log.warning(f"[{domain}] Selenium failed on contact page {contact_url}: {type(e_contact_selenium).__name__} - {e_contact_selenium}")
@@ -2059,8 +4344,8 @@ def harvest_emails(site: str, business_name: str, driver: webdriver.Chrome, debu
                  log.error(f"[{domain}] Unexpected error processing contact page {contact_url}: {e_contact_unexp}", exc_info=debug)
                  # Continue to next contact page
 
-            # Break loop immediately if driver died
-            if not is_driver_alive(driver):
+            # Break loop immediately if the driver died
+            if render_reason and browser_dead():
                  log.error(f"[{domain}] Driver died during contact page processing. Stopping search for {site}")
                  circuit_breaker.record_failure(domain)
                  status = "failed" # Mark as failed if driver died
@@ -2068,33 +4353,15 @@ def harvest_emails(site: str, business_name: str, driver: webdriver.Chrome, debu
 
 
     # --- Final Processing ---
-    # Clean the combined list of emails (including duplicates with different contexts)
-    cleaned_raw_emails = clean_emails([e for e, _ in all_emails_with_context])
-    if debug and len(cleaned_raw_emails) != len(unique_emails_found):
-         log.debug(f"[{domain}] Initial unique count: {len(unique_emails_found)}, after clean_emails: {len(cleaned_raw_emails)}")
-         unique_emails_found = set(cleaned_raw_emails) # Update unique set after cleaning
-
-    # Score the emails using their contexts
-    scored_emails: List[Tuple[str, int]] = []
-    email_contexts: Dict[str, Dict[str, Any]] = {}
-
-    # Combine contexts for unique emails before scoring
-    for email, context in all_emails_with_context:
-        email_clean = email.strip().lower()
-        if email_clean in unique_emails_found: # Only process cleaned, unique emails
-             if email_clean not in email_contexts:
-                 email_contexts[email_clean] = {}
-             # Merge contexts, favoring True values
-             for key, value in context.items():
-                 if value:
-                     email_contexts[email_clean][key] = True
-
-    # Now score based on combined context
-    for email in unique_emails_found:
-        combined_context = email_contexts.get(email, {})
-        score = score_email(email, domain, combined_context)
-        scored_emails.append((email, score))
-        if debug: log.debug(f"[{domain}] Scored '{email}': {score} (Context: {combined_context})")
+    # Clean, dedup and score every sighting (contexts of repeated sightings are combined first)
+    scored_emails = score_emails(all_emails_with_context, domain)
+    if candidates is not None:
+        candidates.extend(all_emails_with_context)
+    if debug:
+         if len(scored_emails) != len(unique_emails_found):
+              log.debug(f"[{domain}] Initial unique count: {len(unique_emails_found)}, after cleaning: {len(scored_emails)}")
+         for email, score in scored_emails:
+              log.debug(f"[{domain}] Scored '{email}': {score}")
 
     # Prioritize based on score
     prioritized_emails = prioritize_emails(scored_emails)
@@ -2118,6 +4385,9 @@ def harvest_emails(site: str, business_name: str, driver: webdriver.Chrome, debu
          log.info(f"[{domain}] CHECKED: No emails found.")
     else:
          log.warning(f"[{domain}] FAILED: Processing ended with status 'failed'.")
+    if budget_hit and status != "failed":
+        status = "partial" # Results are kept, but not every page was looked at
+        log.info(f"[{domain}] PARTIAL: Site budget ran out with {len(prioritized_emails)} emails found.")
 
 
     # Clean up social profiles (remove fragments, ensure https)
@@ -2145,24 +4415,465 @@ def harvest_emails(site: str, business_name: str, driver: webdriver.Chrome, debu
     return prioritized_emails, final_social_profiles, status
 
 
+# ───────────────── CDP Browser Backend ───────────────────
+# Consent iframes as {src, css}, found the same way the Selenium iframe strategy finds them
+CONSENT_FRAMES_JS = r"""
+const terms = arguments[0];
+const out = [];
+for (const f of document.querySelectorAll('iframe')) {
+    const attrs = ((f.id || '') + ' ' + (f.src || '') + ' ' + (f.title || '')).toLowerCase();
+    if (!f.src || !terms.some(t => attrs.includes(t))) continue;
+    const css = f.id ? 'iframe[id="' + CSS.escape(f.id) + '"]' :
+                f.title ? 'iframe[title="' + CSS.escape(f.title) + '"]' : 'iframe[src="' + CSS.escape(f.src) + '"]';
+    out.push({src: f.src, css: css});
+}
+return out;
+"""
+
+
+class CdpError(WebDriverException):
+    """A DevTools command failed or the browser went away. Subclasses WebDriverException so
+    harvest_emails' error handling and the circuit breaker treat it like a Selenium failure."""
+
+
+class CdpConnection:
+    """The DevTools websocket to one Chrome; every page is a flattened target session on it.
+    Lives on CdpBackend's event loop: responses and events are dispatched by one reader task."""
+
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+        self.http = None
+        self.ws = None
+        self.next_id = 0
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.waiters: Dict[Tuple[Optional[str], str], List[asyncio.Future]] = {} # (sessionId, event) -> futures
+        self.dead_sessions: Set[str] = set() # Crashed or detached pages
+        self.closed = False
+        self.reader: Optional[asyncio.Task] = None
+
+    async def connect(self):
+        self.http = aiohttp.ClientSession()
+        self.ws = await self.http.ws_connect(self.ws_url, max_msg_size=0, heartbeat=None)
+        self.reader = asyncio.ensure_future(self._read())
+
+    async def _read(self):
+        try:
+            async for msg in self.ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                data = json.loads(msg.data)
+                if "id" in data:
+                    fut = self.pending.pop(data["id"], None)
+                    if fut and not fut.done():
+                        if "error" in data:
+                            fut.set_exception(CdpError(f"{data['error'].get('message')} ({data['error'].get('code')})"))
+                        else:
+                            fut.set_result(data.get("result", {}))
+                    continue
+                method, params, session_id = data.get("method"), data.get("params", {}), data.get("sessionId")
+                if method == "Inspector.targetCrashed":
+                    self.dead_sessions.add(session_id)
+                elif method == "Target.detachedFromTarget":
+                    self.dead_sessions.add(params.get("sessionId"))
+                for fut in self.waiters.pop((session_id, method), []):
+                    if not fut.done():
+                        fut.set_result(params)
+        except Exception as e:
+            log.debug(f"CDP connection reader stopped: {e}")
+        finally:
+            self.closed = True
+            for fut in list(self.pending.values()) + [f for futs in self.waiters.values() for f in futs]:
+                if not fut.done():
+                    fut.set_exception(CdpError("Browser connection closed"))
+            self.pending.clear()
+            self.waiters.clear()
+
+    def expect(self, event: str, session_id: Optional[str] = None) -> asyncio.Future:
+        """Future for the next occurrence of event; register it before triggering the event."""
+        fut = asyncio.get_event_loop().create_future()
+        self.waiters.setdefault((session_id, event), []).append(fut)
+        return fut
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None,
+                   session_id: Optional[str] = None, timeout: float = 30.0) -> Dict[str, Any]:
+        if self.closed:
+            raise CdpError("Browser connection closed")
+        self.next_id += 1
+        msg_id = self.next_id
+        fut = asyncio.get_event_loop().create_future()
+        self.pending[msg_id] = fut
+        message: Dict[str, Any] = {"id": msg_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        await self.ws.send_str(json.dumps(message))
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            self.pending.pop(msg_id, None)
+            raise CdpError(f"{method} timed out after {timeout:.0f}s")
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+        if self.http is not None:
+            await self.http.close()
+
+
+class CdpPage:
+    """One site's tab in its own browser context (fresh cookies and storage, like a new
+    Selenium driver), driven asynchronously over the shared CdpConnection.
+    execute_cdp_cmd() is the one synchronous call, so ResourceBlocker works on it unchanged."""
+
+    def __init__(self, backend: "CdpBackend", conn: CdpConnection, context_id: str, target_id: str, session_id: str):
+        self.backend = backend
+        self.conn = conn
+        self.context_id = context_id
+        self.target_id = target_id
+        self.session_id = session_id
+
+    @classmethod
+    async def open(cls, backend: "CdpBackend", conn: CdpConnection) -> "CdpPage":
+        context_id = (await conn.send("Target.createBrowserContext", {"disposeOnDetach": True}))["browserContextId"]
+        target_id = (await conn.send("Target.createTarget", {"url": "about:blank", "browserContextId": context_id}))["targetId"]
+        session_id = (await conn.send("Target.attachToTarget", {"targetId": target_id, "flatten": True}))["sessionId"]
+        page = cls(backend, conn, context_id, target_id, session_id)
+        await page.cmd("Page.enable")
+        await page.cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_SCRIPT})
+        await page.cmd("Network.setUserAgentOverride", {"userAgent": random.choice(UA_POOL), "acceptLanguage": "en-GB,en;q=0.9"})
+        return page
+
+    async def cmd(self, method: str, params: Optional[Dict[str, Any]] = None, timeout: float = 30.0) -> Dict[str, Any]:
+        return await self.conn.send(method, params, self.session_id, timeout)
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: Dict[str, Any]) -> Dict[str, Any]:
+        return self.backend.run(self.cmd(cmd, cmd_args))
+
+    @property
+    def alive(self) -> bool:
+        return not self.conn.closed and self.session_id not in self.conn.dead_sessions
+
+    async def evaluate(self, script: str, *args: Any, context_id: Optional[int] = None) -> Any:
+        """Run a WebDriver-style script body (arguments[...], return) and return its JSON value."""
+        params: Dict[str, Any] = {"expression": f"(function () {{{script}\n}}).apply(null, {json.dumps(list(args))})",
+                                  "returnByValue": True}
+        if context_id is not None:
+            params["contextId"] = context_id
+        result = await self.cmd("Runtime.evaluate", params)
+        if "exceptionDetails" in result:
+            raise CdpError(f"Script error: {result['exceptionDetails'].get('text')}")
+        return result.get("result", {}).get("value")
+
+    async def extract(self, url: str, debug: bool = False,
+                      deadline: Optional[float] = None) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        """CDP counterpart of selenium_extract(): same navigation, consent handling and PAGE_EXTRACT_JS payload,
+        but waits on the page's own load events instead of WebDriver polling."""
+        timeout = PAGE_LOAD_TIMEOUT if deadline is None else max(1.0, min(PAGE_LOAD_TIMEOUT, deadline - time.time()))
+        event = "Page.loadEventFired" if PAGE_LOAD_STRATEGY == "normal" else "Page.domContentEventFired"
+        log.debug(f"Navigating to {url} over CDP")
+        loaded = self.conn.expect(event, self.session_id)
+        nav = await self.cmd("Page.navigate", {"url": url}, timeout)
+        if nav.get("errorText"):
+            loaded.cancel()
+            raise CdpError(f"Navigation to {url} failed: {nav['errorText']}")
+        try:
+            await asyncio.wait_for(loaded, timeout)
+        except asyncio.TimeoutError:
+            log.warning(f"Timeout loading {url}")
+            await self.cmd("Page.stopLoading") # Extract from whatever loaded, as the Selenium path does
+        if not self.alive:
+            raise CdpError(f"Page crashed while loading {url}")
+
+        if await self.dismiss_consent(get_domain(url)):
+            log.debug(f"Cookie consent likely dismissed for {url}")
+
+        try:
+            payload = await self.evaluate(PAGE_EXTRACT_JS, SOCIAL_ICON_SELECTOR)
+        except CdpError as e:
+            log.debug(f"JavaScript execution error for page extraction: {e}")
+            payload = None
+        if not isinstance(payload, dict) or not payload.get("source"):
+            log.warning(f"Page source is empty for {url}")
+            return [], None
+        found_emails_with_context = emails_from_payload(payload, url, debug)
+        log.debug(f"Finished CDP extraction for {url}. Found {len(found_emails_with_context)} raw email instances.")
+        return found_emails_with_context, payload
+
+    async def dismiss_consent(self, domain: str) -> bool:
+        """dismiss_cookie_consent() for CDP pages, sharing the same per-domain ConsentMemo."""
+        known = consent_memo.get(domain) if consent_memo and domain else None
+        try:
+            if known:
+                if known.get("strategy") == "none":
+                    return False
+                banner = (await self.wait_for_banner())[0] # Late-injected banners must be there before replaying
+                if await self.replay_consent(known):
+                    return True
+                if not banner:
+                    return False # Consent cookie from an earlier page of this site: the memo still holds
+                consent_memo.forget(domain)
+            outcome = await self.find_consent_action()
+        except CdpError as e:
+            log.debug(f"Cookie consent handling failed: {e}")
+            return False
+        memoise_consent(domain, outcome)
+        return bool(outcome) and outcome["strategy"] != "none"
+
+    async def wait_for_banner(self) -> Tuple[bool, bool]:
+        """wait_for_consent_banner() over CDP: (banner visible, settled)."""
+        state = {"ready": "complete", "banner": True}
+        until = time.time() + CONSENT_APPEAR_TIMEOUT + CONSENT_SETTLE_TIMEOUT
+        loaded_at: Optional[float] = None
+        while time.time() < until:
+            state = await self.evaluate(CONSENT_BANNER_JS) or state
+            if state["banner"]:
+                return True, True
+            if state["ready"] == "complete":
+                loaded_at = loaded_at or time.time()
+                if time.time() - loaded_at >= CONSENT_SETTLE_TIMEOUT:
+                    return False, True
+            await asyncio.sleep(0.1)
+        return state["banner"], False
+
+    async def find_consent_action(self) -> Optional[Dict[str, Any]]:
+        banner, settled = await self.wait_for_banner()
+        if not banner:
+            return {"strategy": "none", "settled": settled}
+        clicked = await self.click_consent(None)
+        if clicked:
+            return {"strategy": "button", "selector": clicked["selector"]}
+        for frame in await self.evaluate(CONSENT_FRAMES_JS, list(CONSENT_FRAME_TERMS)) or []:
+            context_id = await self.frame_context(frame["src"])
+            clicked = await self.click_consent(None, context_id) if context_id else None
+            if clicked:
+                log.debug("Cookie consent dismissed within iframe.")
+                return {"strategy": "iframe", "frame": frame["css"], "selector": clicked["selector"]}
+        return None
+
+    async def replay_consent(self, known: Dict[str, Any]) -> bool:
+        try:
+            if known.get("strategy") == "button":
+                return await self.click_consent(known.get("selector")) is not None
+            if known.get("strategy") == "iframe" and known.get("frame"):
+                src = await self.evaluate("const f = document.querySelector(arguments[0]); return f ? f.src : null;", known["frame"])
+                context_id = await self.frame_context(src) if src else None
+                return bool(context_id) and await self.click_consent(known.get("selector"), context_id) is not None
+        except CdpError as e:
+            log.debug(f"Replaying consent action failed: {e}")
+        return False
+
+    async def frame_context(self, src: str) -> Optional[int]:
+        """Execution context in the child frame loaded from src. The browser runs without site
+        isolation, so even cross-origin frames are reachable from this page's session."""
+        tree = (await self.cmd("Page.getFrameTree"))["frameTree"]
+        stack = list(tree.get("childFrames", []))
+        while stack:
+            node = stack.pop()
+            if node["frame"].get("url") == src:
+                world = await self.cmd("Page.createIsolatedWorld", {"frameId": node["frame"]["id"], "worldName": "gmb-consent",
+                                                                    "grantUniveralAccess": True})
+                return world["executionContextId"]
+            stack.extend(node.get("childFrames", []))
+        return None
+
+    async def click_consent(self, selector: Optional[str], context_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        hit = await self.evaluate(CONSENT_MATCHER_JS, selector, context_id=context_id)
+        if not hit:
+            return None
+        log.debug(f"Clicked cookie button '{hit.get('selector')}' via consent matcher.")
+        # Wait for the button (and with it the banner) to go away, not a fixed pause
+        until = time.time() + CONSENT_CLOSE_TIMEOUT
+        while time.time() < until:
+            try:
+                if await self.evaluate(CONSENT_GONE_JS, context_id=context_id):
+                    break
+            except CdpError:
+                break # Context gone (navigated away): the banner is handled either way
+            await asyncio.sleep(0.1)
+        return {"selector": hit.get("selector")}
+
+    async def close(self):
+        if self.conn.closed:
+            return
+        try:
+            await self.conn.send("Target.closeTarget", {"targetId": self.target_id}, timeout=10)
+            await self.conn.send("Target.disposeBrowserContext", {"browserContextId": self.context_id}, timeout=10)
+        except CdpError as e:
+            log.debug(f"Could not close CDP page cleanly: {e}")
+
+
+class CdpBackend(BrowserBackend):
+    """Browser backend that drives one headless Chrome over the DevTools protocol from a single
+    asyncio event loop, instead of a blocking WebDriver HTTP session per browser. Worker threads
+    keep their synchronous API: each call is run on the loop and waited for."""
+
+    def __init__(self, size: int, headless: bool, debug: bool = False, chrome_binary: Optional[str] = None):
+        if aiohttp is None:
+            raise RuntimeError("The cdp browser backend needs aiohttp (pip install aiohttp)")
+        self.size = max(1, size)
+        self.headless = headless
+        self.debug = debug
+        self.binary = chrome_binary or next(filter(None, map(shutil.which, CHROME_BINARIES)), None)
+        if not self.binary:
+            raise RuntimeError(f"No Chrome binary found (tried {', '.join(CHROME_BINARIES)}); use --chrome-binary")
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._browser_lock = threading.Lock()
+        self._proc = None
+        self._profile: Optional[str] = None
+        self._conn: Optional[CdpConnection] = None
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="CdpLoop", daemon=True)
+        self._thread.start()
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the backend's event loop from a worker thread and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def _browser(self) -> CdpConnection:
+        """The live browser connection, (re)starting Chrome if it is not running."""
+        with self._browser_lock:
+            if self._closed:
+                raise RuntimeError("Driver pool is closed")
+            if self._conn and not self._conn.closed and self._proc.poll() is None:
+                return self._conn
+            self._stop_browser()
+            self._profile = tempfile.mkdtemp(prefix="gmb-cdp-")
+            cmd = [self.binary, "--remote-debugging-port=0", f"--user-data-dir={self._profile}",
+                   "--no-first-run", "--no-default-browser-check", "--disable-gpu", "--disable-dev-shm-usage",
+                   "--no-sandbox", "--disable-extensions", "--mute-audio", "--window-size=1366,768",
+                   "--disable-blink-features=AutomationControlled",
+                   "--disable-background-timer-throttling", "--disable-renderer-backgrounding",
+                   "--disable-backgrounding-occluded-windows",
+                   # Keep cross-origin (consent) iframes in-process so one page session reaches them
+                   "--disable-features=IsolateOrigins,site-per-process", "about:blank"]
+            if self.headless:
+                cmd.insert(1, "--headless=new")
+            self._proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # Chrome writes the port it picked and the browser websocket path here
+            port_file = os.path.join(self._profile, "DevToolsActivePort")
+            started = time.time()
+            while True:
+                try:
+                    with open(port_file) as f:
+                        lines = f.read().split("\n")
+                    if len(lines) >= 2 and lines[1]:
+                        break
+                except FileNotFoundError:
+                    pass
+                if self._proc.poll() is not None or time.time() - started > CDP_STARTUP_TIMEOUT:
+                    raise CdpError(f"Chrome did not start ({self.binary})")
+                time.sleep(0.1)
+            conn = CdpConnection(f"ws://127.0.0.1:{lines[0].strip()}{lines[1].strip()}")
+            self.run(conn.connect(), CDP_STARTUP_TIMEOUT)
+            self._conn = conn
+            log.info(f"CDP backend: Chrome started (pid {self._proc.pid}), up to {self.size} pages at once")
+            return conn
+
+    def _stop_browser(self):
+        if self._conn:
+            try: self.run(self._conn.close(), 10)
+            except Exception as e: log.debug(f"Error closing CDP connection: {e}")
+            self._conn = None
+        if self._proc and self._proc.poll() is None:
+            self._proc.terminate()
+            try: self._proc.wait(10)
+            except Exception: self._proc.kill()
+        self._proc = None
+        if self._profile:
+            shutil.rmtree(self._profile, ignore_errors=True)
+            self._profile = None
+
+    def acquire(self) -> Optional[CdpPage]:
+        """Open a fresh page (own browser context). Blocks while size pages are leased."""
+        self._slots.acquire()
+        try:
+            conn = self._browser()
+            page = self.run(CdpPage.open(self, conn), CDP_STARTUP_TIMEOUT)
+            if resource_blocker: resource_blocker.setup(page)
+            return page
+        except (CdpError, OSError) as e:
+            log.error(f"Failed to open CDP page: {e}")
+            self._slots.release()
+            return None
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, page: Optional[CdpPage], recycle: bool = False):
+        """Close the page and its browser context; nothing is reused, so recycle needs no extra work."""
+        if page is None:
+            return
+        try:
+            self.run(page.close(), 30)
+        except Exception as e:
+            log.debug(f"Error closing CDP page: {e}")
+        finally:
+            self._slots.release()
+
+    def extract(self, page: CdpPage, url: str, debug: bool = False,
+                deadline: Optional[float] = None) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        if not page.alive:
+            raise CdpError("Page is not alive")
+        if resource_blocker: resource_blocker.apply(page, get_domain(url))
+        load_started = time.time()
+        result = self.run(page.extract(url, debug, deadline))
+        if concurrency:
+            concurrency.observe_page(time.time() - load_started)
+        return result
+
+    def alive(self, page: Optional[CdpPage]) -> bool:
+        return page is not None and page.alive and self._proc is not None and self._proc.poll() is None
+
+    def close_all(self):
+        with self._browser_lock:
+            self._closed = True
+            self._stop_browser()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        log.info("CDP backend closed.")
+
+
 # ───────────────── Worker Function ────────────────────
 # Flag for signal handling
 shutdown_flag = False
+shutdown_event = threading.Event() # Set alongside shutdown_flag, for waits that should end on a signal
 
 def signal_handler(signum, frame):
     """Sets the shutdown flag upon receiving SIGINT or SIGTERM."""
     global shutdown_flag
     log.warning(f"Received signal {signum}. Initiating graceful shutdown...")
     shutdown_flag = True
+    shutdown_event.set()
+    if mongo_writer:
+        mongo_writer.request_flush() # Get finished results into MongoDB before anything else
+
+def group_records_by_site(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Collapse records that share a website (chains, group booking pages) into one task each.
+    The first record of each group is scraped; its "_group_ids" lists every _id the result is written to."""
+    groups: Dict[str, Dict[str, Any]] = {}
+    tasks: List[Dict[str, Any]] = []
+    for record in records:
+        key = site_key(record.get("website"))
+        lead = groups.get(key) if key else None
+        if lead is None:
+            record["_group_ids"] = [record["_id"]]
+            tasks.append(record)
+            if key:
+                groups[key] = record
+        else:
+            lead["_group_ids"].append(record["_id"])
+    return tasks
 
-def process_business(record: Dict[str, Any], collection, headless: bool, debug: bool) -> Tuple[str, str, int, int]:
-    """Processes a single business record: creates driver, scrapes, updates DB."""
+
+def process_business(record: Dict[str, Any], writer: MongoBatchWriter, driver_pool: BrowserBackend, debug: bool) -> Tuple[str, str, int, int]:
+    """Processes a single business record: scrapes (leasing a pooled driver if needed), queues the DB update.
+    The result is written to every record in the task's "_group_ids" (records sharing the website)."""
     business_id = record.get('_id')
+    business_ids = record.pop("_group_ids", None) or [business_id]
     website = record.get('website')
     business_name = record.get('businessname', 'Unknown Business')
-    log.info(f"Processing: {business_name} ({website})")
+    log.info(f"Processing: {business_name} ({website})" + (f" for {len(business_ids)} records sharing it" if len(business_ids) > 1 else ""))
 
-    driver = None
+    lease = DriverLease(driver_pool)
     emails = []
     social_profiles = {}
     status = "failed" # Default to failed unless successful
@@ -2176,44 +4887,40 @@ def process_business(record: Dict[str, Any], collection, headless: bool, debug:
                 "emailstatus": status,
                 "email": [],
                 "social_profiles": {},
+                "email_candidates": [],
                 "emailscraped_at": datetime.utcnow()
             }
-            collection.update_one({"_id": business_id}, {"$set": update_data})
+            writer.submit(result_update(business_ids, update_data))
             return business_id, status, 0, 0
 
-        # Create a new driver instance for this task
-        log.debug(f"Creating new driver for {business_name}")
-        driver = make_driver(headless, debug)
-        if driver is None:
-            log.error(f"Failed to create driver for {business_name}, marking as failed.")
-            status = "failed"
-            domain = get_domain(normalize_url(website))
-            circuit_breaker.record_failure(domain) # Record failure if driver creation fails
-            raise Exception("Driver creation failed") # Propagate failure
-
-
-        emails, social_profiles, status = harvest_emails(website, business_name, driver, debug)
+        checkpoint = checkpoint_journal.checkpoint(business_id) if checkpoint_journal else None
+        if checkpoint and checkpoint.result:
+            # Finished before an interruption but the result never reached MongoDB
+            log.info(f"Resuming {business_name}: using journaled result")
+            emails, social_profiles, status = checkpoint.result["emails"], checkpoint.result["social"], checkpoint.result["status"]
+            candidates = checkpoint.result.get("candidates", []) # Absent in journals from older versions
+        else:
+            # A warm driver is only leased from the pool if a page needs rendering
+            sightings: List[Tuple[str, Dict[str, Any]]] = []
+            emails, social_profiles, status = harvest_emails(website, business_name, lease, debug,
+                                                             prefetched=record.pop("_prefetched", None),
+                                                             checkpoint=checkpoint, candidates=sightings)
+            candidates = email_candidates_doc(sightings)
+            if checkpoint_journal:
+                checkpoint_journal.finish(business_id, emails, social_profiles, status, candidates)
 
         # Update MongoDB record
-        log.debug(f"Updating DB for {business_name} with status: {status}")
+        log.debug(f"Queueing DB update for {business_name} with status: {status}")
         update_data = {
             "emailstatus": status,
             "email": emails[:10], # Store top 10 emails found
             "social_profiles": social_profiles,
+            "email_candidates": candidates, # Raw sightings, so --rescore can re-rank without re-scraping
             "emailscraped_at": datetime.utcnow()
         }
-        try:
-            result = collection.update_one({"_id": business_id}, {"$set": update_data})
-            if result.matched_count == 0:
-                log.warning(f"Could not find record with ID {business_id} to update.")
-            elif result.modified_count == 0 and result.matched_count == 1:
-                 log.debug(f"Record {business_id} already had the same data.")
-
-
-        except PyMongoError as e_update:
-            log.error(f"Failed to update MongoDB for {business_name} (ID: {business_id}): {e_update}")
-            # Don't change status back to failed if scraping succeeded but DB failed
-            # Maybe retry update later? For now, log the error.
+        # One update fans the result out to every record sharing this website;
+        # the writer thread batches it with other workers' results (and retries transient errors)
+        writer.submit(result_update(business_ids, update_data))
 
 
         return business_id, status, len(emails), len(social_profiles)
@@ -2221,10 +4928,11 @@ def process_business(record: Dict[str, Any], collection, headless: bool, debug:
     except Exception as e:
         log.error(f"Error processing {business_name} ({website}): {e}", exc_info=debug)
         status = "failed" # Ensure status is marked as failed on any exception
+        lease.recycle = True # Don't hand a driver in an unknown state to the next site
         domain = get_domain(normalize_url(website))
         circuit_breaker.record_failure(domain) # Record failure if any exception occurs
 
-        # Attempt to update DB with failure status
+        # Queue the failure status update
         try:
             update_data = {
                 "emailstatus": status,
@@ -2233,34 +4941,238 @@ def process_business(record: Dict[str, Any], collection, headless: bool, debug:
             # Optionally clear email/social if it failed
             # update_data["email"] = []
             # update_data["social_profiles"] = {}
-            collection.update_one({"_id": business_id}, {"$set": update_data})
+            writer.submit(result_update(business_ids, update_data))
             log.info(f"Marked {business_name} as failed in DB.")
-        except PyMongoError as e_fail_update:
-            log.error(f"Failed to update MongoDB with failure status for {business_name}: {e_fail_update}")
         except Exception as e_db_final:
-             log.error(f"Unexpected error updating DB failure status for {business_name}: {e_db_final}")
+             log.error(f"Unexpected error queueing DB failure status for {business_name}: {e_db_final}")
 
 
         return business_id, status, 0, 0 # Return failure status
 
     finally:
-        # Ensure driver is always closed if it was created
-        if driver:
-            log.debug(f"Closing driver for {business_name}")
+        # Always hand the driver back; the pool resets, recycles or quits it
+        if lease.driver:
+            log.debug(f"Returning driver for {business_name} to pool")
+            try:
+                lease.release()
+            except Exception as e_release:
+                  log.error(f"Unexpected error returning driver to pool: {e_release}", exc_info=debug)
+
+
+def replay_records(collection, replay: PageReplay, batch_size: int = MONGO_BATCH_SIZE, debug: bool = False) -> Tuple[int, int]:
+    """Re-run harvest_emails for finished records against a page archive. Static fetches and
+    renders are served from the archive (no network, no browser, no site budget) and changed
+    emails, social profiles, status and candidates are written back in batches. Records whose
+    homepage was never archived are left alone. Returns (records replayed, records updated)."""
+    query = {"website": {"$exists": True, "$nin": ["", None, "N/A"]},
+             "emailstatus": {"$in": ["found", "partial", "checked", "failed"]}}
+    projection = {"businessname": 1, "website": 1, "email": 1, "emailstatus": 1, "social_profiles": 1, "email_candidates": 1}
+    backend = ReplayBackend(replay)
+    writer = MongoBatchWriter(collection, batch_size)
+    replayed = updated = 0
+    started = time.time()
+    try:
+        log.info("Replaying finished records against the page archive...")
+        for doc in collection.find(query, projection, batch_size=max(batch_size, 1000)):
+            if shutdown_flag:
+                log.warning("Shutdown requested, stopping replay.")
+                break
+            site = normalize_url(doc["website"])
+            if not site or not replay.has_page(site):
+                continue
+            lease = DriverLease(backend)
+            sightings: List[Tuple[str, Dict[str, Any]]] = []
             try:
-                driver.quit()
-            except WebDriverException as e_quit:
-                 log.warning(f"Error quitting driver for {business_name}: {e_quit}")
-            except Exception as e_quit_unexp:
-                  log.error(f"Unexpected error quitting driver: {e_quit_unexp}", exc_info=debug)
+                emails, social_profiles, status = harvest_emails(site, doc.get("businessname", "Unknown Business"), lease, debug,
+                                                                 budget=0, candidates=sightings)
+            except Exception as e:
+                log.error(f"Error replaying {site}: {e}", exc_info=debug)
+                continue
+            finally:
+                lease.release()
+            replayed += 1
+            emails = emails[:10]
+            candidates = email_candidates_doc(sightings)
+            if (emails != doc.get("email") or status != doc["emailstatus"] or social_profiles != doc.get("social_profiles")
+                    or candidates != doc.get("email_candidates")):
+                updated += 1
+                writer.submit(UpdateOne({"_id": doc["_id"]},
+                                        {"$set": {"email": emails, "social_profiles": social_profiles, "emailstatus": status,
+                                                  "email_candidates": candidates, "emailreplayed_at": datetime.utcnow()}}))
+                if debug: log.debug(f"Replayed {doc['_id']} ({site}): {doc.get('email')} -> {emails} [{status}]")
+            if replayed % REPLAY_LOG_INTERVAL == 0:
+                log.info(f"Replay progress: {replayed} replayed, {updated} changed ({replayed / max(time.time() - started, 1e-6):.0f} records/s)")
+    except PyMongoError as e:
+        log.error(f"MongoDB error while replaying: {e}")
+    finally:
+        writer.close()
+    log.info(f"Replayed {replayed} records in {time.time() - started:.1f}s, {updated} changed")
+    return replayed, updated
+
+
+# ───────────────── Coordinator / Worker Mode ───────────────────
+def parse_shard(spec: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parse --shard "i/n" into (i, n) with 0 <= i < n."""
+    if not spec:
+        return None
+    try:
+        index, count = (int(part) for part in spec.split("/", 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{spec}', expected i/n (e.g. 0/4)")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{spec}', need 0 <= i < n")
+    return index, count
+
+
+def shard_bucket(business_id: Any) -> int:
+    """Stable shard bucket (0 .. SHARD_BUCKETS-1) of a record _id, the same on every host."""
+    return zlib.crc32(str(business_id).encode("utf-8")) % SHARD_BUCKETS
+
+
+def shard_filter(index: int, count: int) -> Dict[str, Any]:
+    """Query clause selecting shard index of count by the stored shard_key field
+    (an equality on indexed values, unlike computing a hash of _id in the query)."""
+    return {"shard_key": {"$in": [bucket for bucket in range(SHARD_BUCKETS) if bucket % count == index]}}
+
+
+def assign_shard_keys(collection, batch_size: int = MONGO_BATCH_SIZE) -> int:
+    """Store shard_key on pending records that don't have one yet (new or reset records).
+    Idempotent, so concurrent workers doing it at once only repeat each other's writes."""
+    assigned = 0
+    ops: List[UpdateOne] = []
+    try:
+        for doc in collection.find({**PENDING_QUERY, "shard_key": None}, {"_id": 1}):
+            ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"shard_key": shard_bucket(doc["_id"])}}))
+            if len(ops) >= batch_size:
+                assigned += collection.bulk_write(ops, ordered=False).modified_count
+                ops = []
+        if ops:
+            assigned += collection.bulk_write(ops, ordered=False).modified_count
+    except PyMongoError as e:
+        log.error(f"MongoDB error assigning shard keys: {e}")
+    if assigned:
+        log.info(f"Assigned shard keys to {assigned} pending records")
+    return assigned
+
+
+class ProgressReporter:
+    """Publishes this process's run counters to the shared PROGRESS_COLLECTION, one document
+    per worker, so a coordinator (or anyone with a mongo shell) can aggregate progress across processes and hosts."""
+
+    def __init__(self, collection, worker_id: str, run_id: str, shard: Optional[Tuple[int, int]], interval: float = PROGRESS_INTERVAL):
+        self.progress = collection.database[PROGRESS_COLLECTION]
+        self.worker_id = worker_id
+        self.run_id = run_id
+        self.shard = f"{shard[0]}/{shard[1]}" if shard else None
+        self.interval = interval
+        self.started_at = datetime.utcnow()
+        self.last_report = 0.0
+
+    def due(self) -> bool:
+        return time.time() - self.last_report >= self.interval
+
+    def report(self, counters: Dict[str, int], state: str = "running"):
+        """Upsert this worker's progress document."""
+        self.last_report = time.time()
+        elapsed = (datetime.utcnow() - self.started_at).total_seconds()
+        doc = {"run_id": self.run_id, "host": socket.gethostname(), "pid": os.getpid(), "shard": self.shard,
+               "state": state, "started_at": self.started_at, "updated_at": datetime.utcnow(),
+               "rate": counters.get("processed", 0) / elapsed if elapsed > 0 else 0.0, **counters}
+        try:
+            self.progress.update_one({"_id": self.worker_id}, {"$set": doc}, upsert=True)
+        except PyMongoError as e:
+            log.debug(f"Could not report progress: {e}")
+
+
+def worker_argv(argv: List[str]) -> List[str]:
+    """Command line for spawned workers: the coordinator's own arguments minus the ones only the
+    coordinator acts on or sets per worker (role, worker count, run id, worker id, site limit, CSV export)."""
+    drop_with_value = {"--role", "--workers", "--run-id", "--worker-id", "--max-sites", "--export-csv"}
+    args_out: List[str] = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+            continue
+        name = arg.split("=", 1)[0]
+        if name in drop_with_value:
+            skip = "=" not in arg
+            continue
+        args_out.append(arg)
+    return args_out
+
+
+def run_coordinator(args: argparse.Namespace, collection) -> int:
+    """Spawn args.workers worker processes on this host (each with its own driver pool
+    and --threads workers, claiming from the same collection) and report their
+    aggregate progress from PROGRESS_COLLECTION until they all exit.
+    --max-sites is split between the workers, so the run as a whole stays within it."""
+    run_id = args.run_id or f"{datetime.utcnow():%Y%m%d-%H%M%S}-{os.getpid()}"
+    progress = collection.database[PROGRESS_COLLECTION]
+    base_cmd = [sys.executable, os.path.abspath(__file__), *worker_argv(sys.argv[1:]), "--role", "worker", "--run-id", run_id]
+    workers = min(args.workers, args.max_sites) if args.max_sites > 0 else args.workers # A 0 share would mean "no limit"
+    log.info(f"Coordinator starting {workers} workers x {args.threads} threads (run {run_id})")
+    if args.shard is not None or args.shard_workers:
+        assign_shard_keys(collection) # Once here rather than racing in every worker
+
+    procs: List[Any] = []
+    for i in range(workers):
+        # Stable per-slot ids, so a restarted coordinator's workers resume their predecessors' checkpoints
+        cmd = base_cmd + ["--worker-id", f"{socket.gethostname()}-w{i}"]
+        if args.shard is None and args.shard_workers:
+            cmd += ["--shard", f"{i}/{workers}"]
+        if args.max_sites > 0:
+            cmd += ["--max-sites", str(args.max_sites // workers + (1 if i < args.max_sites % workers else 0))]
+        log.debug(f"Starting worker {i}: {' '.join(cmd)}")
+        procs.append(subprocess.Popen(cmd))
+
+    counter_keys = ("processed", "found", "partial", "checked", "failed", "skipped", "emails", "socials")
+    signalled = False
+    start_time = time.time()
+    while any(p.poll() is None for p in procs):
+        if shutdown_flag and not signalled:
+            log.warning("Forwarding shutdown to workers...")
+            for p in procs:
+                if p.poll() is None:
+                    p.send_signal(signal.SIGTERM)
+            signalled = True
+        if signalled:
+            time.sleep(1.0)
+        elif shutdown_event.wait(PROGRESS_INTERVAL):
+            continue # Forward the signal to the workers straight away
+        try:
+            docs = list(progress.find({"run_id": run_id}))
+        except PyMongoError as e:
+            log.warning(f"Could not read worker progress: {e}")
+            continue
+        totals = {key: sum(doc.get(key, 0) for doc in docs) for key in counter_keys}
+        alive = sum(1 for p in procs if p.poll() is None)
+        elapsed_time = time.time() - start_time
+        rate = totals["processed"] / elapsed_time if elapsed_time > 0 else 0
+        log.info(f"Run progress: {alive}/{len(procs)} workers running | Processed: {totals['processed']} | "
+                 f"Found: {totals['found']} | Partial: {totals['partial']} | Checked: {totals['checked']} | Failed: {totals['failed']} | "
+                 f"Skipped: {totals['skipped']} | Rate: {rate:.2f}/s")
+
+    exit_codes = [p.wait() for p in procs]
+    log.info(f"All workers finished (exit codes: {exit_codes})")
+    return max(exit_codes, default=0)
 
 
 # ────────────────── Main Logic ───────────────────────
 def main():
     """Main execution function."""
-    global shutdown_flag
+    global shutdown_flag, response_cache, consent_memo, resource_blocker, mongo_writer, checkpoint_journal, concurrency
+    global page_archive, page_replay, host_politeness
     args = parse_args()
-    setup_logging(args.debug)
+    if args.role == "worker":
+        # Separate log file per worker process so rotation does not collide: named after the worker id
+        # (the coordinator sets {host}-w{i} per slot), not the shard, which repeats across hosts
+        worker_tag = re.sub(r'[^A-Za-z0-9_.-]', '_', args.worker_id) if args.worker_id else f"w{os.getpid()}"
+        setup_logging(args.debug, f"email_scraper_{worker_tag}.log", worker_tag)
+    else:
+        setup_logging(args.debug)
+    apply_tunables(args)
+    resource_blocker = ResourceBlocker(args.block_profile)
 
     log.info("--- Email & Social Scraper Initializing ---")
     log.info(f"Args: {vars(args)}")
@@ -2282,18 +5194,48 @@ def main():
         client.close()
         sys.exit(0)
 
+    if args.rescore:
+        rescore_emails(collection, args.mongo_batch_size, args.debug)
+        log.info("Rescore complete. Exiting.")
+        client.close()
+        sys.exit(0)
+
     if args.list_records:
         list_business_records(collection, args.debug)
         log.info("Record listing complete. Exiting.")
         client.close()
         sys.exit(0)
 
+    # Persistent response cache makes re-runs and --test-url sessions on known sites cheap
+    if not args.no_cache:
+        try:
+            response_cache = ResponseCache(args.cache_dir, args.cache_ttl * 3600, args.cache_max_mb * 1024 * 1024)
+        except (sqlite3.Error, OSError) as e:
+            log.warning(f"Could not open response cache in {args.cache_dir}, continuing without it: {e}")
+        consent_memo = ConsentMemo(os.path.join(args.cache_dir, CONSENT_MEMO_FILE), CONSENT_MEMO_TTL_DAYS * 86400,
+                                   CONSENT_MEMO_NONE_TTL_HOURS * 3600)
+
+    # Page archive: record what this run sees, or re-extract from what an earlier run saw
+    if args.replay:
+        page_replay = PageReplay(args.replay)
+        host_politeness = HostPoliteness(0, 0) # Nothing goes over the network, so nothing to space out
+    elif args.archive:
+        try:
+            page_archive = PageArchive(args.archive)
+        except OSError as e:
+            log.warning(f"Could not open page archive in {args.archive}, continuing without it: {e}")
+
     # Handle single URL test
     if args.test_url:
         log.info(f"--- Testing single URL: {args.test_url} ---")
         test_driver = None
         try:
-            test_driver = make_driver(args.headless, args.debug)
+            if page_replay:
+                test_driver = DriverLease(ReplayBackend(page_replay)) # Rendered snapshots come from the archive
+            elif args.browser_backend == "cdp":
+                test_driver = DriverLease(CdpBackend(1, args.headless, args.debug, args.chrome_binary)) # Page opened on first render
+            else:
+                test_driver = make_driver(args.headless, args.debug)
             if test_driver is None:
                  log.error("Failed to create driver for single URL test.")
             else:
@@ -2314,12 +5256,28 @@ def main():
         except Exception as e_test:
             log.error(f"Error during single URL test: {e_test}", exc_info=args.debug)
         finally:
-            if test_driver:
+            if isinstance(test_driver, DriverLease):
+                test_driver.release()
+                test_driver.pool.close_all()
+            elif test_driver:
                 try: test_driver.quit()
                 except: pass
+            if response_cache: response_cache.close()
+            if consent_memo: consent_memo.save()
+            if page_archive: page_archive.close()
+            if page_replay: page_replay.close()
             client.close() # Close DB connection
             sys.exit(0)
 
+    if page_replay:
+        replay_records(collection, page_replay, args.mongo_batch_size, args.debug)
+        page_replay.close()
+        if response_cache: response_cache.close()
+        if consent_memo: consent_memo.save()
+        log.info("Replay complete. Exiting.")
+        client.close()
+        sys.exit(0)
+
     # --- Main Processing Loop ---
     start_time = time.time()
     log.info("--- Starting Main Processing ---")
@@ -2337,97 +5295,169 @@ def main():
         client.close()
         sys.exit(0)
 
-    # Query for businesses to process
-    query = {
-        "website": {"$exists": True, "$nin": ["", None, "N/A"]},
-        "emailstatus": "pending"
-    }
-    limit = args.max_sites if args.max_sites > 0 else 0
-
-    log.info(f"Fetching businesses with pending status (Limit: {'All' if limit == 0 else limit})...")
-    try:
-        records_to_process = list(collection.find(query, {"_id": 1, "website": 1, "businessname": 1}).limit(limit))
-        total_to_process = len(records_to_process)
-        if total_to_process == 0:
-            # This case should be caught by db_stats check, but double-check
-            log.info("Redundant check: No records match the processing query.")
-            client.close()
-            sys.exit(0)
-        log.info(f"Found {total_to_process} businesses to process.")
-    except PyMongoError as e_fetch:
-        log.critical(f"Failed to fetch records from MongoDB: {e_fetch}. Exiting.")
+    # Coordinator: spawn worker processes and only aggregate their progress
+    if args.role == "coordinator":
+        if response_cache: response_cache.close() # Workers open their own connections to it
+        if page_archive: page_archive.close() # Workers archive to their own segments
+        exit_code = run_coordinator(args, collection)
+        log.info(f"Coordinated run finished in {time.time() - start_time:.2f} seconds")
+        if args.export_csv:
+            export_to_csv(collection, args.export_csv, args.debug)
         client.close()
-        sys.exit(1)
+        sys.exit(exit_code)
+
+    limit = args.max_sites if args.max_sites > 0 else 0
+    pending_total = db_stats["businesses_pending_email"]
+    total_to_process = min(limit, pending_total) if limit else pending_total
+    log.info(f"Streaming businesses with pending status (Limit: {'All' if limit == 0 else limit}, "
+             f"about {total_to_process} to process)...")
 
 
     # Initialize counters
     processed_count = 0
     success_count = 0
+    partial_count = 0
     checked_count = 0
     failed_count = 0
     skipped_count = 0
     total_emails = 0
     total_socials = 0
 
-    futures: List[Future] = []
-
+    in_flight: Dict[Future, List[Any]] = {} # Running task -> _ids its result is written to
+    # Threads and drivers are sized for the ceiling; the adaptive controller decides how many are busy
+    max_threads = args.threads if args.no_adapt else max(args.threads, args.max_threads)
+    if not args.no_adapt:
+        concurrency = AdaptiveConcurrency(args.threads, args.min_threads, max_threads)
+    if args.browser_backend == "cdp":
+        try:
+            driver_pool = CdpBackend(max_threads, args.headless, args.debug, args.chrome_binary)
+        except RuntimeError as e:
+            log.critical(f"Cannot use the cdp browser backend: {e}")
+            client.close()
+            sys.exit(1)
+    elif args.tabs_per_browser > 1:
+        driver_pool = TabPool(max_threads, args.tabs_per_browser, args.headless, args.debug, args.driver_max_uses)
+    else:
+        driver_pool = DriverPool(max_threads, args.headless, args.debug, args.driver_max_uses)
+    mongo_writer = MongoBatchWriter(collection, args.mongo_batch_size, args.mongo_flush_interval)
+    # Claim records in leased batches; a static sweep prefetches one claimed batch at a time
+    claim_batch = max(1, args.sweep_batch) if args.static_sweep else max(1, args.claim_batch)
+    worker_id = args.worker_id or default_worker_id()
+    if args.shard and args.role != "worker":
+        assign_shard_keys(collection) # The coordinator already did it for its workers
+    claim_query = {**PENDING_QUERY, **shard_filter(*args.shard)} if args.shard else PENDING_QUERY
+    claimer = WorkClaimer(collection, worker_id, claim_batch, args.lease_seconds, limit, claim_query)
+    if not args.no_checkpoint:
+        # Resume records an earlier (crashed or killed) run of this worker left half done
+        try:
+            checkpoint_journal = CheckpointJournal(args.checkpoint_dir, worker_id)
+            claimer.release_owners(checkpoint_journal.adopt(collection))
+        except OSError as e:
+            log.warning(f"Could not open checkpoint journal in {args.checkpoint_dir}, continuing without it: {e}")
+            checkpoint_journal = None
+    # Workers publish their counters for the coordinator's aggregate progress
+    reporter = ProgressReporter(collection, worker_id, args.run_id or worker_id, args.shard) if args.role == "worker" else None
+
+    def run_counters() -> Dict[str, int]:
+        return {"processed": processed_count, "found": success_count, "partial": partial_count, "checked": checked_count, "failed": failed_count,
+                "skipped": skipped_count, "emails": total_emails, "socials": total_socials}
+
+    def task_limit() -> int:
+        """How many tasks may be queued/running right now."""
+        if concurrency is None:
+            return max(args.threads * 2, claim_batch if args.static_sweep else 0)
+        concurrency.observe_busy(len(in_flight))
+        limit = concurrency.maybe_adjust()
+        driver_pool.trim(limit) # Don't keep warm Chrome instances we no longer run
+        return limit
+
+    def collect(done: Set[Future]):
+        """Fold finished tasks into the run counters."""
+        nonlocal processed_count, success_count, partial_count, checked_count, failed_count, skipped_count, total_emails, total_socials
+        for future in done:
+            # A grouped task counts once for every record sharing its website
+            business_ids = in_flight.pop(future)
+            claimer.done(business_ids)
+            group_size = len(business_ids)
+            processed_count += group_size
+            try:
+                business_id, status, num_emails, num_socials = future.result()
+                log.debug(f"Completed task for ID {business_id} with status '{status}'")
+                if concurrency:
+                    concurrency.observe_task(status == "failed")
+
+                if status == "found":
+                    success_count += group_size
+                    total_emails += num_emails * group_size
+                    total_socials += num_socials * group_size
+                elif status == "partial":
+                    partial_count += group_size # Cut off by --site-budget, may still have emails
+                    total_emails += num_emails * group_size
+                    total_socials += num_socials * group_size
+                elif status == "checked":
+                    checked_count += group_size
+                    total_socials += num_socials * group_size # Checked might still find social links
+                elif status == "failed":
+                    failed_count += group_size
+                elif status == "skipped":
+                     skipped_count += group_size
+
+            except Exception as e_future:
+                # Log exceptions from the worker function itself
+                log.error(f"Task resulted in an exception: {e_future}", exc_info=args.debug)
+                failed_count += group_size # Count exceptions as failures
+                if concurrency:
+                    concurrency.observe_task(True)
+
+            # Log progress periodically
+            if processed_count // 10 != (processed_count - group_size) // 10 or processed_count == total_to_process:
+                elapsed_time = time.time() - start_time
+                rate = processed_count / elapsed_time if elapsed_time > 0 else 0
+                log.info(f"Progress: {processed_count}/{total_to_process} | "
+                         f"Found: {success_count} | Partial: {partial_count} | Checked: {checked_count} | "
+                         f"Failed: {failed_count} | Skipped: {skipped_count} | "
+                         f"Rate: {rate:.2f}/s")
+            if reporter and reporter.due():
+                reporter.report(run_counters())
+
+    run_completed = False # Every claimed record was processed (no shutdown, no crash of the loop)
     try:
         # Using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=args.threads, thread_name_prefix='ScraperThread') as executor:
-            log.info(f"Starting thread pool with {args.threads} workers.")
-
-            # Submit initial batch of tasks
-            for record in records_to_process:
+        with ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='ScraperThread') as executor:
+            log.info(f"Starting thread pool with {max_threads} workers" +
+                     (f" (adaptive, starting at {concurrency.limit})." if concurrency else "."))
+            claimer.start()
+
+            for batch in claimer.batches():
+                if args.static_sweep and not shutdown_flag:
+                    swept = static_sweep([r.get("website") for r in batch], args.debug)
+                    for record in batch:
+                        record["_prefetched"] = swept.get(record.get("website"))
+
+                for record in batch:
+                    # Keep the number of queued/running tasks bounded
+                    while len(in_flight) >= task_limit() and not shutdown_flag:
+                        done, _ = wait(list(in_flight), timeout=1.0, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    if shutdown_flag:
+                        break
+                    business_ids = list(record["_group_ids"])
+                    future = executor.submit(process_business, record, mongo_writer, driver_pool, args.debug)
+                    in_flight[future] = business_ids
                 if shutdown_flag:
                     log.warning("Shutdown requested before submitting all tasks.")
                     break
-                future = executor.submit(process_business, record, collection, args.headless, args.debug)
-                futures.append(future)
-
-            log.info(f"Submitted {len(futures)} tasks to the executor.")
 
-            # Process completed tasks
-            for future in as_completed(futures):
-                if shutdown_flag:
-                    # Attempt to cancel remaining futures (may not be effective if already running)
-                    log.warning("Shutdown flag set, processing remaining completed tasks and stopping.")
-                    # for f in futures:
-                    #      if not f.done(): f.cancel() # Doesn't reliably stop running threads
+            log.info(f"Claimed {claimer.claimed} records; waiting for {len(in_flight)} running tasks.")
 
-                processed_count += 1
-                try:
-                    business_id, status, num_emails, num_socials = future.result()
-                    log.debug(f"Completed task for ID {business_id} with status '{status}'")
-
-                    if status == "found":
-                        success_count += 1
-                        total_emails += num_emails
-                        total_socials += num_socials
-                    elif status == "checked":
-                        checked_count += 1
-                        total_socials += num_socials # Checked might still find social links
-                    elif status == "failed":
-                        failed_count += 1
-                    elif status == "skipped":
-                         skipped_count += 1
-
-                except Exception as e_future:
-                    # Log exceptions from the worker function itself
-                    log.error(f"Task resulted in an exception: {e_future}", exc_info=args.debug)
-                    failed_count += 1 # Count exceptions as failures
-
-                # Log progress periodically
-                if processed_count % 10 == 0 or processed_count == total_to_process:
-                    elapsed_time = time.time() - start_time
-                    rate = processed_count / elapsed_time if elapsed_time > 0 else 0
-                    log.info(f"Progress: {processed_count}/{total_to_process} | "
-                             f"Found: {success_count} | Checked: {checked_count} | "
-                             f"Failed: {failed_count} | Skipped: {skipped_count} | "
-                             f"Rate: {rate:.2f}/s")
-
-                # Check shutdown flag again after processing each result
-                if shutdown_flag:
-                     break # Exit the as_completed loop
+            # Process the remaining tasks as they complete
+            while in_flight and not shutdown_flag:
+                done, _ = wait(list(in_flight), timeout=1.0, return_when=FIRST_COMPLETED)
+                collect(done)
+            if shutdown_flag:
+                # Running tasks may not stop; count what has already finished
+                log.warning("Shutdown flag set, processing remaining completed tasks and stopping.")
+                collect({f for f in in_flight if f.done()})
 
 
             log.info("Processing loop finished or interrupted.")
@@ -2436,6 +5466,7 @@ def main():
             log.info(f"Shutting down executor (wait={wait_shutdown})...")
             executor.shutdown(wait=wait_shutdown, cancel_futures=shutdown_flag) # Cancel pending if shutting down early
             log.info("Executor shutdown complete.")
+        run_completed = not shutdown_flag
 
 
     except KeyboardInterrupt:
@@ -2444,12 +5475,26 @@ def main():
     except Exception as e_main:
         log.critical(f"An unexpected error occurred in the main loop: {e_main}", exc_info=True)
     finally:
+        # Quit all pooled Chrome instances so none are left behind
+        driver_pool.close_all()
+        # Flush buffered result updates before the summary/export read them back
+        mongo_writer.close()
+        # Hand back records that were claimed but never finished (e.g. cancelled on shutdown)
+        claimer.close()
+        if checkpoint_journal: checkpoint_journal.close(discard=run_completed and mongo_writer.failed == 0)
+        if response_cache: response_cache.close()
+        if consent_memo: consent_memo.save()
+        if page_archive: page_archive.close()
+        if reporter:
+            reporter.report(run_counters(), "interrupted" if shutdown_flag else "finished")
+
         # Final summary
         end_time = time.time()
         total_time = end_time - start_time
         log.info("--- Processing Summary ---")
         log.info(f"Total businesses processed: {processed_count}/{total_to_process}")
         log.info(f"  - Emails Found: {success_count}")
+        log.info(f"  - Partial (site budget ran out): {partial_count}")
         log.info(f"  - Checked (no email): {checked_count}")
         log.info(f"  - Failed: {failed_count}")
         log.info(f"  - Skipped (bad URL): {skipped_count}")
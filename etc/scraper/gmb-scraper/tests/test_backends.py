@@ -0,0 +1,67 @@
+"""The Selenium and CDP browser backends must give harvest_emails the same result."""
+import shutil
+
+import pytest
+
+for dependency in ("bs4", "requests", "pymongo", "selenium", "aiohttp"):
+    pytest.importorskip(dependency)
+
+import emailsdcraper as scraper # noqa: E402
+
+# Contact details only exist after JavaScript runs, so both backends have to render the page
+PAGE = """<!doctype html>
+<html><head><title>Test Shop</title></head>
+<body>
+<div id="root"></div>
+<script>
+document.getElementById('root').innerHTML =
+    '<header><a href="mailto:sales@shop-test.co.uk?subject=Hi">Email sales</a></header>' +
+    '<p>Bookings: bookings [at] shop-test [dot] co [dot] uk</p>' +
+    '<footer>info@shop-test.co.uk <a href="https://www.facebook.com/shoptest">Facebook</a>' +
+    ' <a href="https://www.instagram.com/shoptest/">Instagram</a></footer>';
+</script>
+</body></html>
+"""
+
+
+def chrome_binary():
+    return next(filter(None, map(shutil.which, scraper.CHROME_BINARIES)), None)
+
+
+def harvest(backend, url):
+    lease = scraper.DriverLease(backend)
+    try:
+        return scraper.harvest_emails(url, "Test Shop", lease, budget=0)
+    finally:
+        lease.release()
+        backend.close_all()
+
+
+@pytest.fixture
+def site(serve_dir, monkeypatch):
+    directory, url = serve_dir
+    (directory / "index.html").write_text(PAGE, encoding="utf-8")
+    monkeypatch.setattr(scraper, "ALWAYS_RENDER", True)
+    monkeypatch.setattr(scraper, "host_politeness", scraper.HostPoliteness(0, 0))
+    monkeypatch.setattr(scraper, "circuit_breaker", scraper.CircuitBreaker())
+    for name in ("response_cache", "consent_memo", "resource_blocker", "page_archive", "page_replay"):
+        monkeypatch.setattr(scraper, name, None)
+    return url
+
+
+@pytest.mark.skipif(chrome_binary() is None, reason="Chrome is not installed")
+def test_selenium_and_cdp_backends_agree(site):
+    probe = scraper.make_driver(headless=True)
+    if probe is None:
+        pytest.skip("Selenium could not start Chrome (chromedriver missing?)")
+    probe.quit()
+
+    selenium_result = harvest(scraper.DriverPool(1, headless=True), site)
+    cdp_result = harvest(scraper.CdpBackend(1, headless=True), site)
+
+    assert selenium_result == cdp_result
+    emails, social, status = selenium_result
+    assert status == "found"
+    assert "sales@shop-test.co.uk" in emails
+    assert "bookings@shop-test.co.uk" in emails
+    assert {"facebook", "instagram"} <= set(social)
@@ -0,0 +1,207 @@
+"""The windowed email scanner and the batched cleaning/scoring must agree with the versions they replaced.
+The legacy_* functions are copies of the replaced versions, kept here as the reference."""
+import html
+import re
+from pathlib import Path
+
+import pytest
+
+for dependency in ("bs4", "requests", "pymongo", "selenium"):
+    pytest.importorskip(dependency)
+
+import emailsdcraper as scraper # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGES = sorted(FIXTURES.glob("*.html"))
+
+
+def legacy_emails_from_text(text):
+    if not text or not isinstance(text, str):
+        return []
+    text = html.unescape(text)
+    text = re.sub(r'\s*\[\s*(at|@)\s*\]\s*', '@', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s*\[\s*(dot|\.)\s*\]\s*', '.', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s*\(\s*(at|@)\s*\)\s*', '@', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s*\(\s*(dot|\.)\s*\)\s*', '.', text, flags=re.IGNORECASE)
+    text = text.replace(' at ', '@').replace(' dot ', '.')
+    return scraper.EMAIL_RE.findall(text or "")
+
+
+def legacy_clean_emails(raw):
+    seen = set()
+    cleaned = []
+    disposable_domains = {"mailinator.com", "temp-mail.org", "10minutemail.com"}
+    image_extensions = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"}
+    for e in raw:
+        if not e or not isinstance(e, str):
+            continue
+        e = e.strip().lower()
+        if "@" not in e or "." not in e.split('@')[-1]:
+            continue
+        if any(p in e for p in (
+            "example.com", "sentry.wixpress.com", "your@email",
+            "email@example", "info@your", "name@domain",
+            "user@", "username@", "email@domain", "@localhost",
+            "example.org", "example.net", "domain.com",
+            "contact@example.com", "privacy@example.com",
+            "email@here.com"
+        )):
+            continue
+        if any(e.endswith(ext) for ext in image_extensions):
+            continue
+        try:
+            if e.split('@')[1] in disposable_domains:
+                continue
+        except IndexError:
+            continue
+        if not scraper.EMAIL_RE.fullmatch(e):
+            continue
+        if e in seen:
+            continue
+        seen.add(e)
+        cleaned.append(e)
+    return cleaned
+
+
+def legacy_score_email(email, domain, context):
+    score = 0
+    if not email or '@' not in email:
+        return 0
+    score += 10
+    try:
+        email_domain = email.split('@')[1]
+        if domain and email_domain == domain:
+            score += 50
+        elif domain and email_domain.endswith("." + domain):
+            score += 30
+        elif domain and domain in email_domain:
+            score += 15
+    except IndexError:
+        return 0
+    prefix = email.split('@')[0]
+    if prefix in ["info", "contact", "hello", "enquiries", "support", "sales", "bookings", "reservations"]:
+        score += 25
+    elif prefix in ["admin", "office", "mail", "help", "general"]:
+        score += 15
+    elif prefix in ["press", "media", "jobs", "careers", "hr"]:
+        score += 10
+    elif len(prefix) <= 3 and not prefix.isdigit():
+        score -= 5
+    elif re.match(r'^\d+$', prefix):
+        score -= 10
+    elif re.search(r'[a-f0-9]{8,}', prefix):
+        score -= 15
+    if context.get("found_on_contact_page", False):
+        score += 30
+    if context.get("found_in_mailto", False):
+        score += 20
+    if context.get("found_in_footer", False):
+        score += 15
+    if context.get("found_in_header", False):
+        score += 10
+    if context.get("found_near_contact_text", False):
+        score += 15
+    if context.get("found_in_form", False):
+        score += 20
+    if context.get("found_in_text", False) or context.get("found_in_body", False) or context.get("found_in_element", False):
+        score += 5
+    if context.get("found_obfuscated", False):
+        score += 10
+    if context.get("found_in_accessibility", False):
+        score += 5
+    if score < 50 and (context.get("found_in_source", False) or context.get("found_in_script", False) or context.get("found_in_meta", False)):
+        only_in_weak_source = True
+        for key, val in context.items():
+            if val and key not in ["found_in_source", "found_in_script", "found_in_meta", "found_on_contact_page"]:
+                only_in_weak_source = False
+                break
+        if only_in_weak_source:
+            score -= 10
+    return max(0, min(100, score))
+
+
+def legacy_score_emails(emails_with_context, domain):
+    email_contexts = scraper.merge_email_contexts(emails_with_context)
+    return [(email, legacy_score_email(email, domain, email_contexts[email])) for email in legacy_clean_emails(list(email_contexts))]
+
+
+CONTEXTS = [
+    {"found_in_text": True},
+    {"found_in_mailto": True, "found_in_footer": True},
+    {"found_on_contact_page": True, "found_near_contact_text": True},
+    {"found_in_source": True},
+    {"found_in_script": True, "found_on_contact_page": True},
+    {"found_obfuscated": True, "found_in_accessibility": True},
+    {"found_in_meta": True, "found_in_header": True, "found_in_form": True},
+]
+
+
+@pytest.fixture(params=PAGES, ids=[page.name for page in PAGES])
+def page(request):
+    return request.param.read_text(encoding="utf-8")
+
+
+def test_emails_from_text_matches_legacy_on_fixture_pages(page):
+    assert scraper.emails_from_text(page) == legacy_emails_from_text(page)
+
+
+def test_emails_from_text_matches_legacy_on_large_page(page):
+    # Addresses buried in a multi-MB source, as on script-heavy pages
+    filler = "<script>var x = 'lorem ipsum dolor sit amet, 0123456789';</script>\n" * 20000
+    big = filler + page + filler + page
+    assert scraper.emails_from_text(big) == legacy_emails_from_text(big)
+
+
+@pytest.mark.parametrize("text", [
+    "info [at] shop [dot] com",
+    "info(at)shop(dot)co(dot)uk",
+    "info &#64; shop&#46;com",
+    "info&#x40;shop.com",
+    "INFO@SHOP.COM",
+    "  info@shop.com  ",
+    "info@shop.com,sales@shop.com",
+    "info@shop.cominfo@shop.org",
+    "a@b@c.com",
+    "@shop.com info@ @",
+    "x" * 600 + "@shop.com",
+    "at at [at] (at) @@ .. [dot]",
+    "",
+])
+def test_emails_from_text_matches_legacy_on_edge_cases(text):
+    assert scraper.emails_from_text(text) == legacy_emails_from_text(text)
+
+
+def test_fixture_pages_find_deobfuscated_addresses():
+    text = (FIXTURES / "obfuscated.html").read_text(encoding="utf-8")
+    emails = scraper.emails_from_text(text)
+    assert "bookings@riverside-cafe.co.uk" in emails
+    assert "press@riverside-cafe.com" in emails # &#64;
+    assert "jobs@riverside-cafe.co.uk" in emails
+
+
+@pytest.mark.parametrize("domain", ["shop-three.co.uk", "shop-one.com", "riverside-cafe.co.uk", "shop", ""])
+def test_score_emails_matches_legacy_on_fixture_pages(domain):
+    sightings = []
+    for page in PAGES:
+        text = page.read_text(encoding="utf-8")
+        # Raw sightings as they come off a page, plus padded/uppercased variants of each
+        for i, email in enumerate(legacy_emails_from_text(text)):
+            context = CONTEXTS[i % len(CONTEXTS)]
+            sightings += [(email, context), (f"  {email.upper()} ", CONTEXTS[(i + 1) % len(CONTEXTS)])]
+    assert sightings
+    assert scraper.score_emails(sightings, domain) == legacy_score_emails(sightings, domain)
+
+
+@pytest.mark.parametrize("raw", [
+    ["INFO@SHOP.COM", " info@shop.com ", "\tInfo@Shop.com\n"],
+    ["user@shop.com", "me@example.com", "logo@2x.png", "x@mailinator.com", "a@b.c", "noatsign.com", "two@@shop.com"],
+    ["sales@shop.co.uk", "sales@shop.co.uk.", "Sales@Shop.co.uk", None, "", 42],
+])
+def test_clean_emails_matches_legacy(raw):
+    assert scraper.clean_emails(raw) == legacy_clean_emails(raw)
+
+
+@pytest.mark.parametrize("email", ["", "no-at-sign", "info@shop.com", "a@b@shop.com", "@shop.com", "info@"])
+def test_score_email_matches_legacy_on_malformed_addresses(email):
+    for context in CONTEXTS:
+        assert scraper.score_email(email, "shop.com", context) == legacy_score_email(email, "shop.com", context)